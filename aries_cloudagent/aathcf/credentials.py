@@ -6,8 +6,13 @@ from marshmallow import fields, Schema
 
 import json
 import inspect
+import logging
 from aries_cloudagent.wallet.error import WalletError
 from aiohttp import web
+from .proof_cache import ProofVerificationCache, VERIFICATION_CACHE
+from .signing_keys import SigningKeyManager
+
+LOGGER = logging.getLogger(__name__)
 
 
 def print_line_and_file_at_callsite(indirection_number):
@@ -103,47 +108,111 @@ def dictionary_to_base64(dictionary: OrderedDict) -> bytes:
     return dictionary_base64
 
 
-async def verify_proof(wallet, credential: OrderedDict) -> bool:
-    """
-    Args: Credential: full schema with proof field
+def proof_verification_input(credential: OrderedDict) -> tuple:
     """
-    assert_type(credential, OrderedDict)
+    Build the (message, signature, verkey) tuple that a proof signs.
 
+    Returns None if the proof type is not supported.
+    """
     cred_copy = credential.copy()
-    proof = cred_copy["proof"]
-    proof_signature = b64_to_bytes(proof["jws"], urlsafe=True)
+    proof = cred_copy.pop("proof")
     if proof["type"] != "Ed25519Signature2018":
-        print("This proof type is not implemented, ", proof["type"])
-        result = False
+        LOGGER.warning("Proof type is not implemented: %s", proof["type"])
+        return None
 
-    del cred_copy["proof"]
+    proof_signature = b64_to_bytes(proof["jws"], urlsafe=True)
     credential_base64 = dictionary_to_base64(cred_copy)
+    return (credential_base64, proof_signature, proof["verificationMethod"])
+
+
+async def verify_proofs(
+    wallet, credentials: list, cache: ProofVerificationCache = VERIFICATION_CACHE
+) -> list:
+    """
+    Verify the proofs of many credentials with a single wallet call.
+
+    Identical proofs are only checked once, and results are remembered
+    in the cache keyed by (credential digest, verkey).
 
+    Returns: True or False for each credential, in the same order
+    """
+    results = [False] * len(credentials)
+    pending = OrderedDict()
+    for index, credential in enumerate(credentials):
+        assert_type(credential, OrderedDict)
+        signed = proof_verification_input(credential)
+        if signed is None:
+            continue
+        key = ProofVerificationCache.make_key(*signed)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            results[index] = cached
+        elif key in pending:
+            pending[key][1].append(index)
+        else:
+            pending[key] = (signed, [index])
+
+    if pending:
+        try:
+            verified = await wallet.verify_messages(
+                [signed for signed, _ in pending.values()]
+            )
+        except WalletError as err:
+            LOGGER.warning("Batch proof verification failed: %s", err.roll_up)
+            verified = [
+                await _verify_single(wallet, signed) for signed, _ in pending.values()
+            ]
+        for (key, (_, indexes)), result in zip(pending.items(), verified):
+            if result is None:
+                continue
+            if cache is not None:
+                cache.set(key, result)
+            for index in indexes:
+                results[index] = result
+
+    for result in results:
+        assert_type(result, bool)
+    return results
+
+
+async def _verify_single(wallet, signed: tuple) -> bool:
+    """Verify one proof, None if the wallet could not check it."""
     try:
-        result = await wallet.verify_message(
-            credential_base64, proof_signature, proof["verificationMethod"]
-        )
+        return await wallet.verify_message(*signed)
     except WalletError as err:
-        print(err.roll_up)
-        result = False
+        LOGGER.warning("Proof verification failed: %s", err.roll_up)
+        return None
 
-    assert_type(result, bool)
+
+async def verify_proof(
+    wallet, credential: OrderedDict, cache: ProofVerificationCache = VERIFICATION_CACHE
+) -> bool:
+    """
+    Args: Credential: full schema with proof field
+    """
+    (result,) = await verify_proofs(wallet, [credential], cache)
     return result
 
 
-async def create_proof(wallet, credential: OrderedDict, exception) -> OrderedDict:
+async def create_proof(
+    wallet, credential: OrderedDict, exception, signing_keys: SigningKeyManager = None
+) -> OrderedDict:
     """
     Creates a proof dict with signature for given dictionary
+
+    The signing key comes from signing_keys, without it a new key is
+    created for the proof so that unrelated proofs cannot be linked.
     """
     assert_type(credential, OrderedDict)
 
     try:
-        signing_key = await wallet.create_signing_key()
+        if signing_keys is None:
+            verkey = (await wallet.create_signing_key()).verkey
+        else:
+            verkey = await signing_keys.get_verkey()
 
         credential_base64 = dictionary_to_base64(credential)
-        signature_bytes: bytes = await wallet.sign_message(
-            credential_base64, signing_key.verkey
-        )
+        signature_bytes: bytes = await wallet.sign_message(credential_base64, verkey)
     except WalletError as err:
         raise exception(err.roll_up)
 
@@ -152,7 +221,7 @@ async def create_proof(wallet, credential: OrderedDict, exception) -> OrderedDic
     proof["type"] = "Ed25519Signature2018"
     proof["created"] = time_now()
     proof["proofPurpose"] = "assertionMethod"
-    proof["verificationMethod"] = signing_key.verkey
+    proof["verificationMethod"] = verkey
     # proof_dict = {
     #     "type": "",
     #     "created": ,
@@ -0,0 +1,68 @@
+"""Cache of proof verification results."""
+
+import hashlib
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class ProofVerificationCache:
+    """
+    Bounded LRU cache of proof verification results.
+
+    Entries are keyed by a digest of the signed payload and signature
+    together with the verkey, so a result only ever answers for the
+    exact same proof.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize a `ProofVerificationCache` instance."""
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+
+    @staticmethod
+    def make_key(message: bytes, signature: bytes, verkey: str) -> tuple:
+        """Build the cache key for a signed message."""
+        digest = hashlib.sha256(signature + b"." + message).hexdigest()
+        return (digest, verkey)
+
+    def get(self, key: tuple) -> bool:
+        """
+        Fetch a verification result.
+
+        Returns:
+            The cached result or `None`
+
+        """
+        result = self._results.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._results.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def set(self, key: tuple, result: bool):
+        """Store a verification result, evicting the oldest entries."""
+        self._results[key] = result
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    def flush(self):
+        """Remove all results from the cache."""
+        self._results.clear()
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._results),
+        }
+
+
+VERIFICATION_CACHE = ProofVerificationCache()
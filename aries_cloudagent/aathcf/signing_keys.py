@@ -0,0 +1,182 @@
+"""Management of the keys used to sign credential and presentation proofs."""
+
+import asyncio
+import json
+import logging
+import time
+import weakref
+
+from ..storage.base import BaseStorage
+from ..storage.error import StorageNotFoundError
+from ..storage.record import StorageRecord
+from ..wallet.base import BaseWallet
+from ..wallet.error import WalletError
+
+LOGGER = logging.getLogger(__name__)
+
+RECORD_TYPE = "proof_signing_key"
+RECORD_ID = "proof_signing_key"
+
+
+class SigningKeyManager:
+    """
+    Resolve and cache the key used to sign proofs.
+
+    The key is the configured verkey if there is one, else the key this
+    manager created and stored before, else the verkey of the public DID,
+    else a key created once for the wallet. Keys can be rotated on a
+    schedule, retired keys stay in the wallet so proofs made with them can
+    still be verified.
+
+    With a storage, the created key and the retired keys are kept in a
+    storage record so they are reused after a restart.
+    """
+
+    def __init__(
+        self,
+        wallet: BaseWallet,
+        storage: BaseStorage = None,
+        *,
+        verkey: str = None,
+        rotation_interval: int = None,
+    ):
+        """
+        Initialize a `SigningKeyManager` instance.
+
+        Args:
+            wallet: the wallet holding the signing keys
+            storage: the storage keeping the created and retired keys
+            verkey: the verkey of an existing wallet key to sign with
+            rotation_interval: seconds after which a new signing key is created
+
+        """
+        self.wallet = wallet
+        self.storage = storage
+        self.configured_verkey = verkey
+        self.rotation_interval = rotation_interval
+        self.retired = []
+        self._verkey: str = None
+        self._created: float = None
+        self._lock: asyncio.Lock = None
+
+    @property
+    def verkey(self) -> str:
+        """Accessor for the current signing verkey, if resolved."""
+        return self._verkey
+
+    def is_known(self, verkey: str) -> bool:
+        """Check whether a verkey is the current or a retired signing key."""
+        return verkey == self._verkey or verkey in self.retired
+
+    def rotation_due(self) -> bool:
+        """Check whether the current key should be rotated."""
+        return bool(
+            self.rotation_interval
+            and self._created is not None
+            and time.time() - self._created >= self.rotation_interval
+        )
+
+    async def get_verkey(self) -> str:
+        """Get the verkey to sign proofs with, rotating it when due."""
+        if self._verkey and not self.rotation_due():
+            return self._verkey
+        if not self._lock:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self._verkey:
+                await self._resolve()
+            elif self.rotation_due():
+                await self._rotate()
+        return self._verkey
+
+    async def rotate(self) -> str:
+        """Switch to a newly created signing key, retiring the current one."""
+        if not self._lock:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self._verkey:
+                await self._resolve()
+            await self._rotate()
+        return self._verkey
+
+    async def _rotate(self):
+        key_info = await self.wallet.create_signing_key(
+            metadata={"proof_signing_key": True}
+        )
+        if self._verkey:
+            self.retired.append(self._verkey)
+        LOGGER.info("Rotated proof signing key to %s", key_info.verkey)
+        self._verkey = key_info.verkey
+        self._created = time.time()
+        await self._save()
+
+    async def _resolve(self):
+        stored = await self._load()
+        if stored:
+            self.retired = stored.get("retired", [])
+
+        self._created = time.time()
+        if self.configured_verkey:
+            try:
+                await self.wallet.get_signing_key(self.configured_verkey)
+            except WalletError:
+                LOGGER.warning(
+                    "Configured signing key %s is not in the wallet",
+                    self.configured_verkey,
+                )
+            else:
+                self._verkey = self.configured_verkey
+                return
+
+        if stored and await self._is_signing_key(stored["verkey"]):
+            self._verkey = stored["verkey"]
+            self._created = stored["created"]
+            return
+
+        public_did = await self.wallet.get_public_did()
+        if public_did and public_did.verkey:
+            self._verkey = public_did.verkey
+            return
+
+        await self._rotate()
+
+    async def _is_signing_key(self, verkey: str) -> bool:
+        try:
+            key_info = await self.wallet.get_signing_key(verkey)
+        except WalletError:
+            LOGGER.warning("Stored signing key %s is not in the wallet", verkey)
+            return False
+        return bool(key_info.metadata.get("proof_signing_key"))
+
+    async def _load(self) -> dict:
+        if not self.storage:
+            return None
+        try:
+            record = await self.storage.get_record(RECORD_TYPE, RECORD_ID)
+        except StorageNotFoundError:
+            return None
+        return json.loads(record.value)
+
+    async def _save(self):
+        if not self.storage:
+            return
+        value = json.dumps(
+            {"verkey": self._verkey, "created": self._created, "retired": self.retired}
+        )
+        try:
+            record = await self.storage.get_record(RECORD_TYPE, RECORD_ID)
+        except StorageNotFoundError:
+            await self.storage.add_record(StorageRecord(RECORD_TYPE, value, id=RECORD_ID))
+        else:
+            await self.storage.update_record_value(record, value)
+
+
+_WALLET_KEY_MANAGERS = weakref.WeakKeyDictionary()
+
+
+def get_signing_key_manager(wallet: BaseWallet) -> SigningKeyManager:
+    """Get the default signing key manager for a wallet."""
+    manager = _WALLET_KEY_MANAGERS.get(wallet)
+    if not manager:
+        manager = _WALLET_KEY_MANAGERS[wallet] = SigningKeyManager(wallet)
+    return manager
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ...wallet.basic import BasicWallet
+from ...wallet.error import WalletError
+from ..credentials import create_proof, verify_proof, verify_proofs
+from ..proof_cache import ProofVerificationCache
+
+
+class TestProofVerificationCache(AsyncTestCase):
+    async def setUp(self):
+        self.wallet = BasicWallet()
+        self.credentials = []
+        for n in range(3):
+            credential = OrderedDict([("n", n)])
+            credential["proof"] = await create_proof(self.wallet, credential, Exception)
+            self.credentials.append(credential)
+
+    def test_cache_bounded(self):
+        cache = ProofVerificationCache(max_entries=2)
+        keys = [ProofVerificationCache.make_key(b"msg", bytes([n]), "vk") for n in range(3)]
+        assert len(set(keys)) == 3
+        for key in keys:
+            cache.set(key, True)
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[2]) is True
+        assert cache.stats == {"hits": 1, "misses": 1, "entries": 2}
+        cache.flush()
+        assert cache.stats["entries"] == 0
+
+    async def test_verify_proofs(self):
+        cache = ProofVerificationCache()
+        tampered = self.credentials[1].copy()
+        tampered["n"] = 100
+        unsupported = self.credentials[2].copy()
+        unsupported["proof"] = OrderedDict(unsupported["proof"], type="Other")
+
+        batch = self.credentials + [self.credentials[0], tampered, unsupported]
+        with async_mock.patch.object(
+            self.wallet, "verify_messages", wraps=self.wallet.verify_messages
+        ) as mock_verify:
+            results = await verify_proofs(self.wallet, batch, cache)
+            assert results == [True, True, True, True, False, False]
+            # one wallet call, identical proofs checked once
+            mock_verify.assert_called_once()
+            assert len(mock_verify.call_args[0][0]) == 4
+
+            assert await verify_proofs(self.wallet, batch, cache) == results
+            mock_verify.assert_called_once()
+            assert cache.stats["hits"] == 5
+
+            assert await verify_proof(self.wallet, self.credentials[0], cache)
+            assert await verify_proof(self.wallet, tampered, cache) is False
+            mock_verify.assert_called_once()
+
+            assert await verify_proof(self.wallet, self.credentials[0], None)
+            assert mock_verify.call_count == 2
+
+    async def test_verify_proofs_wallet_error(self):
+        with async_mock.patch.object(
+            self.wallet, "verify_messages", async_mock.CoroutineMock()
+        ) as mock_verify:
+            mock_verify.side_effect = WalletError("failure")
+            cache = ProofVerificationCache()
+
+            # each proof is checked on its own after the batch fails
+            assert await verify_proofs(self.wallet, self.credentials, cache) == [
+                True
+            ] * 3
+            assert cache.stats["entries"] == 3
+
+            cache.flush()
+            with async_mock.patch.object(
+                self.wallet, "verify_message", async_mock.CoroutineMock()
+            ) as mock_verify_one:
+                mock_verify_one.side_effect = [True, WalletError("failure"), False]
+                assert await verify_proofs(
+                    self.wallet, self.credentials, cache
+                ) == [True, False, False]
+            # proofs the wallet could not check are not remembered
+            assert cache.stats["entries"] == 2
+
@@ -0,0 +1,103 @@
+from collections import OrderedDict
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ...storage.basic import BasicStorage
+from ...wallet.basic import BasicWallet
+from .. import signing_keys as test_module
+from ..credentials import create_proof, verify_proof
+from ..signing_keys import SigningKeyManager, get_signing_key_manager
+
+
+class TestSigningKeyManager(AsyncTestCase):
+    async def setUp(self):
+        self.wallet = BasicWallet()
+
+    async def test_public_did_key(self):
+        public_did = await self.wallet.create_public_did()
+        manager = SigningKeyManager(self.wallet)
+        assert await manager.get_verkey() == public_did.verkey
+        assert manager.is_known(public_did.verkey)
+
+    async def test_configured_key(self):
+        await self.wallet.create_public_did()
+        key_info = await self.wallet.create_signing_key()
+        manager = SigningKeyManager(self.wallet, verkey=key_info.verkey)
+        assert await manager.get_verkey() == key_info.verkey
+
+        manager = SigningKeyManager(self.wallet, verkey="not-in-wallet")
+        assert await manager.get_verkey() == (await self.wallet.get_public_did()).verkey
+
+    async def test_created_key_reused(self):
+        manager = get_signing_key_manager(self.wallet)
+        assert get_signing_key_manager(self.wallet) is manager
+
+        with async_mock.patch.object(
+            self.wallet, "create_signing_key", wraps=self.wallet.create_signing_key
+        ) as mock_create:
+            proofs = []
+            for n in range(3):
+                credential = OrderedDict([("n", n)])
+                credential["proof"] = await create_proof(
+                    self.wallet, credential, Exception, manager
+                )
+                proofs.append(credential)
+            assert mock_create.call_count == 1
+
+        assert len({cred["proof"]["verificationMethod"] for cred in proofs}) == 1
+        for credential in proofs:
+            assert await verify_proof(self.wallet, credential)
+
+    async def test_fresh_key_without_manager(self):
+        proofs = []
+        for n in range(2):
+            credential = OrderedDict([("n", n)])
+            credential["proof"] = await create_proof(self.wallet, credential, Exception)
+            proofs.append(credential)
+        assert len({cred["proof"]["verificationMethod"] for cred in proofs}) == 2
+
+    async def test_stored_key_reused(self):
+        storage = BasicStorage()
+        manager = SigningKeyManager(self.wallet, storage)
+        first = await manager.get_verkey()
+        second = await manager.rotate()
+        await self.wallet.create_public_did()
+
+        # a new manager, as after a restart, picks up the stored keys
+        manager = SigningKeyManager(self.wallet, storage)
+        assert await manager.get_verkey() == second
+        assert manager.retired == [first]
+
+        # a stored key missing from the wallet is not used
+        manager = SigningKeyManager(BasicWallet(), storage)
+        assert await manager.get_verkey() not in (first, second)
+
+    async def test_rotation(self):
+        await self.wallet.create_public_did()
+        manager = SigningKeyManager(self.wallet, rotation_interval=60)
+        first = await manager.get_verkey()
+
+        credential = OrderedDict([("n", 1)])
+        credential["proof"] = await create_proof(
+            self.wallet, credential, Exception, manager
+        )
+
+        with async_mock.patch.object(
+            test_module.time, "time", async_mock.MagicMock()
+        ) as mock_time:
+            mock_time.return_value = manager._created + 30
+            assert await manager.get_verkey() == first
+
+            mock_time.return_value = manager._created + 60
+            second = await manager.get_verkey()
+            assert second != first
+            assert manager.retired == [first]
+            assert manager.is_known(first) and manager.is_known(second)
+
+        third = await manager.rotate()
+        assert manager.retired == [first, second]
+        assert await manager.get_verkey() == third
+
+        # proofs made with a retired key still verify
+        assert await verify_proof(self.wallet, credential)
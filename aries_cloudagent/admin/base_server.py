@@ -28,6 +28,7 @@ class BaseAdminServer(ABC):
         target_url: str,
         topic_filter: Sequence[str] = None,
         max_attempts: int = None,
+        **batch_options,
     ):
         """Add a webhook target."""
 
@@ -3,6 +3,7 @@
 import os
 import asyncio
 import logging
+from collections import OrderedDict
 from typing import Callable, Coroutine, Sequence, Set
 import uuid
 
@@ -109,18 +110,90 @@ class AdminResponder(BaseResponder):
 class WebhookTarget:
     """Class for managing webhook target information."""
 
+    BATCH_TOPIC = "batch"
+    DEFAULT_BATCH_INTERVAL = 1.0
+    RECORD_ID_KEYS = (
+        "connection_id",
+        "credential_exchange_id",
+        "presentation_exchange_id",
+        "invitation_id",
+        "record_id",
+    )
+
     def __init__(
         self,
         endpoint: str,
         topic_filter: Sequence[str] = None,
         max_attempts: int = None,
+        *,
+        batch_size: int = None,
+        batch_interval: float = None,
+        coalesce: bool = False,
     ):
-        """Initialize the webhook target."""
+        """
+        Initialize the webhook target.
+
+        Args:
+            endpoint: the webhook target url
+            topic_filter: the topics to send, all topics if not given
+            max_attempts: the number of delivery attempts for each webhook
+            batch_size: send buffered events once this many are pending
+            batch_interval: seconds to buffer events for before sending them
+            coalesce: only send the latest event per topic and record id
+
+        """
         self.endpoint = endpoint
         self.max_attempts = max_attempts
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.coalesce = coalesce
+        self.flush_handle: asyncio.TimerHandle = None
+        self._pending = OrderedDict()
+        self._sequence = 0
         self._topic_filter = None
         self.topic_filter = topic_filter  # call setter
 
+    @property
+    def batched(self) -> bool:
+        """Check whether events are buffered and sent in batches."""
+        return bool(self.batch_size or self.batch_interval)
+
+    @property
+    def pending(self) -> int:
+        """Accessor for the number of buffered events."""
+        return len(self._pending)
+
+    def add_event(self, topic: str, payload: dict) -> bool:
+        """
+        Buffer an event for the next batch.
+
+        When coalescing, an earlier event for the same topic and record is
+        dropped and the new one takes its place at the end of the batch.
+
+        Returns:
+            True if the batch is full and should be sent
+
+        """
+        key = None
+        if self.coalesce and isinstance(payload, dict):
+            record_id = next(
+                (payload[k] for k in self.RECORD_ID_KEYS if payload.get(k)), None
+            )
+            if record_id:
+                key = (topic, record_id)
+                self._pending.pop(key, None)
+        if key is None:
+            self._sequence += 1
+            key = self._sequence
+        self._pending[key] = {"topic": topic, "payload": payload}
+        return bool(self.batch_size and len(self._pending) >= self.batch_size)
+
+    def take_batch(self) -> Sequence[dict]:
+        """Remove and return the buffered events, in order."""
+        batch = list(self._pending.values())
+        self._pending.clear()
+        return batch
+
     @property
     def topic_filter(self) -> Set[str]:
         """Accessor for the target's topic filter."""
@@ -386,6 +459,7 @@ class AdminServer(BaseAdminServer):
 
     async def stop(self) -> None:
         """Stop the webserver."""
+        self.flush_webhooks()
         self.app._state["ready"] = False  # in case call does not come through OpenAPI
         for queue in self.websocket_queues.values():
             queue.stop()
@@ -636,15 +710,17 @@ class AdminServer(BaseAdminServer):
         target_url: str,
         topic_filter: Sequence[str] = None,
         max_attempts: int = None,
+        **batch_options,
     ):
-        """Add a webhook target."""
+        """Add a webhook target, see `WebhookTarget` for the batch options."""
         self.webhook_targets[target_url] = WebhookTarget(
-            target_url, topic_filter, max_attempts
+            target_url, topic_filter, max_attempts, **batch_options
         )
 
     def remove_webhook_target(self, target_url: str):
         """Remove a webhook target."""
         if target_url in self.webhook_targets:
+            self.flush_webhooks(self.webhook_targets[target_url])
             del self.webhook_targets[target_url]
 
     async def send_webhook(self, topic: str, payload: dict):
@@ -652,10 +728,41 @@ class AdminServer(BaseAdminServer):
         if self.webhook_router:
             for idx, target in self.webhook_targets.items():
                 if not target.topic_filter or topic in target.topic_filter:
-                    self.webhook_router(
-                        topic, payload, target.endpoint, target.max_attempts
-                    )
+                    if target.batched:
+                        self.buffer_webhook(target, topic, payload)
+                    else:
+                        self.webhook_router(
+                            topic, payload, target.endpoint, target.max_attempts
+                        )
 
         for queue in self.websocket_queues.values():
             if queue.authenticated or topic in ("ping", "settings"):
                 await queue.enqueue({"topic": topic, "payload": payload})
+
+    def buffer_webhook(self, target: WebhookTarget, topic: str, payload: dict):
+        """Add a webhook to the batch of a target, sending it when full."""
+        if target.add_event(topic, payload):
+            self.flush_webhooks(target)
+        elif not target.flush_handle:
+            target.flush_handle = asyncio.get_event_loop().call_later(
+                target.batch_interval or target.DEFAULT_BATCH_INTERVAL,
+                self.flush_webhooks,
+                target,
+            )
+
+    def flush_webhooks(self, target: WebhookTarget = None):
+        """
+        Send the buffered webhooks of one or all targets.
+
+        Each batch is a single webhook on the batch topic, carrying an ordered
+        list of {topic, payload} events, which is retried as a unit.
+        """
+        for target in [target] if target else list(self.webhook_targets.values()):
+            if target.flush_handle:
+                target.flush_handle.cancel()
+                target.flush_handle = None
+            batch = target.take_batch()
+            if batch and self.webhook_router:
+                self.webhook_router(
+                    target.BATCH_TOPIC, batch, target.endpoint, target.max_attempts
+                )
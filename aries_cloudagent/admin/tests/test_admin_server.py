@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from aiohttp import ClientSession, DummyCookieJar, TCPConnector, web
@@ -213,6 +214,52 @@ class TestAdminServer(AsyncTestCase):
         server.remove_webhook_target(target_url=test_url)
         assert test_url not in server.webhook_targets
 
+    async def test_webhook_batch(self):
+        server = self.get_admin_server()
+        server.add_webhook_target("target_url", max_attempts=3, batch_size=3)
+        target = server.webhook_targets["target_url"]
+        assert target.batched
+
+        await server.send_webhook("topic", {"n": 1})
+        await server.send_webhook("topic", {"n": 2})
+        assert not self.webhook_results
+        assert target.flush_handle
+
+        await server.send_webhook("topic", {"n": 3})
+        await server.send_webhook("topic", {"n": 4})
+        assert self.webhook_results == [
+            (
+                "batch",
+                [{"topic": "topic", "payload": {"n": n}} for n in (1, 2, 3)],
+                "target_url",
+                3,
+            )
+        ]
+        assert target.pending == 1
+
+        server.remove_webhook_target("target_url")
+        assert self.webhook_results[-1][1] == [{"topic": "topic", "payload": {"n": 4}}]
+
+    async def test_webhook_batch_interval_coalesce(self):
+        server = self.get_admin_server()
+        server.add_webhook_target("target_url", batch_interval=0.01, coalesce=True)
+
+        await server.send_webhook("connections", {"connection_id": "a", "state": "1"})
+        await server.send_webhook("connections", {"connection_id": "b", "state": "1"})
+        await server.send_webhook("connections", {"connection_id": "a", "state": "2"})
+        await server.send_webhook("basicmessages", {"content": "hi"})
+        await server.send_webhook("basicmessages", {"content": "hi"})
+        await asyncio.sleep(0.05)
+
+        assert len(self.webhook_results) == 1
+        assert [event["payload"] for event in self.webhook_results[0][1]] == [
+            {"connection_id": "b", "state": "1"},
+            {"connection_id": "a", "state": "2"},
+            {"content": "hi"},
+            {"content": "hi"},
+        ]
+        assert not server.webhook_targets["target_url"].flush_handle
+
     async def test_import_routes(self):
         # this test just imports all default admin routes
         # for routes with associated tests, this shouldn't make a difference in coverage
@@ -1,6 +1,10 @@
 """Basic in-memory cache implementation."""
 
+import heapq
+import json
+import sys
 import time
+from collections import OrderedDict
 from typing import Any, Sequence, Text, Union
 
 from .base import BaseCache
@@ -9,21 +13,71 @@ from .base import BaseCache
 class BasicCache(BaseCache):
     """Basic in-memory cache class."""
 
-    def __init__(self):
-        """Initialize a `BasicCache` instance."""
+    def __init__(self, max_entries: int = None, max_bytes: int = None):
+        """
+        Initialize a `BasicCache` instance.
+
+        Args:
+            max_entries: evict least recently used items past this number of items
+            max_bytes: evict least recently used items past this estimated size
+
+        """
         super().__init__()
-        # looks like { "key": { "expires": <epoch timestamp>, "value": <val> } }
-        self._cache = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # looks like { "key": { "expires": <epoch timestamp>, "value": <val> } },
+        # ordered from least to most recently used
+        self._cache = OrderedDict()
+        # heap of (<epoch timestamp>, "key"), entries are dropped lazily
+        # so an item set again leaves a stale entry behind
+        self._expiry_heap = []
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
     def _remove_expired_cache_items(self):
-        """Remove all expired items from cache."""
-        for key, val in self._cache.copy().items():  # iterate copy, del from original
-            cache_item_expiry = val["expires"]
-            if cache_item_expiry is None:
-                continue
-            now = time.perf_counter()
-            if now >= cache_item_expiry:
-                del self._cache[key]
+        """Remove expired items from cache, in order of expiry."""
+        now = time.perf_counter()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires, key = heapq.heappop(heap)
+            item = self._cache.get(key)
+            if item and item["expires"] == expires:
+                self._remove(key)
+                self.expirations += 1
+
+    def _remove(self, key: Text):
+        """Remove an item from the cache, keeping track of the size."""
+        item = self._cache.pop(key)
+        self._size -= item.get("size", 0)
+
+    def _size_of(self, value: Any) -> int:
+        """Estimate the memory used by a value."""
+        try:
+            return sys.getsizeof(json.dumps(value))
+        except (TypeError, ValueError):
+            return sys.getsizeof(value)
+
+    def _evict(self):
+        """Evict least recently used items until the cache is within its limits."""
+        while self._cache and (
+            (self.max_entries and len(self._cache) > self.max_entries)
+            or (self.max_bytes and self._size > self.max_bytes)
+        ):
+            self._remove(next(iter(self._cache)))
+            self.evictions += 1
+
+    def _compact_expiry_heap(self):
+        """Drop the stale heap entries once they outnumber the live ones."""
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [
+                (item["expires"], key)
+                for key, item in self._cache.items()
+                if item["expires"] is not None
+            ]
+            heapq.heapify(self._expiry_heap)
 
     async def get(self, key: Text):
         """
@@ -37,13 +91,20 @@ class BasicCache(BaseCache):
 
         """
         self._remove_expired_cache_items()
-        return self._cache.get(key)["value"] if self._cache.get(key) else None
+        item = self._cache.get(key)
+        if not item:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return item["value"]
 
     async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
         """
         Add an item to the cache with an optional ttl.
 
-        Overwrites existing cache entries.
+        Overwrites existing cache entries. A value larger than the byte limit
+        of the cache is not stored, and the other entries are left in place.
 
         Args:
             keys: the key or keys for which to set an item
@@ -53,8 +114,25 @@ class BasicCache(BaseCache):
         """
         self._remove_expired_cache_items()
         expires_ts = time.perf_counter() + ttl if ttl else None
-        for key in [keys] if isinstance(keys, Text) else keys:
+        size = self._size_of(value) if self.max_bytes else 0
+        keys = [keys] if isinstance(keys, Text) else keys
+        if self.max_bytes and size > self.max_bytes:
+            # drop the previous values, which the new one replaces
+            for key in keys:
+                if key in self._cache:
+                    self._remove(key)
+            return
+        for key in keys:
+            if key in self._cache:
+                self._remove(key)
             self._cache[key] = {"expires": expires_ts, "value": value}
+            if size:
+                self._cache[key]["size"] = size
+                self._size += size
+            if expires_ts is not None:
+                heapq.heappush(self._expiry_heap, (expires_ts, key))
+        self._evict()
+        self._compact_expiry_heap()
 
     async def clear(self, key: Text):
         """
@@ -65,9 +143,23 @@ class BasicCache(BaseCache):
 
         """
         if key in self._cache:
-            del self._cache[key]
+            self._remove(key)
 
     async def flush(self):
         """Remove all items from the cache."""
 
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._expiry_heap = []
+        self._size = 0
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self._cache),
+            "size": self._size,
+        }
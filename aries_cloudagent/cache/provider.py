@@ -0,0 +1,32 @@
+"""Default cache provider classes."""
+
+from ..config.base import BaseProvider, BaseInjector, BaseSettings
+from ..utils.classloader import ClassLoader
+
+
+class CacheProvider(BaseProvider):
+    """Provider for the default configurable cache classes."""
+
+    CACHE_TYPES = {
+        "basic": "aries_cloudagent.cache.basic.BasicCache",
+        "redis": "aries_cloudagent.cache.redis.RedisCache",
+    }
+
+    async def provide(self, settings: BaseSettings, injector: BaseInjector):
+        """Create and return the cache instance."""
+        cache_type = settings.get_value("cache.type", default="basic").lower()
+        cache_class = ClassLoader.load_class(
+            self.CACHE_TYPES.get(cache_type, cache_type)
+        )
+        if cache_type == "basic":
+            return cache_class(
+                max_entries=settings.get_value("cache.max_entries"),
+                max_bytes=settings.get_value("cache.max_bytes"),
+            )
+
+        args = {}
+        if settings.get_value("cache.prefix"):
+            args["prefix"] = settings.get_value("cache.prefix")
+        if settings.get_value("cache.url"):
+            return cache_class(settings.get_value("cache.url"), **args)
+        return cache_class(**args)
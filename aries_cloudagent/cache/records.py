@@ -0,0 +1,37 @@
+"""In-process cache of deserialized storage records."""
+
+import copy
+from typing import Any, Sequence, Text, Union
+
+from .basic import BasicCache
+
+DEFAULT_MAX_ENTRIES = 1000
+
+
+class RecordCache(BasicCache):
+    """
+    Cache of deserialized records for the record types with caching enabled.
+
+    Sits in front of the shared cache so a hit costs neither a storage call
+    nor a deserialization. Records are shallow copied on the way in and out,
+    so callers are free to modify the instances they get.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize a `RecordCache` instance.
+
+        Args:
+            max_entries: evict least recently used records past this number
+
+        """
+        super().__init__(max_entries=max_entries)
+
+    async def get(self, key: Text):
+        """Get a copy of a cached record, if present."""
+        record = await super().get(key)
+        return copy.copy(record) if record is not None else None
+
+    async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
+        """Add a copy of a record to the cache with an optional ttl."""
+        await super().set(keys, copy.copy(value), ttl)
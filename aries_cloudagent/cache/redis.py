@@ -0,0 +1,386 @@
+"""Shared cache implementation speaking the Redis protocol."""
+
+import asyncio
+import json
+import logging
+import ssl
+from typing import Any, Sequence, Text, Union
+from urllib.parse import unquote, urlparse
+from uuid import uuid4
+
+from .base import BaseCache, CacheError, CacheKeyLock
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_URL = "redis://localhost:6379/0"
+DEFAULT_PREFIX = "acapy:cache:"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_LOCK_TIMEOUT = 30
+DEFAULT_LOCK_POLL_INTERVAL = 0.05
+
+# delete a lock entry only while it holds the given token, in one step
+UNLOCK_SCRIPT = (
+    "if redis.call('get', KEYS[1]) == ARGV[1] then "
+    "return redis.call('del', KEYS[1]) end return 0"
+)
+
+
+class RedisError(CacheError):
+    """Error reply received from the cache server."""
+
+
+class RedisConnection:
+    """A single connection to a server speaking the Redis (RESP) protocol."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Initialize a `RedisConnection` instance."""
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def open(
+        cls,
+        host: str,
+        port: int,
+        *,
+        db: int = 0,
+        username: str = None,
+        password: str = None,
+        use_ssl: bool = False,
+    ) -> "RedisConnection":
+        """Open a connection, authenticate and select the database."""
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=ssl.create_default_context() if use_ssl else None
+        )
+        conn = cls(reader, writer)
+        try:
+            if password:
+                if username:
+                    await conn.execute("AUTH", username, password)
+                else:
+                    await conn.execute("AUTH", password)
+            if db:
+                await conn.execute("SELECT", db)
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    @staticmethod
+    def encode_command(*args) -> bytes:
+        """Encode a command as a RESP array of bulk strings."""
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    async def execute(self, *args) -> Any:
+        """Send a command and wait for its reply."""
+        self._writer.write(self.encode_command(*args))
+        await self._writer.drain()
+        return await self._read_reply()
+
+    async def _read_reply(self) -> Any:
+        """Read and decode a single RESP reply."""
+        line = await self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by cache server")
+        kind, data = line[:1], line[1:-2]
+        if kind == b"+":
+            return data.decode("utf-8")
+        if kind == b"-":
+            raise RedisError(data.decode("utf-8"))
+        if kind == b":":
+            return int(data)
+        if kind == b"$":
+            length = int(data)
+            if length < 0:
+                return None
+            return (await self._reader.readexactly(length + 2))[:-2]
+        if kind == b"*":
+            length = int(data)
+            if length < 0:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+        raise ConnectionError("Unexpected reply from cache server: {}".format(line))
+
+    @property
+    def closed(self) -> bool:
+        """Accessor for the closed state of the connection."""
+        return self._writer.is_closing()
+
+    def close(self):
+        """Close the connection."""
+        self._writer.close()
+
+
+class RedisCache(BaseCache):
+    """
+    Cache shared between agent processes through a Redis-compatible server.
+
+    Values are stored as JSON under a common key prefix. Key locks are
+    backed by a lock entry on the server, so only one process produces
+    the value for a key while the others wait for it to appear.
+    """
+
+    def __init__(
+        self,
+        url: str = DEFAULT_URL,
+        *,
+        prefix: str = DEFAULT_PREFIX,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        lock_timeout: float = DEFAULT_LOCK_TIMEOUT,
+        lock_poll_interval: float = DEFAULT_LOCK_POLL_INTERVAL,
+    ):
+        """
+        Initialize a `RedisCache` instance.
+
+        Args:
+            url: the server url, like redis://[[user]:password@]host[:port][/db]
+            prefix: the prefix added to every cache key on the server
+            pool_size: the maximum number of open connections
+            lock_timeout: number of seconds a key lock is held or waited for
+            lock_poll_interval: number of seconds between checks for a locked key
+
+        """
+        super().__init__()
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", "rediss"):
+            raise CacheError("Unsupported cache url: {}".format(url))
+        self.url = url
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.strip("/") or 0)
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.use_ssl = parsed.scheme == "rediss"
+        self.prefix = prefix
+        self.pool_size = pool_size
+        self.lock_timeout = lock_timeout
+        self.lock_poll_interval = lock_poll_interval
+        self.hits = 0
+        self.misses = 0
+        self.lock_waits = 0
+        self._idle = []
+        self._pool_lock: asyncio.Semaphore = None
+
+    async def _connect(self) -> RedisConnection:
+        """Take an idle connection from the pool or open a new one."""
+        while self._idle:
+            conn = self._idle.pop()
+            if not conn.closed:
+                return conn
+        return await RedisConnection.open(
+            self.host,
+            self.port,
+            db=self.db,
+            username=self.username,
+            password=self.password,
+            use_ssl=self.use_ssl,
+        )
+
+    async def execute(self, *args) -> Any:
+        """Run a command on a pooled connection."""
+        if not self._pool_lock:
+            self._pool_lock = asyncio.Semaphore(self.pool_size)
+        async with self._pool_lock:
+            try:
+                conn = await self._connect()
+            except OSError as err:
+                raise CacheError("Error connecting to cache server") from err
+            try:
+                result = await conn.execute(*args)
+            except RedisError:
+                self._idle.append(conn)
+                raise
+            except (OSError, asyncio.IncompleteReadError) as err:
+                conn.close()
+                raise CacheError("Error communicating with cache server") from err
+            except BaseException:
+                # a cancelled command leaves the connection in an unknown state
+                conn.close()
+                raise
+            self._idle.append(conn)
+            return result
+
+    def _key(self, key: Text) -> str:
+        return self.prefix + key
+
+    def _lock_key(self, key: Text) -> str:
+        return self.prefix + "lock:" + key
+
+    async def _fetch(self, key: Text):
+        """Fetch and decode a value without updating the statistics."""
+        found = await self.execute("GET", self._key(key))
+        if found is None:
+            return None
+        try:
+            return json.loads(found.decode("utf-8"))
+        except ValueError:
+            LOGGER.warning("Discarding undecodable cache entry: %s", key)
+            return None
+
+    async def get(self, key: Text):
+        """
+        Get an item from the cache.
+
+        Args:
+            key: the key to retrieve an item for
+
+        Returns:
+            The record found or `None`
+
+        """
+        result = await self._fetch(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
+        """
+        Add an item to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            keys: the key or keys for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        """
+        try:
+            data = json.dumps(value)
+        except (TypeError, ValueError) as err:
+            raise CacheError("Cache value is not serializable") from err
+        expiry = ("PX", max(int(ttl * 1000), 1)) if ttl else ()
+        for key in [keys] if isinstance(keys, Text) else keys:
+            await self.execute("SET", self._key(key), data, *expiry)
+
+    async def clear(self, key: Text):
+        """
+        Remove an item from the cache, if present.
+
+        Args:
+            key: the key to remove
+
+        """
+        await self.execute("DEL", self._key(key))
+
+    async def flush(self):
+        """Remove all items with this cache's prefix from the server."""
+        cursor = b"0"
+        while True:
+            cursor, keys = await self.execute(
+                "SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", 1000
+            )
+            if keys:
+                await self.execute("DEL", *keys)
+            if cursor in (b"0", 0):
+                break
+
+    def acquire(self, key: Text):
+        """Acquire a lock on a given cache key, shared with other processes."""
+        result = RedisCacheKeyLock(self, key)
+        first = self._key_locks.setdefault(key, result)
+        if first is not result:
+            result.parent = first
+        return result
+
+    async def lock(self, key: Text, token: str) -> bool:
+        """Try to take the lock entry for a key on the server."""
+        result = await self.execute(
+            "SET",
+            self._lock_key(key),
+            token,
+            "NX",
+            "PX",
+            max(int(self.lock_timeout * 1000), 1),
+        )
+        return result is not None
+
+    async def unlock(self, key: Text, token: str):
+        """Remove the lock entry for a key, if still held with this token."""
+        await self.execute("EVAL", UNLOCK_SCRIPT, 1, self._lock_key(key), token)
+
+    async def close(self):
+        """Close all pooled connections."""
+        while self._idle:
+            self._idle.pop().close()
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "lock_waits": self.lock_waits,
+            "connections": len(self._idle),
+        }
+
+    def __repr__(self) -> str:
+        """Human readable representation of `RedisCache`."""
+        return "<{}(host={}, port={}, db={})>".format(
+            self.__class__.__name__, self.host, self.port, self.db
+        )
+
+
+class RedisCacheKeyLock(CacheKeyLock):
+    """
+    A lock on a particular cache key, shared through the cache server.
+
+    The first process to take the lock produces the value, the others poll
+    for it until the lock is released or times out.
+    """
+
+    def __init__(self, cache: RedisCache, key: Text):
+        """Initialize the key lock."""
+        super().__init__(cache, key)
+        self.token = uuid4().hex
+        self.locked = False
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        result = None
+        if self.parent:
+            result = await self.parent
+            if result:
+                await self  # wait for parent's done handler to complete
+        if not result:
+            await self._acquire_shared()
+        return self
+
+    async def _acquire_shared(self):
+        """Wait for a value or take the lock on the server."""
+        cache: RedisCache = self.cache
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + cache.lock_timeout
+        waited = False
+        while True:
+            # only the first check counts towards the cache statistics
+            found = await (cache._fetch if waited else cache.get)(self.key)
+            if found:
+                self._future.set_result(found)
+                return
+            if await cache.lock(self.key, self.token):
+                self.locked = True
+                return
+            if loop.time() >= deadline:
+                LOGGER.warning("Timed out waiting for cache key lock: %s", self.key)
+                return
+            if not waited:
+                cache.lock_waits += 1
+                waited = True
+            await asyncio.sleep(cache.lock_poll_interval)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit, releasing the lock on the server."""
+        try:
+            if self.locked:
+                self.locked = False
+                await self.cache.unlock(self.key, self.token)
+        finally:
+            await super().__aexit__(exc_type, exc_val, exc_tb)
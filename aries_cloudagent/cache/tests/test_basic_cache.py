@@ -1,10 +1,17 @@
 from asyncio import ensure_future, sleep, wait_for
 import pytest
 
+from json import dumps
+from sys import getsizeof
+
 from ..base import CacheError
 from ..basic import BasicCache
 
 
+def cache_size_of(value):
+    return getsizeof(dumps(value))
+
+
 @pytest.fixture()
 async def cache():
     cache = BasicCache()
@@ -165,3 +172,64 @@ class TestBasicCache:
     @pytest.mark.asyncio
     async def test_repr(self, cache):
         assert isinstance(repr(cache), str)
+
+    @pytest.mark.asyncio
+    async def test_expiry_heap(self, cache):
+        for i in range(100):
+            await cache.set("key", i, 10)
+        assert len(cache._expiry_heap) <= 2 * len(cache._cache) + 64
+
+        await cache.set("short", "value", 0.01)
+        await sleep(0.02)
+        assert await cache.get("key") == 99
+        assert "short" not in cache._cache
+        assert cache.expirations == 1
+
+        # an item set again without ttl does not expire
+        await cache.set("short", "value", 0.01)
+        await cache.set("short", "value")
+        await sleep(0.02)
+        assert await cache.get("short") == "value"
+
+    @pytest.mark.asyncio
+    async def test_max_entries(self):
+        cache = BasicCache(max_entries=2)
+        await cache.set("one", 1)
+        await cache.set("two", 2)
+        assert await cache.get("one") == 1
+        await cache.set("three", 3)
+        assert await cache.get("two") is None
+        assert await cache.get("one") == 1
+        assert await cache.get("three") == 3
+        assert cache.stats == {
+            "hits": 3,
+            "misses": 1,
+            "evictions": 1,
+            "expirations": 0,
+            "entries": 2,
+            "size": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_max_bytes(self):
+        value = {"data": "x" * 100}
+        cache = BasicCache(max_bytes=cache_size_of(value) * 2)
+        await cache.set(["one", "two"], value)
+        await cache.set("three", value)
+        assert await cache.get("one") is None
+        assert cache.stats["entries"] == 2
+        assert cache.stats["size"] == cache_size_of(value) * 2
+
+        await cache.clear("two")
+        await cache.set(["big", "three"], {"data": "x" * 1000})
+        assert await cache.get("big") is None
+        assert await cache.get("three") is None
+        assert await cache.get("one") is None
+        assert cache.stats["entries"] == 0
+
+        await cache.set("one", value)
+        await cache.set("big", {"data": "x" * 1000})
+        assert await cache.get("big") is None
+        assert await cache.get("one") == value
+        assert cache.stats["entries"] == 1
+        assert cache.stats["size"] == cache_size_of(value)
@@ -132,6 +132,27 @@ class AdminGroup(ArgumentGroup):
             to those events using the admin API. If not specified, webhooks are not\
             published by the agent.",
         )
+        parser.add_argument(
+            "--webhook-batch-size",
+            type=int,
+            metavar="<count>",
+            help="Buffer webhooks and send them in batches of up to this many\
+            events, as a single POST to <url>/topic/batch/ with an ordered list\
+            of {topic, payload} objects. Default: webhooks are sent one by one.",
+        )
+        parser.add_argument(
+            "--webhook-batch-interval",
+            type=float,
+            metavar="<seconds>",
+            help="Buffer webhooks for at most this many seconds before sending\
+            them as a batch. Default: 1 second when batching.",
+        )
+        parser.add_argument(
+            "--webhook-coalesce",
+            action="store_true",
+            help="When batching webhooks, only send the latest event for each\
+            topic and record id within a batch.",
+        )
 
     def get_settings(self, args: Namespace):
         """Extract admin settings."""
@@ -163,6 +184,12 @@ class AdminGroup(ArgumentGroup):
             if hook_url:
                 hook_urls.append(hook_url)
             settings["admin.webhook_urls"] = hook_urls
+            if args.webhook_batch_size:
+                settings["admin.webhook_batch_size"] = args.webhook_batch_size
+            if args.webhook_batch_interval:
+                settings["admin.webhook_batch_interval"] = args.webhook_batch_interval
+            if args.webhook_coalesce:
+                settings["admin.webhook_coalesce"] = True
         return settings
 
 
@@ -412,6 +439,98 @@ class GeneralGroup(ArgumentGroup):
             metavar="<tails-server-base-url>",
             help="Sets the base url of the tails server in use.",
         )
+        parser.add_argument(
+            "--tails-cache-size",
+            type=int,
+            metavar="<megabytes>",
+            help="Limits the disk space used by tails files downloaded from\
+            tails servers. Once over the limit, the files of the revocation\
+            registries used least recently are removed. Default: no limit.",
+        )
+        parser.add_argument(
+            "--cache-type",
+            type=str,
+            metavar="<cache-type>",
+            help="Specifies the type of shared cache to use. Supported cache types\
+            are 'basic' (memory) and 'redis', which shares the cache between agent\
+            processes through a Redis-compatible server. Default: basic.",
+        )
+        parser.add_argument(
+            "--cache-url",
+            type=str,
+            metavar="<cache-url>",
+            help="Specifies the url of the shared cache server, for example\
+            redis://[[user]:password@]host[:port][/db]. Only applies to the\
+            'redis' cache type. Default: redis://localhost:6379/0.",
+        )
+        parser.add_argument(
+            "--cache-prefix",
+            type=str,
+            metavar="<prefix>",
+            help="Specifies the prefix added to the keys this agent stores on the\
+            shared cache server. Default: acapy:cache:",
+        )
+        parser.add_argument(
+            "--cache-max-entries",
+            type=int,
+            metavar="<count>",
+            help="Set the maximum number of items in the shared in-memory cache,\
+            least recently used items are evicted first. Default: no limit.",
+        )
+        parser.add_argument(
+            "--cache-max-size",
+            type=ByteSize(min_size=1024),
+            metavar="<cache-size>",
+            help="Set the maximum estimated size in bytes of the shared in-memory\
+            cache, least recently used items are evicted first.\
+            Default: no limit.",
+        )
+        parser.add_argument(
+            "--record-cache-size",
+            type=int,
+            metavar="<count>",
+            help="Set the maximum number of deserialized connection records kept\
+            in memory. Only used with the 'basic' cache type, as the records are\
+            not shared between agent processes. Use 0 to disable the cache.\
+            Default: 1000.",
+        )
+        parser.add_argument(
+            "--pds-cache-size",
+            type=ByteSize(),
+            metavar="<cache-size>",
+            help="Set the maximum size in bytes of the in-memory cache of\
+            personal data storage payloads. Use 0 to disable the cache.\
+            Default: 16MB.",
+        )
+        parser.add_argument(
+            "--pds-match-index-size",
+            type=int,
+            metavar="<count>",
+            help="Set the maximum number of rows of the table matching data\
+            identifiers to personal data storages held in memory. Use 0 to\
+            disable the index. Default: 100000.",
+        )
+        parser.add_argument(
+            "--pds-fan-out",
+            type=int,
+            metavar="<count>",
+            help="Set the maximum number of concurrent requests made to the\
+            personal data storage when loading linked records. Default: 10.",
+        )
+        parser.add_argument(
+            "--proof-signing-key",
+            type=str,
+            metavar="<verkey>",
+            help="Specifies the verkey of a wallet key used to sign credential and\
+            presentation proofs. Default: the verkey of the public DID.",
+        )
+        parser.add_argument(
+            "--proof-signing-key-rotation",
+            type=int,
+            metavar="<seconds>",
+            help="Create a new proof signing key after this number of seconds.\
+            Retired keys are kept in the wallet. Default: no rotation.",
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract general settings."""
@@ -429,6 +548,30 @@ class GeneralGroup(ArgumentGroup):
             settings["read_only_ledger"] = True
         if args.tails_server_base_url:
             settings["tails_server_base_url"] = args.tails_server_base_url
+        if args.tails_cache_size:
+            settings["tails_cache.max_size"] = args.tails_cache_size * 1024 * 1024
+        if args.cache_type:
+            settings["cache.type"] = args.cache_type
+        if args.cache_url:
+            settings["cache.url"] = args.cache_url
+        if args.cache_prefix:
+            settings["cache.prefix"] = args.cache_prefix
+        if args.cache_max_entries:
+            settings["cache.max_entries"] = args.cache_max_entries
+        if args.cache_max_size:
+            settings["cache.max_bytes"] = args.cache_max_size
+        if args.record_cache_size is not None:
+            settings["record_cache_size"] = args.record_cache_size
+        if args.pds_cache_size is not None:
+            settings["personal_storage_cache_size"] = args.pds_cache_size
+        if args.pds_match_index_size is not None:
+            settings["personal_storage_match_index_size"] = args.pds_match_index_size
+        if args.pds_fan_out:
+            settings["personal_storage_fan_out"] = args.pds_fan_out
+        if args.proof_signing_key:
+            settings["proof_signing_key"] = args.proof_signing_key
+        if args.proof_signing_key_rotation:
+            settings["proof_signing_key_rotation"] = args.proof_signing_key_rotation
         return settings
 
 
@@ -606,6 +749,13 @@ class ProtocolGroup(ArgumentGroup):
             action="store_true",
             help="Keep credential exchange records after exchange has completed.",
         )
+        parser.add_argument(
+            "--preload-protocols",
+            action="store_true",
+            help="Import the message and handler classes of all protocols at\
+            startup instead of on first use, logging any message type which\
+            cannot be resolved. Default: false.",
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Get protocol settings."""
@@ -654,6 +804,8 @@ class ProtocolGroup(ArgumentGroup):
                 raise ArgsParseError("Error writing trace event " + str(e))
         if args.preserve_exchange_records:
             settings["preserve_exchange_records"] = True
+        if args.preload_protocols:
+            settings["protocols.preload"] = True
         return settings
 
 
@@ -716,6 +868,29 @@ class TransportGroup(ArgumentGroup):
             to hold messages for delivery to agents without an endpoint. This\
             option will require additional memory to store messages in the queue.",
         )
+        parser.add_argument(
+            "--undelivered-queue-path",
+            type=str,
+            metavar="<path>",
+            help="Keep the undelivered queue in a SQLite database at the given\
+            path, so that messages held for delivery survive a restart of the\
+            agent. Implies '--enable-undelivered-queue'.",
+        )
+        parser.add_argument(
+            "--undelivered-queue-ttl",
+            type=int,
+            metavar="<seconds>",
+            help="Set the number of seconds after which messages in the\
+            undelivered queue are dropped. Default: 604800 (one week).",
+        )
+        parser.add_argument(
+            "--undelivered-queue-key-limit",
+            type=int,
+            metavar="<count>",
+            help="Set the maximum number of messages held in the undelivered\
+            queue for each recipient key. Further messages for the key are\
+            rejected. Default: no limit.",
+        )
         parser.add_argument(
             "--max-outbound-retry",
             default=4,
@@ -738,6 +913,14 @@ class TransportGroup(ArgumentGroup):
             settings["transport.max_message_size"] = args.max_message_size
         if args.max_outbound_retry:
             settings["transport.max_outbound_retry"] = args.max_outbound_retry
+        if args.undelivered_queue_path:
+            settings["transport.undelivered_queue_path"] = args.undelivered_queue_path
+        if args.undelivered_queue_ttl:
+            settings["transport.undelivered_queue_ttl"] = args.undelivered_queue_ttl
+        if args.undelivered_queue_key_limit:
+            settings[
+                "transport.undelivered_queue_key_limit"
+            ] = args.undelivered_queue_key_limit
 
         return settings
 
@@ -825,6 +1008,22 @@ class WalletGroup(ArgumentGroup):
             admin_user must have the CREATEDB role or else initialization\
             will fail.',
         )
+        parser.add_argument(
+            "--crypto-executor",
+            type=str,
+            choices=("thread", "process"),
+            metavar="<executor-type>",
+            help="Specifies the type of worker pool used to pack and unpack\
+            messages for the 'basic' and 'http' wallets: 'thread' or 'process'.\
+            Default: thread.",
+        )
+        parser.add_argument(
+            "--crypto-workers",
+            type=int,
+            metavar="<count>",
+            help="Specifies the number of workers in the crypto worker pool.\
+            Default: the number of CPUs for processes, a few more for threads.",
+        )
         parser.add_argument(
             "--replace-public-did",
             action="store_true",
@@ -856,4 +1055,8 @@ class WalletGroup(ArgumentGroup):
             settings["wallet.storage_creds"] = args.wallet_storage_creds
         if args.replace_public_did:
             settings["wallet.replace_public_did"] = True
+        if args.crypto_executor:
+            settings["wallet.crypto_executor"] = args.crypto_executor
+        if args.crypto_workers:
+            settings["wallet.crypto_workers"] = args.crypto_workers
         return settings
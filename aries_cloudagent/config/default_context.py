@@ -5,7 +5,8 @@ from .injection_context import InjectionContext
 from .provider import CachedProvider, ClassProvider, StatsProvider
 
 from ..cache.base import BaseCache
-from ..cache.basic import BasicCache
+from ..cache.provider import CacheProvider
+from ..cache.records import RecordCache, DEFAULT_MAX_ENTRIES as RECORD_CACHE_SIZE
 from ..core.plugin_registry import PluginRegistry
 from ..core.protocol_registry import ProtocolRegistry
 from ..ledger.base import BaseLedger
@@ -28,7 +29,13 @@ from ..wallet.base import BaseWallet
 from ..wallet.provider import WalletProvider
 
 
+from ..aathcf.signing_keys import SigningKeyManager
 from ..pdstorage_thcf.base import BasePDS
+from ..pdstorage_thcf.cache import PDSCache, DEFAULT_MAX_BYTES
+from ..pdstorage_thcf.models.table_that_matches_dris_with_pds import (
+    DriStorageMatchIndex,
+    DEFAULT_INDEX_SIZE,
+)
 from ..pdstorage_thcf.provider import PersonalDataStorageProvider
 
 
@@ -45,15 +52,38 @@ class DefaultContextBuilder(ContextBuilder):
             collector = Collector(log_path=timing_log)
             context.injector.bind_instance(Collector, collector)
 
-        # Shared in-memory cache
-        context.injector.bind_instance(BaseCache, BasicCache())
+        # Shared cache, in memory unless a shared backend is configured
+        context.injector.bind_provider(BaseCache, CachedProvider(CacheProvider()))
+
+        # Deserialized records, kept in process unless the cache is shared
+        record_cache_size = context.settings.get("record_cache_size", RECORD_CACHE_SIZE)
+        if record_cache_size and context.settings.get("cache.type", "basic") == "basic":
+            context.injector.bind_instance(RecordCache, RecordCache(record_cache_size))
+
+        # Cache of personal data storage payloads
+        pds_cache_size = context.settings.get(
+            "personal_storage_cache_size", DEFAULT_MAX_BYTES
+        )
+        if pds_cache_size:
+            context.injector.bind_instance(PDSCache, PDSCache(pds_cache_size))
+        match_index_size = context.settings.get(
+            "personal_storage_match_index_size", DEFAULT_INDEX_SIZE
+        )
+        if match_index_size:
+            context.injector.bind_instance(
+                DriStorageMatchIndex, DriStorageMatchIndex(match_index_size)
+            )
 
         # Global protocol registry
-        context.injector.bind_instance(ProtocolRegistry, ProtocolRegistry())
+        registry = ProtocolRegistry()
+        context.injector.bind_instance(ProtocolRegistry, registry)
 
         await self.bind_providers(context)
         await self.load_plugins(context)
 
+        if context.settings.get("protocols.preload"):
+            registry.preload()
+
         return context
 
     async def bind_providers(self, context: InjectionContext):
@@ -100,12 +130,27 @@ class DefaultContextBuilder(ContextBuilder):
                 )
             ),
         )
+        context.injector.bind_provider(
+            SigningKeyManager,
+            CachedProvider(
+                ClassProvider(
+                    SigningKeyManager,
+                    ClassProvider.Inject(BaseWallet),
+                    ClassProvider.Inject(BaseStorage),
+                    verkey=context.settings.get("proof_signing_key"),
+                    rotation_interval=context.settings.get(
+                        "proof_signing_key_rotation"
+                    ),
+                )
+            ),
+        )
         context.injector.bind_provider(
             BaseIssuer,
             StatsProvider(
                 ClassProvider(
                     "aries_cloudagent.issuer.pds.PDSIssuer",
                     ClassProvider.Inject(BaseWallet),
+                    signing_keys=ClassProvider.Inject(SigningKeyManager),
                 ),
                 ("create_credential_offer", "create_credential"),
             ),
@@ -1,6 +1,7 @@
 from .injection_context import InjectionContext
 from ..pdstorage_thcf.models.saved_personal_storage import SavedPDS
 from ..pdstorage_thcf.base import BasePDS
+from ..pdstorage_thcf.provider import PersonalDataStorageProvider
 from ..storage.error import StorageNotFoundError
 
 
@@ -31,3 +32,10 @@ async def personal_data_storage_config(context: InjectionContext):
         default_storage = SavedPDS(state=SavedPDS.ACTIVE)
 
         await default_storage.save(context)
+
+
+async def personal_data_storage_close(context: InjectionContext):
+    """Close the connections held by the personal storage singletons."""
+    provider = context.injector.get_provider(BasePDS)
+    if isinstance(provider, PersonalDataStorageProvider):
+        await provider.close()
@@ -31,6 +31,7 @@ class TestDefaultContext(AsyncTestCase):
             settings={
                 "timing.enabled": True,
                 "timing.log.file": NamedTemporaryFile().name,
+                "protocols.preload": True,
             }
         )
         result = await builder.build()
@@ -249,13 +249,13 @@ class ConnectionRecord(BaseRecord):  # lgtm[py/missing-equals]
         """Accessor for multi use invitation mode."""
         return self.invitation_mode == self.INVITATION_MODE_MULTI
 
-    async def post_save(self, context: InjectionContext, *args, **kwargs):
-        """Perform post-save actions.
+    async def clear_cached(self, context: InjectionContext):
+        """Clear the cached values of this record, on save and delete.
 
         Args:
             context: The injection context to use
         """
-        await super().post_save(context, *args, **kwargs)
+        await super().clear_cached(context)
 
         # clear cache key set by connection manager
         cache_key = self.cache_key(self.connection_id, "connection_target")
@@ -8,11 +8,13 @@ wallet.
 
 """
 
+import asyncio
 import hashlib
 import logging
 
 from ..admin.base_server import BaseAdminServer
 from ..admin.server import AdminServer
+from ..cache.base import BaseCache
 from ..config.default_context import ContextBuilder
 from ..config.injection_context import InjectionContext
 from ..config.ledger import ledger_config
@@ -24,6 +26,7 @@ from ..protocols.connections.v1_0.manager import (
     ConnectionManager,
     ConnectionManagerError,
 )
+from ..revocation.tails_cache import get_tails_cache
 from ..transport.inbound.manager import InboundTransportManager
 from ..transport.inbound.message import InboundMessage
 from ..transport.outbound.base import OutboundDeliveryError
@@ -32,7 +35,11 @@ from ..transport.outbound.message import OutboundMessage
 from ..transport.wire_format import BaseWireFormat
 from ..utils.task_queue import CompletedTask, TaskQueue
 from ..utils.stats import Collector
-from ..config.pdstorage import personal_data_storage_config
+from ..utils.tracing import close_trace_exporters
+from ..config.pdstorage import (
+    personal_data_storage_config,
+    personal_data_storage_close,
+)
 
 from .dispatcher import Dispatcher
 
@@ -69,6 +76,10 @@ class Conductor:
 
         context = await self.context_builder.build()
 
+        tails_cache_size = context.settings.get("tails_cache.max_size")
+        if tails_cache_size:
+            get_tails_cache().max_size = tails_cache_size
+
         self.dispatcher = Dispatcher(context)
         await self.dispatcher.setup()
 
@@ -116,7 +127,16 @@ class Conductor:
                 webhook_urls = context.settings.get("admin.webhook_urls")
                 if webhook_urls:
                     for url in webhook_urls:
-                        self.admin_server.add_webhook_target(url)
+                        self.admin_server.add_webhook_target(
+                            url,
+                            batch_size=context.settings.get("admin.webhook_batch_size"),
+                            batch_interval=context.settings.get(
+                                "admin.webhook_batch_interval"
+                            ),
+                            coalesce=bool(
+                                context.settings.get("admin.webhook_coalesce")
+                            ),
+                        )
                 context.injector.bind_instance(BaseAdminServer, self.admin_server)
                 if "http" not in self.outbound_transport_manager.registered_schemes:
                     self.outbound_transport_manager.register("http")
@@ -228,6 +248,18 @@ class Conductor:
 
     async def stop(self, timeout=1.0):
         """Stop the agent."""
+        # send buffered webhooks and queued messages before the outbound
+        # transports are stopped
+        if self.admin_server:
+            self.admin_server.flush_webhooks()
+        if self.outbound_transport_manager:
+            try:
+                await asyncio.wait_for(
+                    self.outbound_transport_manager.flush(), timeout
+                )
+            except asyncio.TimeoutError:
+                LOGGER.warning("Outbound messages still queued at shutdown")
+
         shutdown = TaskQueue()
         if self.dispatcher:
             shutdown.run(self.dispatcher.complete())
@@ -237,8 +269,26 @@ class Conductor:
             shutdown.run(self.inbound_transport_manager.stop())
         if self.outbound_transport_manager:
             shutdown.run(self.outbound_transport_manager.stop())
+        if self.context:
+            shutdown.run(personal_data_storage_close(self.context))
+            shutdown.run(self.close_cache())
+            shutdown.run(self.close_crypto_executor())
+        shutdown.run(close_trace_exporters())
         await shutdown.complete(timeout)
 
+    async def close_cache(self):
+        """Release the connections held by the shared cache, if any."""
+        cache: BaseCache = await self.context.inject(BaseCache, required=False)
+        if cache:
+            await cache.close()
+
+    async def close_crypto_executor(self):
+        """Shut down the worker pool used for wallet crypto, if any."""
+        wallet: BaseWallet = await self.context.inject(BaseWallet, required=False)
+        executor = wallet and getattr(wallet, "crypto_executor", None)
+        if executor:
+            executor.shutdown(wait=False)
+
     def inbound_message_router(
         self, message: InboundMessage, can_respond: bool = False
     ):
@@ -249,6 +299,10 @@ class Conductor:
             message: The inbound message instance
             can_respond: If the session supports return routing
 
+        Raises:
+            TaskQueueFullError: If the dispatcher has no room for the message,
+                for the inbound transport to push back on the sender
+
         """
 
         if message.receipt.direct_response_requested and not can_respond:
@@ -307,12 +361,21 @@ class Conductor:
             "task_done": self.dispatcher.task_queue.total_done,
             "task_failed": self.dispatcher.task_queue.total_failed,
             "task_pending": self.dispatcher.task_queue.current_pending,
+            "task_lanes": self.dispatcher.task_queue.lane_stats,
         }
         for m in self.outbound_transport_manager.outbound_buffer:
             if m.state == QueuedOutboundMessage.STATE_ENCODE:
                 stats["out_encode"] += 1
             if m.state == QueuedOutboundMessage.STATE_DELIVER:
                 stats["out_deliver"] += 1
+        cache: BaseCache = await self.context.inject(BaseCache, required=False)
+        if cache and hasattr(cache, "stats"):
+            stats["cache"] = cache.stats
+        wallet: BaseWallet = await self.context.inject(BaseWallet, required=False)
+        executor = wallet and getattr(wallet, "crypto_executor", None)
+        if executor:
+            stats["crypto"] = executor.stats
+        stats["tails_cache"] = get_tails_cache().stats
         return stats
 
     async def outbound_message_router(
@@ -8,7 +8,7 @@ lifecycle hook callbacks storing state for message threads, etc.
 import asyncio
 import logging
 import os
-from typing import Callable, Coroutine, Union
+from typing import Callable, Coroutine, Hashable, Union
 
 from aiohttp.web import HTTPException
 
@@ -27,7 +27,7 @@ from ..protocols.problem_report.v1_0.message import ProblemReport
 from ..transport.inbound.message import InboundMessage
 from ..transport.outbound.message import OutboundMessage
 from ..utils.stats import Collector
-from ..utils.task_queue import CompletedTask, PendingTask, TaskQueue
+from ..utils.task_queue import CompletedTask, PendingTask, TaskLane, TaskQueue
 
 from ..utils.tracing import trace_event, get_timer
 
@@ -42,25 +42,48 @@ class Dispatcher:
     to other agents.
     """
 
+    PRIORITY_LANE = "priority"
+
     def __init__(self, context: InjectionContext):
         """Initialize an instance of Dispatcher."""
         self.context = context
         self.collector: Collector = None
+        self.registry: ProtocolRegistry = None
         self.task_queue: TaskQueue = None
 
     async def setup(self):
         """Perform async instance setup."""
         self.collector = await self.context.inject(Collector, required=False)
+        self.registry = await self.context.inject(ProtocolRegistry, required=False)
         max_active = int(os.getenv("DISPATCHER_MAX_ACTIVE", 50))
+        max_pending = int(os.getenv("DISPATCHER_MAX_PENDING", 0)) or None
+        max_burst = int(os.getenv("DISPATCHER_PRIORITY_BURST", 10)) or None
         self.task_queue = TaskQueue(
-            max_active=max_active, timed=bool(self.collector), trace_fn=self.log_task
+            max_active=max_active,
+            timed=bool(self.collector),
+            trace_fn=self.log_task,
+            lanes=(
+                TaskLane(
+                    self.PRIORITY_LANE,
+                    priority=1,
+                    max_pending=max_pending,
+                    max_burst=max_burst,
+                ),
+                TaskLane(TaskQueue.DEFAULT_LANE, max_pending=max_pending),
+            ),
         )
 
     def put_task(
-        self, coro: Coroutine, complete: Callable = None, ident: str = None
+        self,
+        coro: Coroutine,
+        complete: Callable = None,
+        ident: str = None,
+        *,
+        lane: str = None,
+        flow: Hashable = None,
     ) -> PendingTask:
         """Run a task in the task queue, potentially blocking other handlers."""
-        return self.task_queue.put(coro, complete, ident)
+        return self.task_queue.put(coro, complete, ident, lane=lane, flow=flow)
 
     def run_task(
         self, coro: Coroutine, complete: Callable = None, ident: str = None
@@ -78,9 +101,10 @@ class Dispatcher:
         if self.collector:
             timing = task.timing
             if "queued" in timing:
-                self.collector.log(
-                    "Dispatcher:queued", timing["unqueued"] - timing["queued"]
-                )
+                waited = timing["unqueued"] - timing["queued"]
+                self.collector.log("Dispatcher:queued", waited)
+                if "lane" in timing:
+                    self.collector.log(f"Dispatcher:queued:{timing['lane']}", waited)
             if task.ident:
                 self.collector.log(task.ident, timing["ended"] - timing["started"])
 
@@ -103,9 +127,21 @@ class Dispatcher:
         Returns:
             A pending task instance resolving to the handler task
 
+        Raises:
+            TaskQueueFullError: If the message must wait and its lane is full
+
         """
+        payload = inbound_message.payload
+        message_type = isinstance(payload, dict) and payload.get("@type")
+        lane = None
+        if self.registry and message_type:
+            lane = self.registry.message_lane(message_type)
+        # messages wait in their protocol's lane, taking fair turns per sender
         return self.put_task(
-            self.handle_message(inbound_message, send_outbound, send_webhook), complete
+            self.handle_message(inbound_message, send_outbound, send_webhook),
+            complete,
+            lane=lane,
+            flow=inbound_message.connection_id or inbound_message.receipt.sender_verkey,
         )
 
     async def handle_message(
@@ -206,6 +206,8 @@ class PluginRegistry:
             registry.register_message_types(
                 mod.MESSAGE_TYPES, version_definition=version_definition
             )
+        if hasattr(mod, "MESSAGE_LANES"):
+            registry.register_message_lanes(mod.MESSAGE_LANES)
         if hasattr(mod, "CONTROLLERS"):
             registry.register_controllers(
                 mod.CONTROLLERS, version_definition=version_definition
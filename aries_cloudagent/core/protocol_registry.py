@@ -5,7 +5,7 @@ import logging
 from typing import Mapping, Sequence
 
 from ..config.injection_context import InjectionContext
-from ..utils.classloader import ClassLoader
+from ..utils.classloader import ClassLoader, ClassNotFoundError, ModuleLoadError
 from .error import ProtocolMinorVersionNotSupported
 
 LOGGER = logging.getLogger(__name__)
@@ -16,8 +16,11 @@ class ProtocolRegistry:
 
     def __init__(self):
         """Initialize a `ProtocolRegistry` instance."""
+        self._classes = {}
         self._controllers = {}
+        self._lanes = {}
         self._typemap = {}
+        self._versionindex = {}
         self._versionmap = {}
 
     @property
@@ -96,13 +99,38 @@ class ProtocolRegistry:
                     if version_definition["major_version"] not in self._versionmap:
                         self._versionmap[version_definition["major_version"]] = []
 
+                    proto = {
+                        "parsed_type_string": parsed_type_string,
+                        "version_definition": version_definition,
+                        "message_module": module_path,
+                    }
                     self._versionmap[version_definition["major_version"]].append(
-                        {
-                            "parsed_type_string": parsed_type_string,
-                            "version_definition": version_definition,
-                            "message_module": module_path,
-                        }
+                        proto
                     )
+                    # the first registration for a message and major version wins
+                    self._versionindex.setdefault(
+                        (
+                            parsed_type_string["protocol_name"],
+                            parsed_type_string["message_name"],
+                            version_definition["major_version"],
+                        ),
+                        proto,
+                    )
+
+    def register_message_lanes(self, *lane_sets):
+        """
+        Assign message types to dispatcher task lanes.
+
+        Args:
+            lane_sets: Mappings of message types to lane names
+
+        """
+        for lane_set in lane_sets:
+            self._lanes.update(lane_set)
+
+    def message_lane(self, message_type: str) -> str:
+        """Get the dispatcher lane for a message type, if one was assigned."""
+        return self._lanes.get(message_type)
 
     def register_controllers(self, *controller_sets, version_definition=None):
         """
@@ -132,45 +160,63 @@ class ProtocolRegistry:
 
         # Try and retrieve from direct mapping
         msg_cls = self._typemap.get(message_type)
-        if isinstance(msg_cls, str):
-            return ClassLoader.load_class(msg_cls)
-
-        # Support registered modules (not path as string)
-        elif msg_cls:
-            return msg_cls
 
         # Try and route via min/maj version matching
         if not msg_cls:
             parsed_type_string = self.parse_type_string(message_type)
-            major_version = parsed_type_string["major_version"]
-
-            version_supported_protos = self._versionmap.get(major_version)
-            if not version_supported_protos:
+            proto = self._versionindex.get(
+                (
+                    parsed_type_string["protocol_name"],
+                    parsed_type_string["message_name"],
+                    parsed_type_string["major_version"],
+                )
+            )
+            if not proto:
                 return None
 
-            for proto in version_supported_protos:
-                if (
-                    proto["parsed_type_string"]["protocol_name"]
-                    == parsed_type_string["protocol_name"]
-                    and proto["parsed_type_string"]["message_name"]
-                    == parsed_type_string["message_name"]
-                ):
-                    if (
-                        parsed_type_string["minor_version"]
-                        < proto["version_definition"]["minimum_minor_version"]
-                    ):
-                        raise ProtocolMinorVersionNotSupported(
-                            "Minimum supported minor version is "
-                            + f"{proto['version_definition']['minimum_minor_version']}."
-                            + f" Received {parsed_type_string['minor_version']}."
-                        )
-
-                    if isinstance(proto["message_module"], str):
-                        return ClassLoader.load_class(msg_cls)
-                    elif proto["message_module"]:
-                        return proto["message_module"]
-
-        return None
+            if (
+                parsed_type_string["minor_version"]
+                < proto["version_definition"]["minimum_minor_version"]
+            ):
+                raise ProtocolMinorVersionNotSupported(
+                    "Minimum supported minor version is "
+                    + f"{proto['version_definition']['minimum_minor_version']}."
+                    + f" Received {parsed_type_string['minor_version']}."
+                )
+            msg_cls = proto["message_module"]
+
+        return self._load_message_class(msg_cls)
+
+    def _load_message_class(self, msg_cls) -> type:
+        """Load a message class registered by path, remembering the result."""
+        if isinstance(msg_cls, str):
+            path = msg_cls
+            msg_cls = self._classes.get(path)
+            if not msg_cls:
+                msg_cls = self._classes[path] = ClassLoader.load_class(path)
+        return msg_cls or None
+
+    def preload(self, handlers: bool = True) -> Sequence[str]:
+        """
+        Import the registered message classes ahead of the first messages.
+
+        Args:
+            handlers: Whether to also import the handler of each message class
+
+        Returns:
+            The message types which could not be resolved
+
+        """
+        unresolved = []
+        for message_type, msg_cls in self._typemap.items():
+            try:
+                msg_cls = self._load_message_class(msg_cls)
+                if handlers and getattr(msg_cls.Meta, "handler_class", None):
+                    msg_cls._get_handler_class()
+            except (ClassNotFoundError, ModuleLoadError) as err:
+                LOGGER.warning("Unable to resolve message type %s: %s", message_type, err)
+                unresolved.append(message_type)
+        return unresolved
 
     async def prepare_disclosed(
         self, context: InjectionContext, protocols: Sequence[str]
@@ -125,8 +125,38 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
             await conductor.stop()
 
             mock_inbound_mgr.return_value.stop.assert_awaited_once_with()
+            mock_outbound_mgr.return_value.flush.assert_awaited_once_with()
             mock_outbound_mgr.return_value.stop.assert_awaited_once_with()
 
+    async def test_stop_drains_outbound(self):
+        builder: ContextBuilder = StubContextBuilder(self.test_settings)
+        builder.update_settings({"admin.enabled": "1"})
+        conductor = test_module.Conductor(builder)
+        await conductor.setup()
+        calls = []
+
+        async def flush():
+            calls.append("flush")
+            await asyncio.sleep(10)
+
+        async def stop():
+            calls.append("stop")
+
+        with async_mock.patch.object(
+            conductor.outbound_transport_manager, "flush", flush
+        ), async_mock.patch.object(
+            conductor.outbound_transport_manager, "stop", stop
+        ), async_mock.patch.object(
+            conductor.admin_server, "flush_webhooks", autospec=True
+        ) as mock_flush_webhooks, async_mock.patch.object(
+            conductor.admin_server, "stop", autospec=True
+        ):
+            mock_flush_webhooks.side_effect = lambda: calls.append("webhooks")
+            await conductor.stop(timeout=0.05)
+
+        # webhooks are queued first, then the queue drains until the timeout
+        assert calls == ["webhooks", "flush", "stop"]
+
     async def test_startup_no_public_did(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
         conductor = test_module.Conductor(builder)
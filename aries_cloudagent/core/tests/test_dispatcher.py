@@ -272,6 +272,30 @@ class TestDispatcher(AsyncTestCase):
         payload = json.loads(rcv.messages[0][1].payload)
         assert payload["@type"] == ProblemReport.Meta.message_type
 
+    async def test_queue_message_lane(self):
+        context = make_context()
+        registry = await context.inject(ProtocolRegistry)
+        registry.register_message_lanes(
+            {StubAgentMessage.Meta.message_type: test_module.Dispatcher.PRIORITY_LANE}
+        )
+        dispatcher = test_module.Dispatcher(context)
+        await dispatcher.setup()
+        rcv = Receiver()
+
+        with async_mock.patch.object(
+            dispatcher.task_queue, "put", autospec=True
+        ) as mock_put:
+            inbound = make_inbound({"@type": StubAgentMessage.Meta.message_type})
+            inbound.receipt.sender_verkey = "sender-verkey"
+            dispatcher.queue_message(inbound, rcv.send)
+            assert mock_put.call_args[1]["lane"] == "priority"
+            assert mock_put.call_args[1]["flow"] == "sender-verkey"
+            mock_put.call_args[0][0].close()
+
+            dispatcher.queue_message(make_inbound({"@type": "other"}), rcv.send)
+            assert mock_put.call_args[1]["lane"] is None
+            mock_put.call_args[0][0].close()
+
     async def test_dispatch_log(self):
         context = make_context()
         context.enforce_typing = False
@@ -4,6 +4,10 @@ from ...config.injection_context import InjectionContext
 from ...messaging.error import MessageParseError
 from ...utils.classloader import ClassLoader
 
+from ...protocols.problem_report.v1_0.message import ProblemReport
+from ...protocols.trustping.v1_0.message_types import PING
+
+from ..error import ProtocolMinorVersionNotSupported
 from ..protocol_registry import ProtocolRegistry
 
 
@@ -98,6 +102,45 @@ class TestProtocolRegistry(AsyncTestCase):
             result = self.registry.resolve_message_class(self.test_message_type)
             assert result == mock_class
 
+    def test_resolve_message_class_loaded_once(self):
+        self.registry.register_message_types(
+            {self.test_message_type: self.test_message_handler}
+        )
+        mock_class = async_mock.MagicMock()
+        with async_mock.patch.object(
+            ClassLoader, "load_class", async_mock.MagicMock()
+        ) as load_class:
+            load_class.return_value = mock_class
+            for _ in range(3):
+                result = self.registry.resolve_message_class(self.test_message_type)
+                assert result == mock_class
+            load_class.assert_called_once_with(self.test_message_handler)
+
+    def test_resolve_message_class_minor_version(self):
+        self.registry.register_message_types(
+            {"proto/1.2/aaa": ProblemReport},
+            version_definition={
+                "major_version": 1,
+                "minimum_minor_version": 1,
+                "current_minor_version": 2,
+                "path": "v1_2",
+            },
+        )
+        assert self.registry.resolve_message_class("proto/1.5/aaa") is ProblemReport
+        assert self.registry.resolve_message_class("proto/2.2/aaa") is None
+        with self.assertRaises(ProtocolMinorVersionNotSupported):
+            self.registry.resolve_message_class("proto/1.0/aaa")
+
+    def test_preload(self):
+        self.registry.register_message_types(
+            {
+                ProblemReport.Meta.message_type: ProblemReport,
+                PING: "aries_cloudagent.protocols.trustping.v1_0.messages.ping.Ping",
+                self.test_message_type: "not.a.module.Message",
+            }
+        )
+        assert self.registry.preload() == [self.test_message_type]
+
     def test_resolve_message_class_no_major_version_support(self):
         result = self.registry.resolve_message_class("proto/1.2/hello")
         assert result is None
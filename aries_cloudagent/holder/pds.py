@@ -186,6 +186,7 @@ class PDSHolder(BaseHolder):
         presentation["type"] = processed_type
         presentation["verifiableCredential"] = {credential_id: credential}
 
+        # a new key for each presentation, so presentations cannot be linked
         proof = await create_proof(self.wallet, presentation, HolderError)
         presentation.update({"proof": proof})
 
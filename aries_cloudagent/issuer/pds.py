@@ -12,6 +12,7 @@ from .base import (
 )
 from ..messaging.util import time_now
 from ..aathcf.credentials import create_proof
+from ..aathcf.signing_keys import SigningKeyManager, get_signing_key_manager
 from aries_cloudagent.aathcf.credentials import (
     CredentialSchema,
     validate_schema,
@@ -27,14 +28,18 @@ def raise_exception_on_null(value, value_name, exception=IssuerError):
 
 
 class PDSIssuer(BaseIssuer):
-    def __init__(self, wallet: BaseWallet):
+    def __init__(self, wallet: BaseWallet, signing_keys: SigningKeyManager = None):
         """
         Initialize an PDSIssuer instance.
 
         Args:
+            wallet: the wallet holding the signing keys
+            signing_keys: the manager of the key used to sign credentials,
+                defaults to the wallet's signing key manager
 
         """
         self.wallet: BaseWallet = wallet
+        self.signing_keys = signing_keys or get_signing_key_manager(wallet)
         self.logger = logging.getLogger(__name__)
 
     def make_schema_id(
@@ -194,7 +199,7 @@ class PDSIssuer(BaseIssuer):
         #         "dataDri": "1234",
         #     },
         credential_dict["proof"] = await create_proof(
-            self.wallet, credential_dict, IssuerError
+            self.wallet, credential_dict, IssuerError, self.signing_keys
         )
         validate_schema(
             CredentialSchema, credential_dict, IssuerError, self.logger.error
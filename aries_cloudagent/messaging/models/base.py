@@ -1,16 +1,29 @@
 """Base classes for Models and Schemas."""
 import logging
+import threading
 from abc import ABC
+from collections.abc import Mapping
 import json
 from typing import Union
 
-from marshmallow import Schema, post_dump, pre_load, post_load, ValidationError, EXCLUDE
+from marshmallow import (
+    EXCLUDE,
+    Schema,
+    ValidationError,
+    fields,
+    missing,
+    post_dump,
+    post_load,
+    pre_load,
+)
 
 from ...core.error import BaseError
 from ...utils.classloader import ClassLoader
 
 LOGGER = logging.getLogger(__name__)
 
+SCHEMA_INSTANCES = threading.local()
+
 
 def resolve_class(the_cls, relative_cls: type = None):
     """
@@ -110,6 +123,25 @@ class BaseModel(ABC):
         """
         return self._get_schema_class()
 
+    @classmethod
+    def _get_schema(cls) -> "BaseModelSchema":
+        """
+        Get the schema instance reused for the model class.
+
+        Building a schema copies all its declared fields, so instances are
+        reused. Some schemas keep state during a call, so each thread has
+        its own instances.
+
+        Returns:
+            The schema instance
+
+        """
+        schemas = SCHEMA_INSTANCES.__dict__
+        schema = schemas.get(cls)
+        if not schema:
+            schema = schemas[cls] = cls._get_schema_class()(unknown=EXCLUDE)
+        return schema
+
     @classmethod
     def deserialize(cls, obj):
         """
@@ -122,7 +154,7 @@ class BaseModel(ABC):
             A model instance for this data
 
         """
-        schema = cls._get_schema_class()(unknown=EXCLUDE)
+        schema = cls._get_schema()
         try:
             return schema.loads(obj) if isinstance(obj, str) else schema.load(obj)
         except ValidationError as e:
@@ -140,7 +172,7 @@ class BaseModel(ABC):
             A dict representation of this model, or a JSON string if as_string is True
 
         """
-        schema = self.Schema(unknown=EXCLUDE)
+        schema = self._get_schema()
         try:
             return schema.dumps(self) if as_string else schema.dump(self)
         except ValidationError as e:
@@ -151,7 +183,7 @@ class BaseModel(ABC):
 
     def validate(self):
         """Validate a constructed model."""
-        schema = self.Schema(unknown=EXCLUDE)
+        schema = self._get_schema()
         errors = schema.validate(self.serialize())
         if errors:
             raise ValidationError(errors)
@@ -206,6 +238,8 @@ class BaseModel(ABC):
 class BaseModelSchema(Schema):
     """BaseModel schema."""
 
+    FLAT_FIELD_TYPES = (fields.Boolean, fields.Dict, fields.Number, fields.String)
+
     class Meta:
         """BaseModelSchema metadata."""
 
@@ -228,6 +262,109 @@ class BaseModelSchema(Schema):
                     self.__class__.__name__
                 )
             )
+        self._skip_values = resolve_meta_property(self, "skip_values", [])
+        self._flat = self._compile_flat()
+
+    def _compile_flat(self):
+        """
+        Precompute the fields of a flat schema for the fast dump and load.
+
+        A schema is flat when all its fields are scalars or dicts, read from
+        plain attributes, and it adds no hooks to those of this class.
+
+        Returns:
+            The dump and load field lists, or None if the schema is not flat
+
+        """
+        schema_cls = type(self)
+        hooks = {tag: names for tag, names in schema_cls._hooks.items() if names}
+        base_hooks = {
+            tag: names for tag, names in BaseModelSchema._hooks.items() if names
+        }
+        if hooks != base_hooks or self.many:
+            return None
+        for names in base_hooks.values():
+            for name in names:
+                if getattr(schema_cls, name) is not getattr(BaseModelSchema, name):
+                    return None
+
+        for field_obj in self.fields.values():
+            field_cls = type(field_obj)
+            if (
+                not isinstance(field_obj, self.FLAT_FIELD_TYPES)
+                or "." in (field_obj.attribute or "")
+                or field_cls.get_value is not fields.Field.get_value
+                or field_cls.serialize is not fields.Field.serialize
+                or field_cls.deserialize is not fields.Field.deserialize
+            ):
+                return None
+
+        dump_fields = tuple(
+            (
+                name,
+                field_obj.attribute or name,
+                field_obj.data_key if field_obj.data_key is not None else name,
+                field_obj,
+            )
+            for name, field_obj in self.dump_fields.items()
+        )
+        load_fields = tuple(
+            (
+                field_obj.data_key if field_obj.data_key is not None else name,
+                field_obj.attribute or name,
+                field_obj,
+            )
+            for name, field_obj in self.load_fields.items()
+        )
+        return dump_fields, load_fields
+
+    def dump(self, obj, *, many: bool = None):
+        """Serialize an object, reading the fields of a flat schema directly."""
+        if (
+            not self._flat
+            or (self.many if many is None else many)
+            or hasattr(obj, "__getitem__")
+        ):
+            return super().dump(obj, many=many)
+
+        skip_vals = self._skip_values
+        result = {}
+        for name, attr, key, field_obj in self._flat[0]:
+            value = getattr(obj, attr, missing)
+            if value is missing:
+                default = field_obj.default
+                value = default() if callable(default) else default
+                if value is missing:
+                    continue
+            value = field_obj._serialize(value, name, obj)
+            if value not in skip_vals:
+                result[key] = value
+        return result
+
+    def load(self, data, *, many: bool = None, partial=None, unknown: str = None):
+        """Deserialize data, filling the fields of a flat schema directly."""
+        if (
+            not self._flat
+            or (self.many if many is None else many)
+            or (self.partial if partial is None else partial)
+            or (unknown or self.unknown) != EXCLUDE
+            or not isinstance(data, Mapping)
+        ):
+            return super().load(data, many=many, partial=partial, unknown=unknown)
+
+        result = {}
+        errors = {}
+        for key, attr, field_obj in self._flat[1]:
+            try:
+                value = field_obj.deserialize(data.get(key, missing), key, data)
+            except ValidationError as err:
+                errors[key] = err.messages
+                continue
+            if value is not missing:
+                result[attr] = value
+        if errors:
+            raise ValidationError(errors, data=data, valid_data=result)
+        return self.make_model(result)
 
     @classmethod
     def _get_model_class(cls):
@@ -294,7 +431,7 @@ class BaseModelSchema(Schema):
             Returns this modified data
 
         """
-        skip_vals = resolve_meta_property(self, "skip_values", [])
+        skip_vals = self._skip_values
         return {key: value for key, value in data.items() if value not in skip_vals}
 
 
@@ -5,13 +5,19 @@ import sys
 import uuid
 
 from datetime import datetime
-from typing import Any, Mapping, Sequence, Union
+from typing import Any, AsyncIterator, Mapping, Sequence, Union
 
 from marshmallow import fields
 
 from ...cache.base import BaseCache
+from ...cache.records import RecordCache
 from ...config.injection_context import InjectionContext
-from ...storage.base import BaseStorage, StorageDuplicateError, StorageNotFoundError
+from ...storage.base import (
+    DEFAULT_PAGE_SIZE,
+    BaseStorage,
+    StorageDuplicateError,
+    StorageNotFoundError,
+)
 from ...storage.record import StorageRecord
 
 from .base import BaseModel, BaseModelSchema
@@ -188,7 +194,12 @@ class BaseRecord(BaseModel):
 
     async def clear_cached(self, context: InjectionContext):
         """Clear the cached value of this record, if any."""
-        await self.clear_cached_key(context, self.cache_key(self._id))
+        cache_key = self.cache_key(self._id)
+        await self.clear_cached_key(context, cache_key)
+        if self.CACHE_ENABLED:
+            record_cache: RecordCache = await context.inject(RecordCache, required=False)
+            if record_cache:
+                await record_cache.clear(cache_key)
 
     @classmethod
     async def retrieve_by_id(
@@ -203,8 +214,14 @@ class BaseRecord(BaseModel):
         """
         cache_key = cls.cache_key(record_id)
         vals = None
+        record_cache: RecordCache = None
 
         if cls.CACHE_ENABLED and cached:
+            record_cache = await context.inject(RecordCache, required=False)
+            if record_cache:
+                record = await record_cache.get(cache_key)
+                if record:
+                    return record
             vals = await cls.get_cached_key(context, cache_key)
 
         if not vals:
@@ -216,7 +233,10 @@ class BaseRecord(BaseModel):
             if cls.CACHE_ENABLED:
                 await cls.set_cached_key(context, cache_key, vals)
 
-        return cls.from_storage(record_id, vals)
+        record = cls.from_storage(record_id, vals)
+        if record_cache:
+            await record_cache.set(cache_key, record, cls.CACHE_TTL)
+        return record
 
     @classmethod
     async def retrieve_by_tag_filter(
@@ -264,6 +284,9 @@ class BaseRecord(BaseModel):
         tag_filter: dict = None,
         post_filter_positive: dict = None,
         post_filter_negative: dict = None,
+        *,
+        limit: int = None,
+        offset: int = 0,
     ) -> Sequence["BaseRecord"]:
         """Query stored records.
 
@@ -272,22 +295,73 @@ class BaseRecord(BaseModel):
             tag_filter: An optional dictionary of tag filter clauses
             post_filter_positive: Additional value filters to apply matching positively
             post_filter_negative: Additional value filters to apply matching negatively
+            limit: The maximum number of records to return
+            offset: The number of matching records to skip
+        """
+        return [
+            record
+            async for record in cls.query_iter(
+                context,
+                tag_filter,
+                post_filter_positive,
+                post_filter_negative,
+                limit=limit,
+                offset=offset,
+            )
+        ]
+
+    @classmethod
+    async def query_iter(
+        cls,
+        context: InjectionContext,
+        tag_filter: dict = None,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        *,
+        limit: int = None,
+        offset: int = 0,
+    ) -> AsyncIterator["BaseRecord"]:
+        """Iterate over stored records, loading them as they are consumed.
+
+        Records are returned in storage order. Without post-filters, the offset
+        and limit are applied by the storage search, so that records outside
+        the page are never decoded.
+
+        Args:
+            context: The injection context to use
+            tag_filter: An optional dictionary of tag filter clauses
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            limit: The maximum number of records to return
+            offset: The number of matching records to skip
         """
         storage: BaseStorage = await context.inject(BaseStorage)
+        post_filter = post_filter_positive or post_filter_negative
         query = storage.search_records(
             cls.RECORD_TYPE,
             cls.prefix_tag_filter(tag_filter),
-            None,
+            min(limit, DEFAULT_PAGE_SIZE) if limit and not post_filter else None,
             {"retrieveTags": False},
         )
-        result = []
-        async for record in query:
-            vals = json.loads(record.value)
-            if match_post_filter(
-                vals, post_filter_positive, True
-            ) and match_post_filter(vals, post_filter_negative, False):
-                result.append(cls.from_storage(record.id, vals))
-        return result
+        async with query:
+            if offset and not post_filter:
+                await query.skip(offset)
+                offset = 0
+            count = 0
+            async for record in query:
+                vals = json.loads(record.value)
+                if not (
+                    match_post_filter(vals, post_filter_positive, True)
+                    and match_post_filter(vals, post_filter_negative, False)
+                ):
+                    continue
+                if offset:
+                    offset -= 1
+                    continue
+                yield cls.from_storage(record.id, vals)
+                count += 1
+                if limit and count >= limit:
+                    break
 
     async def save(
         self,
@@ -368,6 +442,7 @@ class BaseRecord(BaseModel):
         if self._id:
             storage: BaseStorage = await context.inject(BaseStorage)
             await storage.delete_record(self.storage_record)
+            await self.clear_cached(context)
         # FIXME - update state and send webhook?
 
     @property
@@ -0,0 +1,106 @@
+"""Paging and streaming support for admin routes listing records."""
+
+import asyncio
+import json
+import logging
+
+from typing import AsyncIterator, Tuple
+
+from aiohttp import web
+from marshmallow import fields
+
+from ..valid import NATURAL_NUM, WHOLE_NUM
+
+from .base_record import BaseRecord
+from .openapi import OpenAPISchema
+
+LOGGER = logging.getLogger(__name__)
+
+STREAM_CHUNK_SIZE = 65536
+
+
+class PageQueryStringSchema(OpenAPISchema):
+    """Parameters and validators for paged list request query string."""
+
+    limit = fields.Int(
+        description="Maximum number of records to return, in storage order",
+        required=False,
+        **NATURAL_NUM,
+    )
+    offset = fields.Int(
+        description="Number of matching records to skip, in storage order",
+        required=False,
+        **WHOLE_NUM,
+    )
+
+
+def page_params(request: web.BaseRequest) -> Tuple[int, int]:
+    """
+    Extract the paging parameters of a list request.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        A tuple of the limit, or None for no limit, and the offset
+
+    """
+    limit = request.query.get("limit")
+    offset = request.query.get("offset")
+    return (int(limit) if limit else None, int(offset) if offset else 0)
+
+
+async def stream_results(
+    request: web.BaseRequest, records: AsyncIterator[BaseRecord]
+) -> web.StreamResponse:
+    """
+    Stream serialized records as a JSON list response.
+
+    The first record is loaded and serialized before the response is
+    started, so that an error opening the query can still be reported as
+    an error response. Once the headers are sent an error can no longer
+    change the status, so the connection is closed before the list is
+    complete and the client sees a truncated body, not a shorter list.
+
+    Args:
+        request: aiohttp request object
+        records: the records to serialize, as returned by `query_iter`
+
+    Returns:
+        The response, written in full
+
+    """
+    records = records.__aiter__()
+    chunk = ['{"results": [']
+    try:
+        first = await records.__anext__()
+    except StopAsyncIteration:
+        first = None
+    else:
+        chunk.append(json.dumps(first.serialize()))
+
+    response = web.StreamResponse(headers={"Content-Type": "application/json"})
+    await response.prepare(request)
+    try:
+        size = 0
+        if first is not None:
+            async for record in records:
+                if size >= STREAM_CHUNK_SIZE:
+                    await response.write("".join(chunk).encode("utf-8"))
+                    chunk = []
+                    size = 0
+                serialized = json.dumps(record.serialize())
+                chunk.extend((", ", serialized))
+                size += len(serialized)
+        chunk.append("]}")
+        await response.write("".join(chunk).encode("utf-8"))
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        LOGGER.exception("Error streaming results, closing the connection")
+        response.force_close()
+        if request.transport:
+            request.transport.close()
+        return response
+    await response.write_eof()
+    return response
@@ -2,7 +2,7 @@ import json
 
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
 
-from marshmallow import EXCLUDE, fields, validates_schema, ValidationError
+from marshmallow import EXCLUDE, Schema, fields, validates_schema, ValidationError
 
 from ....cache.base import BaseCache
 from ....config.injection_context import InjectionContext
@@ -35,6 +35,27 @@ class SchemaImpl(BaseModelSchema):
             raise ValidationError("")
 
 
+class FlatModelImpl(BaseModel):
+    class Meta:
+        schema_class = "FlatSchemaImpl"
+
+    def __init__(self, *, name=None, count=None, extra=None, flag=None):
+        self.name = name
+        self.count = count
+        self.extra = extra
+        self.flag = flag
+
+
+class FlatSchemaImpl(BaseModelSchema):
+    class Meta:
+        model_class = FlatModelImpl
+
+    name = fields.Str(required=True, data_key="@name")
+    count = fields.Int(validate=lambda value: value >= 0)
+    extra = fields.Dict()
+    flag = fields.Bool()
+
+
 class TestBase(AsyncTestCase):
     def test_model_validate_fails(self):
         model = ModelImpl(attr="string")
@@ -49,12 +70,10 @@ class TestBase(AsyncTestCase):
     def test_ser_x(self):
         model = ModelImpl(attr="hello world")
         with async_mock.patch.object(
-            model, "_get_schema_class", async_mock.MagicMock()
-        ) as mock_get_schema_class:
-            mock_get_schema_class.return_value = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    dump=async_mock.MagicMock(side_effect=ValidationError("error"))
-                )
+            model, "_get_schema", async_mock.MagicMock()
+        ) as mock_get_schema:
+            mock_get_schema.return_value = async_mock.MagicMock(
+                dump=async_mock.MagicMock(side_effect=ValidationError("error"))
             )
             with self.assertRaises(BaseModelError):
                 model.serialize()
@@ -63,3 +82,33 @@ class TestBase(AsyncTestCase):
         data = "{}{}"
         with self.assertRaises(BaseModelError):
             ModelImpl.from_json(data)
+
+    def test_schema_reused(self):
+        assert ModelImpl._get_schema() is ModelImpl._get_schema()
+        assert isinstance(ModelImpl._get_schema(), SchemaImpl)
+        assert not ModelImpl._get_schema()._flat
+
+    def test_flat_schema(self):
+        schema = FlatModelImpl._get_schema()
+        assert schema._flat
+
+        model = FlatModelImpl(name="model", count=3, extra={"key": [1]}, flag=False)
+        serialized = model.serialize()
+        assert serialized == Schema.dump(schema, model)
+        assert serialized == {
+            "@name": "model",
+            "count": 3,
+            "extra": {"key": [1]},
+            "flag": False,
+        }
+
+        loaded = FlatModelImpl.deserialize(dict(serialized, unknown="value"))
+        assert loaded.__dict__ == model.__dict__
+        assert FlatModelImpl.deserialize(json.dumps(serialized)).name == "model"
+
+        for data in ({"count": -1, "@name": "model"}, {"count": "many"}):
+            with self.assertRaises(ValidationError) as context:
+                schema.load(data)
+            with self.assertRaises(ValidationError) as expected:
+                Schema.load(schema, dict(data))
+            assert context.exception.messages == expected.exception.messages
@@ -4,6 +4,7 @@ from asynctest import TestCase as AsyncTestCase, mock as async_mock
 from marshmallow import EXCLUDE, fields
 
 from ....cache.base import BaseCache
+from ....cache.records import RecordCache
 from ....config.injection_context import InjectionContext
 from ....storage.base import BaseStorage, StorageDuplicateError, StorageRecord
 from ....storage.basic import BasicStorage
@@ -150,6 +151,32 @@ class TestBaseRecord(AsyncTestCase):
             assert result._id == record_id
             assert result.value == stored
 
+    async def test_retrieve_record_cache(self):
+        context = InjectionContext(enforce_typing=False)
+        storage = BasicStorage()
+        context.injector.bind_instance(BaseStorage, storage)
+        record_cache = RecordCache()
+        context.injector.bind_instance(RecordCache, record_cache)
+        record = BaseRecordImpl(state="one")
+        record_id = await record.save(context)
+
+        found = await BaseRecordImpl.retrieve_by_id(context, record_id)
+        with async_mock.patch.object(
+            storage, "get_record", async_mock.CoroutineMock()
+        ) as get_record:
+            cached = await BaseRecordImpl.retrieve_by_id(context, record_id)
+            get_record.assert_not_called()
+        assert cached == found and cached is not found
+        cached.state = "changed"
+        assert (await BaseRecordImpl.retrieve_by_id(context, record_id)).state == "one"
+
+        record.state = "two"
+        await record.save(context)
+        assert (await BaseRecordImpl.retrieve_by_id(context, record_id)).state == "two"
+
+        await record.delete_record(context)
+        assert not await record_cache.get(BaseRecordImpl.cache_key(record_id))
+
     async def test_retrieve_by_tag_filter_multi_x_delete(self):
         context = InjectionContext(enforce_typing=False)
         basic_storage = BasicStorage()
@@ -229,6 +256,27 @@ class TestBaseRecord(AsyncTestCase):
         assert result[0]._id == record_id
         assert result[0].value == record_value
 
+    async def test_query_page(self):
+        context = InjectionContext(enforce_typing=False)
+        basic_storage = BasicStorage()
+        context.injector.bind_instance(BaseStorage, basic_storage)
+        for i in range(6):
+            await ARecordImpl(a=str(i % 2), b=str(i), code="one").save(context)
+
+        result = await ARecordImpl.query(context, {"code": "one"}, limit=2, offset=3)
+        assert [rec.b for rec in result] == ["3", "4"]
+
+        result = await ARecordImpl.query(
+            context, {"code": "one"}, {"a": "1"}, limit=2, offset=1
+        )
+        assert [rec.b for rec in result] == ["3", "5"]
+
+        result = await ARecordImpl.query(context, None, None, {"a": "1"}, offset=1)
+        assert [rec.b for rec in result] == ["2", "4"]
+
+        records = ARecordImpl.query_iter(context, limit=4)
+        assert [rec.b async for rec in records] == ["0", "1", "2", "3"]
+
     @async_mock.patch("builtins.print")
     def test_log_state(self, mock_print):
         test_param = "test.log"
@@ -0,0 +1,119 @@
+from aiohttp import ClientPayloadError, web
+from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop
+from asynctest import mock as async_mock
+from marshmallow import EXCLUDE, fields
+
+from ....config.injection_context import InjectionContext
+from ....storage.base import BaseStorage
+from ....storage.basic import BasicStorage, BasicStorageRecordSearch
+from ....storage.error import StorageSearchError
+
+from ..base_record import BaseRecord, BaseRecordSchema
+from ..paging import page_params, stream_results
+from .. import paging as test_module
+
+
+class PagedRecordImpl(BaseRecord):
+    class Meta:
+        schema_class = "PagedRecordImplSchema"
+
+    RECORD_TYPE = "paged-record"
+    RECORD_ID_NAME = "ident"
+
+    def __init__(self, *, ident=None, label=None, **kwargs):
+        super().__init__(ident, **kwargs)
+        self.label = label
+
+    @property
+    def record_value(self) -> dict:
+        return {"label": self.label}
+
+
+class PagedRecordImplSchema(BaseRecordSchema):
+    class Meta:
+        model_class = PagedRecordImpl
+        unknown = EXCLUDE
+
+    label = fields.Str()
+
+
+class TestPaging(AioHTTPTestCase):
+    async def get_application(self):
+        self.context = InjectionContext(enforce_typing=False)
+        self.storage = BasicStorage()
+        self.context.injector.bind_instance(BaseStorage, self.storage)
+        app = web.Application()
+        app.add_routes([web.get("/records", self.list_route)])
+        return app
+
+    async def list_route(self, request):
+        limit, offset = page_params(request)
+        records = PagedRecordImpl.query_iter(self.context, limit=limit, offset=offset)
+        try:
+            return await stream_results(request, records)
+        except StorageSearchError as err:
+            raise web.HTTPBadRequest(reason=str(err)) from err
+
+    @unittest_run_loop
+    async def test_stream_results(self):
+        for i in range(5):
+            await PagedRecordImpl(label=str(i)).save(self.context)
+
+        response = await self.client.get("/records", params={"limit": 2, "offset": 1})
+        assert response.headers["Content-Type"] == "application/json"
+        results = (await response.json())["results"]
+        assert [result["label"] for result in results] == ["1", "2"]
+
+        response = await self.client.get("/records", params={"offset": 5})
+        assert await response.json() == {"results": []}
+
+    @unittest_run_loop
+    async def test_stream_results_chunked(self):
+        for i in range(30):
+            await PagedRecordImpl(label=str(i) * 100).save(self.context)
+
+        test_module.STREAM_CHUNK_SIZE, chunk_size = 500, test_module.STREAM_CHUNK_SIZE
+        try:
+            response = await self.client.get("/records", params={"limit": 25})
+            results = (await response.json())["results"]
+        finally:
+            test_module.STREAM_CHUNK_SIZE = chunk_size
+        assert [result["label"] for result in results] == [
+            str(i) * 100 for i in range(25)
+        ]
+
+    @unittest_run_loop
+    async def test_stream_results_error(self):
+        with async_mock.patch.object(
+            BasicStorageRecordSearch,
+            "open",
+            async_mock.CoroutineMock(side_effect=StorageSearchError()),
+        ):
+            response = await self.client.get("/records", params={"limit": 2})
+        assert response.status == 400
+
+    @unittest_run_loop
+    async def test_stream_results_error_streaming(self):
+        for i in range(5):
+            await PagedRecordImpl(label=str(i)).save(self.context)
+
+        serialize = PagedRecordImpl.serialize
+
+        def fail_late(record, *args, **kwargs):
+            if record.label == "3":
+                raise StorageSearchError()
+            return serialize(record, *args, **kwargs)
+
+        with async_mock.patch.object(PagedRecordImpl, "serialize", fail_late):
+            response = await self.client.get("/records", params={"limit": 5})
+            assert response.status == 200
+            with self.assertRaises(ClientPayloadError):
+                await response.read()
+
+        with async_mock.patch.object(
+            PagedRecordImpl,
+            "serialize",
+            async_mock.MagicMock(side_effect=StorageSearchError()),
+        ):
+            response = await self.client.get("/records", params={"limit": 5})
+        assert response.status == 400
@@ -1,9 +1,12 @@
 from aries_cloudagent.aathcf.utils import build_context, run_standalone_async
 from aries_cloudagent.aathcf.credentials import assert_type, assert_type_or
 from aries_cloudagent.storage.error import StorageNotFoundError
+from aries_cloudagent.utils.stats import Collector, Timer
 from .base import BasePDS
+from .cache import PDSCache
 from .error import PDSError, PDSNotFoundError, PDSRecordNotFoundError
 from .models.saved_personal_storage import SavedPDS
+import asyncio
 import hashlib
 import multihash
 import logging
@@ -16,6 +19,24 @@ from collections import OrderedDict
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_FAN_OUT = 10
+
+
+def pds_get_fan_out(context) -> int:
+    """Maximum number of concurrent requests made to a PDS by bulk helpers."""
+    return int(context.settings.get("personal_storage_fan_out") or DEFAULT_FAN_OUT)
+
+
+async def gather_limited(limit: int, coros) -> list:
+    """Await coroutines concurrently, at most limit at a time, keeping order."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*[run(coro) for coro in coros])
+
 
 async def match_save_save_record_id(context, record_id, pds_name):
     match_table = DriStorageMatchTable(record_id, pds_name)
@@ -28,12 +49,10 @@ async def match_table_query_id(context, id):
         match = await DriStorageMatchTable.retrieve_by_id(context, id)
     except StorageNotFoundError as err:
         LOGGER.error(
-            f"table_that_matches_plugins_with_ids id that matches with None value\n",
-            f"input id: {id}\n",
-            f"ERROR: {err.roll_up}",
+            "table_that_matches_plugins_with_ids has no record for id: %s, ERROR: %s",
+            id,
+            err.roll_up,
         )
-        debug_all_records = await DriStorageMatchTable.query(context)
-        LOGGER.error("All records in table: ", debug_all_records)
         raise PDSNotFoundError(err)
 
     return match
@@ -60,13 +79,57 @@ async def pds_get_active(context):
     return pds
 
 
+async def pds_get_cache(context) -> PDSCache:
+    cache: PDSCache = await context.inject(PDSCache, required=False)
+    return cache
+
+
+async def pds_cache_payload(context, id: str, payload):
+    cache = await pds_get_cache(context)
+    if cache is not None:
+        cache.set(id, payload)
+
+
 async def pds_load(context, id: str, *, with_meta: bool = False) -> dict:
+    """
+    Load a payload.
+
+    DRIs are content hashes so without meta the result is served
+    from the PDSCache when one is configured.
+    """
     assert_type(id, str)
 
+    cache = None if with_meta else await pds_get_cache(context)
+    if cache is None:
+        return await pds_load_uncached(context, id, with_meta=with_meta)
+
+    collector: Collector = await context.inject(Collector, required=False)
+    start = Timer.now()
+    result = cache.get(id)
+    if result is None:
+        result = await pds_load_uncached(context, id)
+        cache.set(id, result)
+        group = "pds_load:cache_miss"
+    else:
+        group = "pds_load:cache_hit"
+    if collector:
+        collector.log(group, Timer.now() - start, start)
+
+    return result
+
+
+async def pds_load_uncached(context, id: str, *, with_meta: bool = False) -> dict:
     match = await match_table_query_id(context, id)
     pds = await pds_get_by_name(context, match.pds_type)
-    result = await pds.load(id)
+    result = pds_decode_content(await pds.load(id))
+
+    if with_meta:
+        return result
+    else:
+        return result["content"]
+
 
+def pds_decode_content(result: dict) -> dict:
     try:
         result["content"] = json.loads(result["content"], object_pairs_hook=OrderedDict)
     except json.JSONDecodeError:
@@ -74,10 +137,51 @@ async def pds_load(context, id: str, *, with_meta: bool = False) -> dict:
     except TypeError:
         pass
 
-    if with_meta:
-        return result
-    else:
-        return result["content"]
+    return result
+
+
+async def pds_load_many(context, ids: list, *, fan_out: int = None) -> dict:
+    """
+    Load the content of many payloads, returns a dict of id -> content.
+
+    Repeated ids are fetched once, cached payloads are not fetched at all,
+    the rest is loaded concurrently or with a single "load_many" call
+    when the PDS supports bulk reads.
+    """
+    fan_out = fan_out or pds_get_fan_out(context)
+    cache = await pds_get_cache(context)
+    result = {}
+    missing = []
+    for id in dict.fromkeys(ids):
+        assert_type(id, str)
+        content = cache.get(id) if cache is not None else None
+        if content is None:
+            missing.append(id)
+        else:
+            result[id] = content
+
+    matches = await gather_limited(
+        fan_out, [match_table_query_id(context, id) for id in missing]
+    )
+    ids_by_pds = {}
+    for id, match in zip(missing, matches):
+        ids_by_pds.setdefault(tuple(match.pds_type), []).append(id)
+
+    for pds_name, pds_ids in ids_by_pds.items():
+        pds = await pds_get_by_name(context, pds_name)
+        if hasattr(pds, "load_many"):
+            loaded = await pds.load_many(pds_ids)
+        else:
+            loaded = await gather_limited(fan_out, [pds.load(id) for id in pds_ids])
+            loaded = dict(zip(pds_ids, loaded))
+
+        for id in pds_ids:
+            content = pds_decode_content(loaded[id])["content"]
+            if cache is not None:
+                cache.set(id, content)
+            result[id] = content
+
+    return result
 
 
 async def pds_link_dri(context, dri, link_with_dris):
@@ -162,6 +266,7 @@ async def pds_save(context, payload, metadata: str = "{}") -> str:
     pds = await pds_get_by_name(context, active_pds_name)
     payload_id = await pds.save(payload, json.loads(metadata))
     payload_id = await match_save_save_record_id(context, payload_id, active_pds_name)
+    await pds_cache_payload(context, payload_id, payload)
 
     return payload_id
 
@@ -176,19 +281,48 @@ async def pds_save_a(
     pds = await pds_get_by_name(context, active_pds_name)
     payload_id = await pds.save(payload, meta)
     payload_id = await match_save_save_record_id(context, payload_id, active_pds_name)
+    await pds_cache_payload(context, payload_id, payload)
 
     return payload_id
 
 
+async def pds_save_many(context, payloads: list) -> list:
+    """
+    Save many payloads in the active PDS with a single save_many call.
+
+    Args:
+        payloads: list of (payload, metadata dict) tuples
+
+    Returns: ids of the saved payloads, in the same order
+    """
+    for payload, metadata in payloads:
+        assert_type_or(payload, str, dict)
+        assert_type(metadata, dict)
+
+    active_pds_name = await pds_get_active_name(context)
+    pds = await pds_get_by_name(context, active_pds_name)
+    payload_ids = await pds.save_many(payloads)
+    await DriStorageMatchTable.save_many(context, payload_ids, active_pds_name)
+    for payload_id, (payload, _) in zip(payload_ids, payloads):
+        await pds_cache_payload(context, payload_id, payload)
+
+    return payload_ids
+
+
 async def load_multiple(context, *, table: str = None, oca_schema_base_dri=None):
     """ Load multiple records, if oca_schema_base_dri is a list then returns a dictionary"""
     pds = await pds_get_active(context)
     if isinstance(oca_schema_base_dri, list):
-        result = {}
-        for dri in oca_schema_base_dri:
-            result[dri] = await pds.load_multiple(table=table, oca_schema_base_dri=dri)
-            result[dri] = json.loads(result[dri])
-        return result
+        loaded = await gather_limited(
+            pds_get_fan_out(context),
+            [
+                pds.load_multiple(table=table, oca_schema_base_dri=dri)
+                for dri in oca_schema_base_dri
+            ],
+        )
+        return {
+            dri: json.loads(result) for dri, result in zip(oca_schema_base_dri, loaded)
+        }
 
     else:
         result = await pds.load_multiple(
@@ -205,6 +339,10 @@ async def delete_record(context, id: str) -> str:
     pds = await pds_get_by_name(context, match.pds_type)
     result = await pds.delete(id)
 
+    cache = await pds_get_cache(context)
+    if cache is not None:
+        cache.clear(id)
+
     return result
 
 
@@ -231,37 +369,81 @@ def encode(data: str) -> str:
 
 async def pds_oca_data_format_save(context, data):
     ids_of_saved_schemas = {}
+    to_save = []
     for oca_schema_base_dri in data:
         if oca_schema_base_dri.startswith("DRI:"):
-            payload_id = await pds_save_a(
-                context,
-                data[oca_schema_base_dri],
-                oca_schema_dri=oca_schema_base_dri[4:],
-            )
-            ids_of_saved_schemas[oca_schema_base_dri] = payload_id
+            to_save.append(oca_schema_base_dri)
+            ids_of_saved_schemas[oca_schema_base_dri] = None
         else:
             ids_of_saved_schemas[
                 oca_schema_base_dri
             ] = "Invalid format, DRIs should start with 'DRI:'"
 
-    return ids_of_saved_schemas
+    if to_save:
+        payload_ids = await pds_save_many(
+            context,
+            [
+                (
+                    data[oca_schema_base_dri],
+                    {"table": None, "oca_schema_dri": oca_schema_base_dri[4:]},
+                )
+                for oca_schema_base_dri in to_save
+            ],
+        )
+        ids_of_saved_schemas.update(zip(to_save, payload_ids))
 
+    return ids_of_saved_schemas
 
-async def pds_oca_data_format_serialize_item_recursive(context, key, val):
-    new_val = val
-    if isinstance(val, dict):
-        new_val = await pds_oca_data_format_serialize_dict_recursive(context, val)
-    elif val.startswith("DRI:"):
-        new_val = await pds_load(context, val[4:])
-        new_val = await pds_oca_data_format_serialize_dict_recursive(context, new_val)
-    return new_val
 
+def pds_oca_data_format_collect_references(dct, ancestors, references) -> dict:
+    """
+    Copy one level of OCA data, collecting the "DRI:" references in it.
 
-async def pds_oca_data_format_serialize_dict_recursive(context, dct):
+    References to an ancestor are cycles, those are left unresolved.
+    """
     new_dict = {}
-    for k, v in dct.items():
-        new_dict[k] = await pds_oca_data_format_serialize_item_recursive(context, k, v)
+    for key, val in dct.items():
+        if isinstance(val, dict):
+            new_dict[key] = pds_oca_data_format_collect_references(
+                val, ancestors, references
+            )
+            continue
+
+        new_dict[key] = val
+        if isinstance(val, str) and val.startswith("DRI:"):
+            if val[4:] in ancestors:
+                LOGGER.warning("Cycle in OCA data, %s is not resolved", val)
+            else:
+                references.append((new_dict, key, val[4:], ancestors))
+
     return new_dict
 
 
+async def pds_oca_data_format_serialize_dict_recursive(
+    context, dct, *, fan_out: int = None
+):
+    """
+    Replace the "DRI:" references in OCA data with the linked payloads.
+
+    References are resolved level by level, all references of a level
+    are loaded together with pds_load_many.
+    """
+    references = []
+    result = pds_oca_data_format_collect_references(dct, frozenset(), references)
+    while references:
+        loaded = await pds_load_many(
+            context, [dri for (_, _, dri, _) in references], fan_out=fan_out
+        )
+        level, references = references, []
+        for container, key, dri, ancestors in level:
+            payload = loaded[dri]
+            if isinstance(payload, dict):
+                payload = pds_oca_data_format_collect_references(
+                    payload, ancestors | {dri}, references
+                )
+            container[key] = payload
+
+    return result
+
+
 run_standalone_async(__name__, __test_pds_link)
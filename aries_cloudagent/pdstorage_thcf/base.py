@@ -10,6 +10,14 @@ class BasePDS(ABC):
     async def save(self, record, metadata: dict) -> str:
         """Returns: saved data id, (should maybe return None on key not found?)."""
 
+    async def save_many(self, records: list) -> list:
+        """
+        Save many records, records is a list of (record, metadata) tuples.
+
+        Returns: saved data ids in the same order as records.
+        """
+        return [await self.save(record, metadata) for record, metadata in records]
+
     @abstractmethod
     async def load(self, id: str) -> str:
         """Returns: data represented by id."""
@@ -29,6 +37,9 @@ class BasePDS(ABC):
         connected, exception = await personal_storage.ping()
         """
 
+    async def close(self):
+        """Release network resources held by the storage, called on shutdown."""
+
     def __repr__(self) -> str:
         """
         Return a human readable representation of this class.
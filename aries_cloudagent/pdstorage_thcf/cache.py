@@ -0,0 +1,97 @@
+"""In-memory cache of personal data storage payloads keyed by DRI."""
+
+import json
+import sys
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 16 << 20
+
+
+class PDSCache:
+    """
+    Byte-size bounded LRU cache of PDS payloads.
+
+    DRIs are content hashes so a cached payload never goes stale, entries
+    only leave the cache when it is full or when the record is deleted.
+    Payloads are kept serialized, every hit decodes a fresh copy so callers
+    can freely modify what they get back.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize a `PDSCache` instance."""
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # looks like { "dri": (<serialized payload>, <byte size>) }
+        self._entries = OrderedDict()
+
+    def get(self, dri: str):
+        """
+        Fetch a payload from the cache.
+
+        Returns:
+            The decoded payload or `None`
+
+        """
+        entry = self._entries.get(dri)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(dri)
+        self.hits += 1
+        text, _size = entry
+        try:
+            return json.loads(text, object_pairs_hook=OrderedDict)
+        except json.JSONDecodeError:
+            return text
+
+    def set(self, dri: str, payload):
+        """Add a payload (string or dict) to the cache, evicting old entries."""
+        if payload is None:
+            return
+        if isinstance(payload, str):
+            text = payload
+        else:
+            try:
+                text = json.dumps(payload)
+            except TypeError:
+                return
+        size = sys.getsizeof(text)
+        if size > self.max_bytes:
+            return
+
+        self.clear(dri)
+        self._entries[dri] = (text, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _dri, (_text, old_size) = self._entries.popitem(last=False)
+            self.size -= old_size
+            self.evictions += 1
+
+    def clear(self, dri: str):
+        """Remove a payload from the cache, if present."""
+        entry = self._entries.pop(dri, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def flush(self):
+        """Remove all payloads from the cache."""
+        self._entries.clear()
+        self.size = 0
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size": self.size,
+        }
+
+    def __contains__(self, dri: str) -> bool:
+        """Check if a DRI is cached without touching the LRU order."""
+        return dri in self._entries
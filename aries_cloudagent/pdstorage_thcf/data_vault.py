@@ -1,6 +1,13 @@
 from .base import BasePDS
 from .error import PDSNotFoundError, PDSError, PDSRecordNotFoundError
-from aiohttp import ClientSession, FormData, ClientConnectionError, ClientError
+from aiohttp import (
+    ClientSession,
+    FormData,
+    ClientConnectionError,
+    ClientError,
+    TCPConnector,
+)
+import asyncio
 import json
 import logging
 from collections import OrderedDict
@@ -8,6 +15,7 @@ from collections import OrderedDict
 LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/v1/files"
+SAVE_MANY_LIMIT_PER_HOST = 10
 
 
 class DataVault(BasePDS):
@@ -53,19 +61,29 @@ class DataVault(BasePDS):
         return {"content": response_text}
 
     async def save(self, record: str, metadata: str) -> str:
+        async with ClientSession() as session:
+            return await self.post_record(session, record)
+
+    async def save_many(self, records: list) -> list:
+        """Save many records concurrently over one session."""
+        connector = TCPConnector(limit_per_host=SAVE_MANY_LIMIT_PER_HOST)
+        async with ClientSession(connector=connector) as session:
+            return await asyncio.gather(
+                *[self.post_record(session, record) for record, _ in records]
+            )
+
+    async def post_record(self, session: ClientSession, record: str) -> str:
         data = FormData()
         data.add_field("file", record, filename="data", content_type="application/json")
         url = f"{self.settings['api_url']}{API_ENDPOINT}"
         LOGGER.info(
             f"""DataVault.save:
                 url: {url}
-                id: {id}
                 settings: {self.settings}
             """
         )
 
-        async with ClientSession() as session:
-            response = await session.post(url=url, data=data)
+        async with session.post(url=url, data=data) as response:
             response_text = await response.text()
 
         return response_text
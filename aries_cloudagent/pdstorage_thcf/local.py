@@ -22,6 +22,9 @@ class LocalPDS(BasePDS):
 
         return {"content": result}
 
+    async def load_many(self, ids: list) -> dict:
+        return {id: {"content": self.storage.get(id)} for id in ids}
+
     async def save(self, record, metadata: dict) -> str:
         dri_value = None
         if isinstance(record, str):
@@ -5,8 +5,81 @@ from aries_cloudagent.messaging.util import time_now
 from aries_cloudagent.storage.error import StorageDuplicateError
 from ...config.injection_context import InjectionContext
 from typing import Any, Mapping, Sequence, Union
+from collections import OrderedDict
+import asyncio
+import json
 import uuid
 
+DEFAULT_INDEX_SIZE = 100000
+
+
+class DriStorageMatchIndex:
+    """
+    In-memory index of the DRI -> PDS mapping, backed by storage.
+
+    The table is loaded on first use, up to max_entries rows, after which
+    the least recently used rows are dropped. A DRI missing from the index
+    is looked up in storage, as the storage may be shared with other agent
+    processes writing rows this index has not seen.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_INDEX_SIZE):
+        """Initialize a `DriStorageMatchIndex` instance."""
+        self.max_entries = max_entries
+        self.loaded = False
+        self._entries = OrderedDict()
+        self._load_lock = asyncio.Lock()
+
+    async def load(self, context: InjectionContext):
+        """Load the table from storage, only the first call does any work."""
+        if self.loaded:
+            return
+        async with self._load_lock:
+            if self.loaded:
+                return
+            storage: BaseStorage = await context.inject(BaseStorage)
+            search = storage.search_records(
+                DriStorageMatchTable.RECORD_TYPE, None, None, {"retrieveTags": False}
+            )
+            async for record in search:
+                if len(self._entries) >= self.max_entries:
+                    break
+                vals = json.loads(record.value)
+                self._entries.setdefault(
+                    record.id,
+                    (
+                        tuple(vals.get("pds_type")),
+                        vals.get("created_at"),
+                        vals.get("updated_at"),
+                    ),
+                )
+            await search.close()
+            self.loaded = True
+
+    def get(self, dri: str):
+        """
+        Fetch the row of a DRI, `None` if it is not in the index.
+
+        Returns:
+            A tuple of the PDS type, created_at and updated_at
+
+        """
+        entry = self._entries.get(dri)
+        if entry is not None:
+            self._entries.move_to_end(dri)
+        return entry
+
+    def add(self, dri: str, pds_type, created_at: str = None, updated_at: str = None):
+        """Add or refresh the row of a DRI."""
+        self._entries[dri] = (tuple(pds_type), created_at, updated_at)
+        self._entries.move_to_end(dri)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def remove(self, dri: str):
+        """Remove a DRI from the index, if present."""
+        self._entries.pop(dri, None)
+
 
 class DriStorageMatchTable(BaseRecord):
     RECORD_ID_NAME = "dri"
@@ -21,7 +94,11 @@ class DriStorageMatchTable(BaseRecord):
         pds_type: tuple,
         **keywordArgs,
     ):
-        super().__init__(dri)
+        super().__init__(
+            dri,
+            created_at=keywordArgs.get("created_at"),
+            updated_at=keywordArgs.get("updated_at"),
+        )
         self.pds_type = pds_type
 
     @property
@@ -50,12 +127,17 @@ class DriStorageMatchTable(BaseRecord):
         log_reason = reason or ("Updated record" if self._id else "Created record")
         try:
             self.updated_at = time_now()
+            self.created_at = self.created_at or self.updated_at
             storage: BaseStorage = await context.inject(BaseStorage)
-            
+
             await storage.add_record(self.storage_record)
             new_record = True
         except StorageDuplicateError:
             return self._id
+        else:
+            index = await context.inject(DriStorageMatchIndex, required=False)
+            if index is not None:
+                index.add(self._id, self.pds_type, self.created_at, self.updated_at)
         finally:
             params = {self.RECORD_TYPE: self.serialize()}
             if log_params:
@@ -69,6 +151,74 @@ class DriStorageMatchTable(BaseRecord):
 
         return self._id
 
+    @classmethod
+    async def save_many(
+        cls, context: InjectionContext, dris: Sequence[str], pds_type: tuple
+    ) -> Sequence[str]:
+        """Persist the rows of many DRIs saved in the same PDS.
+
+        Each row is still its own storage write, as storage has no bulk insert;
+        this only saves building and logging a record per DRI. Rows that already
+        exist are left as they are, no webhooks are sent.
+
+        Args:
+            context: The injection context to use
+            dris: The DRIs to persist
+            pds_type: The PDS the DRIs were saved in
+        """
+        storage: BaseStorage = await context.inject(BaseStorage)
+        index = await context.inject(DriStorageMatchIndex, required=False)
+        updated_at = time_now()
+        for dri in dict.fromkeys(dris):
+            record = cls(dri, pds_type)
+            record.created_at = record.updated_at = updated_at
+            try:
+                await storage.add_record(record.storage_record)
+            except StorageDuplicateError:
+                continue
+            if index is not None:
+                index.add(dri, pds_type, updated_at, updated_at)
+
+        return dris
+
+    @classmethod
+    async def retrieve_by_id(
+        cls, context: InjectionContext, record_id: str, cached: bool = True
+    ) -> "DriStorageMatchTable":
+        """Retrieve a row by DRI, from the DriStorageMatchIndex when one is bound.
+
+        Args:
+            context: The injection context to use
+            record_id: The DRI to find
+            cached: Whether to check the index for this record
+        """
+        index = await context.inject(DriStorageMatchIndex, required=False)
+        if index is None or not cached:
+            return await super().retrieve_by_id(context, record_id, cached)
+
+        await index.load(context)
+        entry = index.get(record_id)
+        if entry is not None:
+            pds_type, created_at, updated_at = entry
+            return cls(
+                record_id, pds_type, created_at=created_at, updated_at=updated_at
+            )
+
+        record = await super().retrieve_by_id(context, record_id, cached)
+        index.add(record_id, record.pds_type, record.created_at, record.updated_at)
+        return record
+
+    async def delete_record(self, context: InjectionContext):
+        """Remove the stored row and its index entry.
+
+        Args:
+            context: The injection context to use
+        """
+        await super().delete_record(context)
+        index = await context.inject(DriStorageMatchIndex, required=False)
+        if index is not None:
+            index.remove(self._id)
+
 
 class DriStorageMatchTableSchema(BaseRecordSchema):
     class Meta:
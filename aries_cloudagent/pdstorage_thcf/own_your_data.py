@@ -3,17 +3,25 @@ from .base import BasePDS
 from .api import encode
 from .error import PDSError, PDSRecordNotFoundError
 
+import asyncio
 import json
 import logging
 from urllib.parse import urlparse
 
-from aiohttp import ClientSession, ClientConnectionError, ClientError
+from aiohttp import ClientSession, ClientConnectionError, ClientError, TCPConnector
 from aries_cloudagent.aathcf.credentials import assert_type, assert_type_or
 import time
 
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 20
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+DEFAULT_TOKEN_REFRESH_MARGIN = 60.0
+DEFAULT_TOKEN_REFRESH_RETRY = 30.0
+USAGE_POLICY_PARSE_URL = "https://governance.ownyourdata.eu/api/usage-policy/parse"
+
 
 def map_parsed_usage_policy(usage_policy, map_against):
     new_base = {}
@@ -69,6 +77,54 @@ class OwnYourDataVault(BasePDS):
             "oca_schema_namespace": "pds",
             "oca_schema_dri": "9bABtmHu628Ss4oHmyTU5gy7QB1VftngewTmh7wdmN1j",
         }
+        self.client_session: ClientSession = None
+        self.token_refresh_task: asyncio.Future = None
+        self.token_refresh_handle: asyncio.TimerHandle = None
+        self.background_refresh_task: asyncio.Future = None
+        self.usage_policy_task: asyncio.Future = None
+        self.usage_policy_etag = None
+        self.usage_policy_uploaded = False
+
+    def get_client_session(self) -> ClientSession:
+        """
+        Return the pooled client session, creating it on first use.
+
+        Connections are kept alive between calls, limits can be tuned
+        through "connection_limit", "connection_limit_per_host"
+        and "keepalive_timeout" settings.
+        """
+        if self.client_session is None or self.client_session.closed:
+            connector = TCPConnector(
+                limit=int(
+                    self.settings.get("connection_limit", DEFAULT_CONNECTION_LIMIT)
+                ),
+                limit_per_host=int(
+                    self.settings.get(
+                        "connection_limit_per_host", DEFAULT_CONNECTION_LIMIT_PER_HOST
+                    )
+                ),
+                keepalive_timeout=float(
+                    self.settings.get("keepalive_timeout", DEFAULT_KEEPALIVE_TIMEOUT)
+                ),
+            )
+            self.client_session = ClientSession(connector=connector)
+        return self.client_session
+
+    async def close(self):
+        for task in (
+            self.background_refresh_task,
+            self.token_refresh_task,
+            self.usage_policy_task,
+        ):
+            if task is not None and not task.done():
+                task.cancel()
+        if self.client_session is not None:
+            await self.client_session.close()
+            self.client_session = None
+        # after the tasks, a cancelled background refresh schedules a retry
+        if self.token_refresh_handle is not None:
+            self.token_refresh_handle.cancel()
+            self.token_refresh_handle = None
 
     async def get_usage_policy(self):
         if self.settings.get("usage_policy") is None:
@@ -77,6 +133,19 @@ class OwnYourDataVault(BasePDS):
         return self.settings["usage_policy"]
 
     async def update_token(self):
+        """Refresh the token and then check if the usage policy changed."""
+        await self.refresh_token()
+        await self.update_usage_policy()
+
+    async def refresh_token(self):
+        """Request a new token, concurrent callers share a single request."""
+        task = self.token_refresh_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self.request_token())
+            self.token_refresh_task = task
+        await asyncio.shield(task)
+
+    async def request_token(self):
         parsed_url = urlparse(self.settings.get("api_url"))
         self.api_url = "{url.scheme}://{url.netloc}".format(url=parsed_url)
         LOGGER.debug("API URL OYD %s", self.api_url)
@@ -93,101 +162,157 @@ class OwnYourDataVault(BasePDS):
         if client_secret is None:
             raise PDSError("Please configure the plugin, client_secret is empty")
 
-        async with ClientSession() as session:
-            body = {
-                "client_id": client_id,
-                "client_secret": client_secret,
-                "grant_type": grant_type,
-            }
-            if scope is not None:
-                body["scope"] = scope
-            result = await session.post(
-                self.api_url + "/oauth/token",
-                json=body,
-            )
-            result = await unpack_response(result)
-            token = json.loads(result)
-            self.token = token
-            self.token_timestamp = time.time()
-            LOGGER.info("update token: %s", self.token)
+        session = self.get_client_session()
+        body = {
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "grant_type": grant_type,
+        }
+        if scope is not None:
+            body["scope"] = scope
+        async with session.post(self.api_url + "/oauth/token", json=body) as response:
+            result = await unpack_response(response)
+        token = json.loads(result)
+        self.token = token
+        self.token_timestamp = time.time()
+        LOGGER.info("update token: %s", self.token)
+
+        self.schedule_token_refresh()
 
+    def schedule_token_refresh(self):
         """
-        Download the usage policy
+        Refresh the token in the background ahead of its expiry.
 
+        Requests don't have to wait for a token refresh this way.
         """
+        if self.token_refresh_handle is not None:
+            self.token_refresh_handle.cancel()
+        delay = float(self.token["expires_in"]) - float(
+            self.settings.get("token_refresh_margin", DEFAULT_TOKEN_REFRESH_MARGIN)
+        )
+        if delay > 0:
+            self.token_refresh_handle = asyncio.get_event_loop().call_later(
+                delay, self.background_token_refresh
+            )
+
+    def background_token_refresh(self):
+        self.token_refresh_handle = None
+
+        async def refresh():
+            try:
+                await self.update_token()
+            except (PDSError, ClientError, ValueError, asyncio.TimeoutError) as err:
+                LOGGER.warning("Background OYD token refresh failed: %s", err)
+            finally:
+                # retry later unless the refresh already scheduled the next one
+                if self.token_refresh_handle is None:
+                    self.token_refresh_handle = asyncio.get_event_loop().call_later(
+                        float(
+                            self.settings.get(
+                                "token_refresh_retry", DEFAULT_TOKEN_REFRESH_RETRY
+                            )
+                        ),
+                        self.background_token_refresh,
+                    )
+
+        self.background_refresh_task = asyncio.ensure_future(refresh())
+
+    async def update_usage_policy(self):
+        """Download the usage policy, concurrent callers share one download."""
+        task = self.usage_policy_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self.request_usage_policy())
+            self.usage_policy_task = task
+        await asyncio.shield(task)
+
+    async def request_usage_policy(self):
+        """
+        Download the usage policy.
 
+        The policy is parsed and uploaded as oca_schema_chunk only when it changed.
+        """
         url = f"{self.api_url}/api/meta/usage"
-        async with ClientSession() as session:
-            result = await session.get(
-                url,
-                headers={"Authorization": "Bearer " + self.token["access_token"]},
-            )
-            result = await unpack_response(result)
-            self.settings["usage_policy"] = result
-            LOGGER.debug("Usage policy %s", self.settings["usage_policy"])
+        headers = {"Authorization": "Bearer " + self.token["access_token"]}
+        if self.usage_policy_etag and self.settings.get("usage_policy") is not None:
+            headers["If-None-Match"] = self.usage_policy_etag
+
+        session = self.get_client_session()
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                LOGGER.debug("Usage policy not modified")
+                return
+            result = await unpack_response(response)
+            self.usage_policy_etag = response.headers.get("ETag")
+
+        if result == self.settings.get("usage_policy") and self.usage_policy_uploaded:
+            LOGGER.debug("Usage policy not modified")
+            return
+        self.settings["usage_policy"] = result
+        LOGGER.debug("Usage policy %s", self.settings["usage_policy"])
 
         """
         Upload usage_policy as oca_schema_chunk
         """
 
-        async with ClientSession() as session:
-            result = await session.post(
-                "https://governance.ownyourdata.eu/api/usage-policy/parse",
-                headers={"Authorization": "Bearer " + self.token["access_token"]},
-                json={"ttl": self.settings["usage_policy"]},
-            )
-            result = await unpack_response(result)
-            result = json.loads(result)
-            result, err = map_parsed_usage_policy(result, cached_schema_to_map_against)
-            await self.save(
-                result,
-                {"table": "tda.oca_chunks.H5F2YgEbXpSZjcNqAYevfGPFXSWUV1d2PnVg2ubkkKb"},
-                addition_meta={"missing": err},
-            )
+        async with session.post(
+            self.settings.get("usage_policy_parse_url", USAGE_POLICY_PARSE_URL),
+            headers={"Authorization": "Bearer " + self.token["access_token"]},
+            json={"ttl": self.settings["usage_policy"]},
+        ) as response:
+            result = await unpack_response(response)
+        result = json.loads(result)
+        result, err = map_parsed_usage_policy(result, cached_schema_to_map_against)
+        await self.save(
+            result,
+            {"table": "tda.oca_chunks.H5F2YgEbXpSZjcNqAYevfGPFXSWUV1d2PnVg2ubkkKb"},
+            addition_meta={"missing": err},
+        )
+        self.usage_policy_uploaded = True
 
     async def update_token_when_expired(self):
         time_elapsed = time.time() - (self.token_timestamp - 10)
         if time_elapsed > float(self.token["expires_in"]):
-            await self.update_token()
+            await self.refresh_token()
 
     async def load(self, dri: str) -> dict:
         assert_type(dri, str)
         await self.update_token_when_expired()
 
         url = f"{self.api_url}/api/data/{dri}?p=dri&f=plain"
-        async with ClientSession() as session:
-            result = await session.get(
-                url, headers={"Authorization": "Bearer " + self.token["access_token"]}
-            )
-            result = await unpack_response(result)
-            result_dict: dict = json.loads(result)
+        session = self.get_client_session()
+        async with session.get(
+            url, headers={"Authorization": "Bearer " + self.token["access_token"]}
+        ) as response:
+            result = await unpack_response(response)
+        result_dict: dict = json.loads(result)
 
         return result_dict
 
     async def link(self, source_dri, with_targets):
         await self.update_token_when_expired()
         body = {"source": source_dri, "targets": with_targets}
-        async with ClientSession() as session:
-            url = f"{self.api_url}/api/relation?p=dri"
-            print("url", url, "body", body)
-
-            response = await session.post(
-                url,
-                headers={"Authorization": "Bearer " + self.token["access_token"]},
-                json=body,
-            )
+        url = f"{self.api_url}/api/relation?p=dri"
+        LOGGER.debug("OYD link url %s body %s", url, body)
+
+        session = self.get_client_session()
+        async with session.post(
+            url,
+            headers={"Authorization": "Bearer " + self.token["access_token"]},
+            json=body,
+        ) as response:
             await unpack_response(response)
 
-    async def save(self, record, metadata: dict, *, addition_meta={}) -> str:
+    def prepare_save_body(self, record, metadata: dict, addition_meta={}):
         """
         meta: {
             "table" - specifies the table name into which save the data
             "oca_schema_dri"
         }
+
+        Returns: dri of the record and the body of the save request
         """
         assert_type_or(record, str, dict)
         assert_type(metadata, dict)
-        await self.update_token_when_expired()
 
         table = self.settings.get("repo")
         table = table if table is not None else "dip.data"
@@ -219,19 +344,41 @@ class OwnYourDataVault(BasePDS):
         if addition_meta:
             body.update(addition_meta)
 
-        async with ClientSession() as session:
-            url = f"{self.api_url}/api/data"
-            response = await session.post(
-                url,
-                headers={"Authorization": "Bearer " + self.token["access_token"]},
-                json=body,
-            )
+        return dri_value, body
+
+    async def post_save_body(self, body: dict):
+        url = f"{self.api_url}/api/data"
+        session = self.get_client_session()
+        async with session.post(
+            url,
+            headers={"Authorization": "Bearer " + self.token["access_token"]},
+            json=body,
+        ) as response:
             result = await unpack_response(response)
-            result = json.loads(result)
-            LOGGER.debug("Result of POST request %s", result)
+        result = json.loads(result)
+        LOGGER.debug("Result of POST request %s", result)
+
+    async def save(self, record, metadata: dict, *, addition_meta={}) -> str:
+        await self.update_token_when_expired()
+        dri_value, body = self.prepare_save_body(record, metadata, addition_meta)
+        await self.post_save_body(body)
 
         return dri_value
 
+    async def save_many(self, records: list) -> list:
+        """
+        Save many records concurrently over the pooled session.
+
+        The connector limits how many requests are in flight.
+        """
+        await self.update_token_when_expired()
+        prepared = [
+            self.prepare_save_body(record, metadata) for record, metadata in records
+        ]
+        await asyncio.gather(*[self.post_save_body(body) for _, body in prepared])
+
+        return [dri_value for dri_value, _ in prepared]
+
     async def load_multiple(
         self, *, table: str = None, oca_schema_base_dri: str = None
     ):
@@ -254,12 +401,12 @@ class OwnYourDataVault(BasePDS):
         url = url + get_delimiter(parameter_count) + "f=plain"
 
         LOGGER.info("OYD LOAD TABLE url [ %s ]", url)
-        async with ClientSession() as session:
-            result = await session.get(
-                url, headers={"Authorization": "Bearer " + self.token["access_token"]}
-            )
-            result = await unpack_response(result)
-            LOGGER.debug("OYD LOAD TABLE result: [ %s ]", result)
+        session = self.get_client_session()
+        async with session.get(
+            url, headers={"Authorization": "Bearer " + self.token["access_token"]}
+        ) as response:
+            result = await unpack_response(response)
+        LOGGER.debug("OYD LOAD TABLE result: [ %s ]", result)
 
         return result
 
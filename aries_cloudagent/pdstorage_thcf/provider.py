@@ -38,3 +38,11 @@ class PersonalDataStorageProvider(BaseProvider):
             )
 
         return self.cached_instances[storage_type]
+
+    async def close(self):
+        """Close every personal storage instance created by this provider."""
+        for instance in self.cached_instances.values():
+            try:
+                await instance.close()
+            except Exception:
+                LOGGER.exception("Error closing personal storage %s", instance)
@@ -9,7 +9,13 @@ from aiohttp_apispec import (
 from aries_cloudagent.aathcf.utils import run_standalone_async, build_context
 from marshmallow import Schema, fields
 from .base import BasePDS
-from .api import load_multiple, pds_load, pds_save_a
+from .api import (
+    gather_limited,
+    load_multiple,
+    pds_get_fan_out,
+    pds_load,
+    pds_save_a,
+)
 from .error import PDSError
 from ..connections.models.connection_record import ConnectionRecord
 from ..wallet.error import WalletError
@@ -342,12 +348,15 @@ async def get_multiple_records_for_oca_form_filling(request: web.BaseRequest):
     dri_list = dri_list.getall("oca_schema_base_dris")
     OCA_DATA_CHUNKS = "tda.oca_chunks"
 
-    result = {}
     try:
-        for dri in dri_list:
-            result[dri] = await load_multiple(
-                context, table=OCA_DATA_CHUNKS + "." + dri
-            )
+        loaded = await gather_limited(
+            pds_get_fan_out(context),
+            [
+                load_multiple(context, table=OCA_DATA_CHUNKS + "." + dri)
+                for dri in dri_list
+            ],
+        )
+        result = dict(zip(dri_list, loaded))
     except PDSError as err:
         raise web.HTTPInternalServerError(reason=err.roll_up)
 
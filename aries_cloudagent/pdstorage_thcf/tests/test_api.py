@@ -0,0 +1,102 @@
+import pytest
+from asynctest import mock as async_mock
+
+from ...aathcf.utils import build_context
+from ..api import (
+    pds_get_active,
+    pds_load,
+    pds_load_many,
+    pds_oca_data_format_save,
+    pds_oca_data_format_serialize_dict_recursive,
+    pds_save_a,
+)
+from ..cache import PDSCache
+from ..models.table_that_matches_dris_with_pds import DriStorageMatchTable
+
+
+class TestPDSApi:
+    @pytest.mark.asyncio
+    async def test_load_many(self):
+        context = await build_context("local")
+        dri1 = await pds_save_a(context, {"first": "value"})
+        dri2 = await pds_save_a(context, '{"second": "value"}')
+        cache = await context.inject(PDSCache)
+        cache.flush()
+
+        pds = await pds_get_active(context)
+        with async_mock.patch.object(
+            pds, "load_many", async_mock.CoroutineMock(wraps=pds.load_many)
+        ) as mock_load_many:
+            result = await pds_load_many(context, [dri1, dri2, dri1])
+            mock_load_many.assert_called_once_with([dri1, dri2])
+        assert result == {dri1: {"first": "value"}, dri2: {"second": "value"}}
+
+        # now both are cached
+        pds.storage.clear()
+        assert await pds_load_many(context, [dri2, dri1]) == result
+
+    @pytest.mark.asyncio
+    async def test_serialize_dict_recursive(self):
+        context = await build_context("local")
+        leaf = await pds_save_a(context, {"value": "leaf"})
+        middle = await pds_save_a(
+            context, {"first": "DRI:" + leaf, "nested": {"second": "DRI:" + leaf}}
+        )
+        data = {"top": "DRI:" + middle, "other": "DRI:" + leaf, "number": 1}
+
+        result = await pds_oca_data_format_serialize_dict_recursive(context, data)
+        assert result == {
+            "top": {
+                "first": {"value": "leaf"},
+                "nested": {"second": {"value": "leaf"}},
+            },
+            "other": {"value": "leaf"},
+            "number": 1,
+        }
+        assert data["top"] == "DRI:" + middle
+
+    @pytest.mark.asyncio
+    async def test_serialize_dict_recursive_cycle(self):
+        context = await build_context("local")
+        pds = await pds_get_active(context)
+        first = await pds_save_a(context, {"link": "DRI:second"})
+        await pds_save_a(context, {"link": "DRI:" + first})
+        # make a cycle: first -> second -> first
+        second = [dri for dri in pds.storage if dri != first][0]
+        pds.storage[first] = {"link": "DRI:" + second}
+        (await context.inject(PDSCache)).flush()
+
+        result = await pds_oca_data_format_serialize_dict_recursive(
+            context, {"start": "DRI:" + first}
+        )
+        assert result == {
+            "start": {"link": {"link": "DRI:" + first}},
+        }
+
+    @pytest.mark.asyncio
+    async def test_oca_data_format_save(self):
+        context = await build_context("local")
+        pds = await pds_get_active(context)
+        data = {
+            "DRI:first": {"t": "o", "p": {"value": "one"}},
+            "DRI:second": {"t": "o", "p": {"value": "two"}},
+            "invalid": {"t": "o", "p": {}},
+        }
+        with async_mock.patch.object(
+            pds, "save_many", async_mock.CoroutineMock(wraps=pds.save_many)
+        ) as mock_save_many, async_mock.patch.object(
+            DriStorageMatchTable,
+            "save_many",
+            async_mock.CoroutineMock(wraps=DriStorageMatchTable.save_many),
+        ) as mock_match_save_many:
+            result = await pds_oca_data_format_save(context, data)
+            mock_save_many.assert_called_once()
+            mock_match_save_many.assert_called_once()
+
+        assert result["invalid"].startswith("Invalid format")
+        assert list(result) == list(data)
+        for key in ("DRI:first", "DRI:second"):
+            (await context.inject(PDSCache)).flush()
+            assert await pds_load(context, result[key]) == data[key]
+        match = await DriStorageMatchTable.retrieve_by_id(context, result["DRI:first"])
+        assert tuple(match.pds_type) == ("local", "default")
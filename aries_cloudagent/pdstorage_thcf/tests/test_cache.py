@@ -0,0 +1,77 @@
+import sys
+
+import pytest
+
+from ...aathcf.utils import build_context
+from ...utils.stats import Collector
+from ..api import delete_record, pds_get_active, pds_load, pds_save, pds_save_a
+from ..cache import PDSCache
+
+
+class TestPDSCache:
+    def test_get_set(self):
+        cache = PDSCache()
+        assert cache.get("dri") is None
+        cache.set("dri", {"a": 1})
+        assert cache.get("dri") == {"a": 1}
+        cache.set("text", "not json")
+        assert cache.get("text") == "not json"
+        cache.set("json_text", '{"b": 2}')
+        assert cache.get("json_text") == {"b": 2}
+        assert cache.stats["hits"] == 3
+        assert cache.stats["misses"] == 1
+
+    def test_returns_copies(self):
+        cache = PDSCache()
+        cache.set("dri", {"a": 1})
+        result = cache.get("dri")
+        result["a"] = 2
+        assert cache.get("dri") == {"a": 1}
+
+    def test_lru_eviction(self):
+        entry_size = sys.getsizeof("x" * 100)
+        cache = PDSCache(max_bytes=entry_size * 2)
+        cache.set("one", "x" * 100)
+        cache.set("two", "y" * 100)
+        cache.get("one")
+        cache.set("three", "z" * 100)
+        assert "one" in cache
+        assert "two" not in cache
+        assert "three" in cache
+        assert cache.evictions == 1
+        assert cache.size == entry_size * 2
+
+        cache.set("too_big", "x" * 1000)
+        assert "too_big" not in cache
+
+        cache.clear("one")
+        assert cache.stats["entries"] == 1
+        cache.flush()
+        assert cache.stats["entries"] == 0 and cache.size == 0
+
+
+class TestPDSLoadCache:
+    @pytest.mark.asyncio
+    async def test_load_served_from_cache(self):
+        context = await build_context("local")
+        collector = Collector()
+        context.injector.bind_instance(Collector, collector)
+        pds = await pds_get_active(context)
+
+        dri = await pds_save_a(context, {"test": "value"})
+        pds.storage.clear()
+        assert await pds_load(context, dri) == {"test": "value"}
+        assert collector.results["count"]["pds_load:cache_hit"] == 1
+
+        cache = await context.inject(PDSCache)
+        cache.flush()
+        dri = await pds_save(context, '{"other": "value"}')
+        cache.flush()
+        assert await pds_load(context, dri) == {"other": "value"}
+        assert await pds_load(context, dri) == {"other": "value"}
+        assert collector.results["count"]["pds_load:cache_miss"] == 1
+        assert collector.results["count"]["pds_load:cache_hit"] == 2
+
+        pds.delete = lambda id: pds_get_active(context)
+        await delete_record(context, dri)
+        assert dri not in cache
@@ -0,0 +1,80 @@
+import pytest
+from asynctest import mock as async_mock
+
+from ...config.injection_context import InjectionContext
+from ...storage.base import BaseStorage
+from ...storage.basic import BasicStorage
+from ...storage.error import StorageNotFoundError
+from ..models.table_that_matches_dris_with_pds import (
+    DriStorageMatchIndex,
+    DriStorageMatchTable,
+)
+
+
+@pytest.fixture()
+def context():
+    context = InjectionContext(enforce_typing=False)
+    context.injector.bind_instance(BaseStorage, BasicStorage())
+    return context
+
+
+class TestDriStorageMatchIndex:
+    @pytest.mark.asyncio
+    async def test_lazy_load_and_maintain(self, context):
+        await DriStorageMatchTable("first", ("local", "default")).save(context)
+
+        index = DriStorageMatchIndex()
+        context.injector.bind_instance(DriStorageMatchIndex, index)
+        match = await DriStorageMatchTable.retrieve_by_id(context, "first")
+        assert match.pds_type == ("local", "default")
+        assert match.created_at and match.updated_at
+        assert index.loaded
+
+        await DriStorageMatchTable("second", ("local", "default")).save(context)
+        await DriStorageMatchTable.save_many(context, ["third"], ("local", "default"))
+        storage = await context.inject(BaseStorage)
+        with async_mock.patch.object(
+            storage, "get_record", async_mock.CoroutineMock()
+        ) as mock_get, async_mock.patch.object(
+            storage, "search_records", async_mock.MagicMock()
+        ) as mock_search:
+            for dri in ("second", "third"):
+                match = await DriStorageMatchTable.retrieve_by_id(context, dri)
+                assert match.pds_type == ("local", "default")
+                assert match.created_at and match.updated_at
+            mock_get.assert_not_called()
+            mock_search.assert_not_called()
+
+        # a row written by another process sharing the storage
+        other = DriStorageMatchTable("other", ("local", "default"))
+        other.created_at = other.updated_at = "2020-01-01 00:00:00Z"
+        await storage.add_record(other.storage_record)
+        found = await DriStorageMatchTable.retrieve_by_id(context, "other")
+        assert tuple(found.pds_type) == ("local", "default")
+        assert index.get("other")[0] == ("local", "default")
+        with pytest.raises(StorageNotFoundError):
+            await DriStorageMatchTable.retrieve_by_id(context, "missing")
+
+        await match.delete_record(context)
+        with pytest.raises(StorageNotFoundError):
+            await DriStorageMatchTable.retrieve_by_id(context, "third")
+
+    @pytest.mark.asyncio
+    async def test_bounded(self, context):
+        await DriStorageMatchTable.save_many(
+            context, ["first", "second", "third"], ("local", "default")
+        )
+        index = DriStorageMatchIndex(max_entries=2)
+        context.injector.bind_instance(DriStorageMatchIndex, index)
+
+        await DriStorageMatchTable.retrieve_by_id(context, "first")
+
+        # not in the index, found in storage
+        for dri in ("first", "second", "third"):
+            match = await DriStorageMatchTable.retrieve_by_id(context, dri)
+            assert tuple(match.pds_type) == ("local", "default")
+        assert index.get("first") is None
+        assert index.get("third")[0] == ("local", "default")
+
+        with pytest.raises(StorageNotFoundError):
+            await DriStorageMatchTable.retrieve_by_id(context, "missing")
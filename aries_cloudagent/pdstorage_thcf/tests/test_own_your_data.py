@@ -0,0 +1,176 @@
+import asyncio
+import json
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop
+
+from ..api import encode
+from ..error import PDSRecordNotFoundError
+from ..own_your_data import OwnYourDataVault
+
+
+class TestOwnYourDataVault(AioHTTPTestCase):
+    async def setUpAsync(self):
+        self.stored = {}
+        self.token_requests = 0
+        self.policy_requests = 0
+        self.parse_requests = 0
+        self.usage_policy = "policy"
+
+    async def get_token(self, request):
+        self.token_requests += 1
+        await asyncio.sleep(0.05)
+        return web.json_response(
+            {"access_token": f"token{self.token_requests}", "expires_in": 3600}
+        )
+
+    async def get_usage_policy(self, request):
+        self.policy_requests += 1
+        etag = f'"{self.usage_policy}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+        return web.Response(text=self.usage_policy, headers={"ETag": etag})
+
+    async def parse_usage_policy(self, request):
+        self.parse_requests += 1
+        return web.json_response({"data": [{"value": "Profile"}]})
+
+    async def save_data(self, request):
+        body = await request.json()
+        self.stored[body["dri"]] = body["content"]
+        return web.json_response({"id": len(self.stored)})
+
+    async def load_data(self, request):
+        dri = request.match_info["dri"]
+        if dri not in self.stored:
+            raise web.HTTPNotFound()
+        return web.json_response(self.stored[dri])
+
+    async def get_application(self):
+        app = web.Application()
+        app.add_routes(
+            [
+                web.post("/api/data", self.save_data),
+                web.get("/api/data/{dri}", self.load_data),
+                web.post("/oauth/token", self.get_token),
+                web.get("/api/meta/usage", self.get_usage_policy),
+                web.post("/parse", self.parse_usage_policy),
+            ]
+        )
+        return app
+
+    def make_vault(self, **settings):
+        vault = OwnYourDataVault()
+        vault.settings = settings
+        vault.api_url = f"http://localhost:{self.server.port}"
+        vault.token = {"access_token": "token", "expires_in": "3600"}
+        vault.token_timestamp = time.time()
+        return vault
+
+    @unittest_run_loop
+    async def test_save_load_reuses_session(self):
+        vault = self.make_vault()
+
+        dri = await vault.save({"test": "value"}, {})
+        assert dri == encode('{"test": "value"}')
+        session = vault.client_session
+        assert session is not None
+
+        result = await vault.load(dri)
+        assert result["content"] == {"test": "value"}
+        assert vault.client_session is session
+
+        with self.assertRaises(PDSRecordNotFoundError):
+            await vault.load("not_there")
+        assert vault.client_session is session
+
+        await vault.close()
+        assert session.closed
+        assert vault.client_session is None
+
+    @unittest_run_loop
+    async def test_connection_limits_from_settings(self):
+        vault = self.make_vault(connection_limit=7, connection_limit_per_host=3)
+        session = vault.get_client_session()
+        assert session.connector.limit == 7
+        assert session.connector.limit_per_host == 3
+        await vault.close()
+
+        # a closed vault opens a fresh session on next use
+        assert vault.get_client_session() is not session
+        await vault.close()
+
+    @unittest_run_loop
+    async def test_save_many(self):
+        vault = self.make_vault()
+        records = [({"index": i}, {"table": "test"}) for i in range(5)]
+
+        dris = await vault.save_many(records)
+        assert dris == [encode(f'{{"index": {i}}}') for i in range(5)]
+        assert set(self.stored) == set(dris)
+        await vault.close()
+
+    @unittest_run_loop
+    async def test_token_refresh_single_flight(self):
+        vault = OwnYourDataVault()
+        vault.settings = {
+            "api_url": f"http://localhost:{self.server.port}",
+            "client_id": "id",
+            "client_secret": "secret",
+        }
+        dri = encode(json.dumps({"test": "value"}))
+        self.stored[dri] = {"test": "value"}
+
+        results = await asyncio.gather(*[vault.load(dri) for _ in range(10)])
+        assert all(result == {"test": "value"} for result in results)
+        assert self.token_requests == 1
+        assert self.policy_requests == 0
+        assert vault.token["access_token"] == "token1"
+        assert vault.token_refresh_handle is not None
+
+        await vault.close()
+        assert vault.token_refresh_handle is None
+
+    @unittest_run_loop
+    async def test_background_token_refresh_timeout(self):
+        vault = OwnYourDataVault()
+        vault.settings = {"token_refresh_retry": 3600}
+
+        async def update_token():
+            raise asyncio.TimeoutError()
+
+        vault.update_token = update_token
+        vault.background_token_refresh()
+        await vault.background_refresh_task
+        assert vault.token_refresh_handle is not None
+
+        await vault.close()
+        assert vault.token_refresh_handle is None
+
+    @unittest_run_loop
+    async def test_usage_policy_only_parsed_when_changed(self):
+        vault = OwnYourDataVault()
+        vault.settings = {
+            "api_url": f"http://localhost:{self.server.port}",
+            "client_id": "id",
+            "client_secret": "secret",
+            "usage_policy_parse_url": f"http://localhost:{self.server.port}/parse",
+        }
+
+        assert await vault.get_usage_policy() == "policy"
+        assert self.parse_requests == 1
+        saved = len(self.stored)
+
+        await vault.update_token()
+        assert self.token_requests == 2
+        assert self.policy_requests == 2
+        assert self.parse_requests == 1
+        assert len(self.stored) == saved
+
+        self.usage_policy = "changed"
+        await vault.update_token()
+        assert await vault.get_usage_policy() == "changed"
+        assert self.parse_requests == 2
+
+        await vault.close()
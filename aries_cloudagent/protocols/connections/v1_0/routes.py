@@ -19,6 +19,11 @@ from ....connections.models.connection_record import (
 )
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paging import (
+    PageQueryStringSchema,
+    page_params,
+    stream_results,
+)
 from ....messaging.valid import (
     ENDPOINT,
     INDY_DID,
@@ -105,7 +110,7 @@ class ConnectionStaticResultSchema(OpenAPISchema):
     record = fields.Nested(ConnectionRecordSchema, required=True)
 
 
-class ConnectionsListQueryStringSchema(OpenAPISchema):
+class ConnectionsListQueryStringSchema(PageQueryStringSchema):
     """Parameters and validators for connections list request query string."""
 
     alias = fields.Str(description="Alias", required=False, example="Barry",)
@@ -220,6 +225,9 @@ async def connections_list(request: web.BaseRequest):
     """
     Request handler for searching connection records.
 
+    Without paging parameters all connections are returned, sorted by state and
+    age. Pages of connections are streamed in storage order.
+
     Args:
         request: aiohttp request object
 
@@ -228,6 +236,7 @@ async def connections_list(request: web.BaseRequest):
 
     """
     context = request.app["request_context"]
+    limit, offset = page_params(request)
     tag_filter = {}
     for param_name in (
         "invitation_id",
@@ -247,6 +256,11 @@ async def connections_list(request: web.BaseRequest):
         if param_name in request.query and request.query[param_name] != "":
             post_filter[param_name] = request.query[param_name]
     try:
+        if limit or offset:
+            records = ConnectionRecord.query_iter(
+                context, tag_filter, post_filter, limit=limit, offset=offset
+            )
+            return await stream_results(request, records)
         records = await ConnectionRecord.query(context, tag_filter, post_filter)
         results = [record.serialize() for record in records]
         results.sort(key=connection_sort_key)
@@ -76,6 +76,36 @@ class TestConnectionRoutes(AsyncTestCase):
                     }  # sorted
                 )
 
+    async def test_connections_list_paged(self):
+        context = RequestContext(base_context=InjectionContext(enforce_typing=False))
+        mock_req = async_mock.MagicMock()
+        mock_req.app = {
+            "request_context": context,
+        }
+        mock_req.query = {
+            "state": ConnectionRecord.STATE_ACTIVE,
+            "limit": "10",
+            "offset": "20",
+        }
+
+        with async_mock.patch.object(
+            test_module, "ConnectionRecord", autospec=True
+        ) as mock_conn_rec, async_mock.patch.object(
+            test_module, "stream_results", async_mock.CoroutineMock()
+        ) as mock_stream:
+            result = await test_module.connections_list(mock_req)
+            mock_conn_rec.query_iter.assert_called_once_with(
+                context,
+                {},
+                {"state": ConnectionRecord.STATE_ACTIVE},
+                limit=10,
+                offset=20,
+            )
+            mock_stream.assert_awaited_once_with(
+                mock_req, mock_conn_rec.query_iter.return_value
+            )
+            assert result is mock_stream.return_value
+
     async def test_connections_list_x(self):
         context = RequestContext(base_context=InjectionContext(enforce_typing=False))
         mock_req = async_mock.MagicMock()
@@ -18,6 +18,11 @@ from ....issuer.base import IssuerError
 from ....ledger.error import LedgerError
 from ....messaging.credential_definitions.util import CRED_DEF_TAGS
 from ....messaging.models.base import BaseModelError, OpenAPISchema
+from ....messaging.models.paging import (
+    PageQueryStringSchema,
+    page_params,
+    stream_results,
+)
 from ....messaging.valid import (
     INDY_CRED_DEF_ID,
     INDY_CRED_REV_ID,
@@ -53,7 +58,7 @@ from .models.credential_exchange import (
 )
 
 
-class V10CredentialExchangeListQueryStringSchema(OpenAPISchema):
+class V10CredentialExchangeListQueryStringSchema(PageQueryStringSchema):
     """Parameters and validators for credential exchange list query."""
 
     connection_id = fields.UUID(
@@ -342,6 +347,7 @@ async def credential_exchange_list(request: web.BaseRequest):
 
     """
     context = request.app["request_context"]
+    limit, offset = page_params(request)
     tag_filter = {}
     if "thread_id" in request.query and request.query["thread_id"] != "":
         tag_filter["thread_id"] = request.query["thread_id"]
@@ -352,6 +358,11 @@ async def credential_exchange_list(request: web.BaseRequest):
     }
 
     try:
+        if limit or offset:
+            records = V10CredentialExchange.query_iter(
+                context, tag_filter, post_filter, limit=limit, offset=offset
+            )
+            return await stream_results(request, records)
         records = await V10CredentialExchange.query(context, tag_filter, post_filter)
         results = [record.serialize() for record in records]
     except (StorageError, BaseModelError) as err:
@@ -42,6 +42,26 @@ class TestCredentialRoutes(AsyncTestCase):
                     {"results": [mock_cred_ex.serialize.return_value]}
                 )
 
+    async def test_credential_exchange_list_paged(self):
+        mock = async_mock.MagicMock()
+        mock.query = {"state": "dummy", "limit": "10"}
+        context = RequestContext(base_context=InjectionContext(enforce_typing=False))
+        mock.app = {
+            "request_context": context,
+        }
+
+        with async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex, async_mock.patch.object(
+            test_module, "stream_results", async_mock.CoroutineMock()
+        ) as mock_stream:
+            mock_stream.side_effect = test_module.StorageError()
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.credential_exchange_list(mock)
+            mock_cred_ex.query_iter.assert_called_once_with(
+                context, {}, {"state": "dummy"}, limit=10, offset=0
+            )
+
     async def test_credential_exchange_list_x(self):
         mock = async_mock.MagicMock()
         mock.query = {
@@ -7,8 +7,10 @@ from aiohttp_apispec import (
 )
 from aiohttp import web
 from marshmallow import fields
+import json
 import logging
 from ....messaging.models.base import OpenAPISchema
+from ....messaging.valid import NATURAL_NUM
 from .messages.credential_issue import CredentialIssue
 from aries_cloudagent.protocols.issue_credential.v1_1.messages.credential_request import (
     CredentialRequest,
@@ -19,12 +21,16 @@ from .utils import (
     retrieve_connection,
 )
 from aries_cloudagent.wallet.base import BaseWallet
+from aries_cloudagent.pdstorage_thcf.api import gather_limited, pds_save_many
 from aries_cloudagent.pdstorage_thcf.error import PDSError
 from aries_cloudagent.issuer.base import BaseIssuer, IssuerError
 
 
 LOGGER = logging.getLogger(__name__)
 
+BULK_BATCH_SIZE = 100
+BULK_SIGNING_LIMIT = 10
+
 
 class RequestCredentialSchema(OpenAPISchema):
     credential_values = fields.Dict()
@@ -35,6 +41,22 @@ class IssueCredentialQuerySchema(OpenAPISchema):
     credential_exchange_id = fields.Str(required=False)
 
 
+class IssueCredentialBulkSchema(OpenAPISchema):
+    credential_exchange_ids = fields.List(fields.Str(), required=True)
+    batch_size = fields.Int(
+        required=False,
+        description="Number of exchanges persisted and reported at once",
+        validate=NATURAL_NUM["validate"],
+        example=BULK_BATCH_SIZE,
+    )
+    signing_limit = fields.Int(
+        required=False,
+        description="Maximum number of credentials signed concurrently",
+        validate=NATURAL_NUM["validate"],
+        example=BULK_SIGNING_LIMIT,
+    )
+
+
 class RetrieveCredentialExchangeQuerySchema(OpenAPISchema):
     connection_id = fields.Str(required=False)
     thread_id = fields.Str(required=False)
@@ -50,8 +72,35 @@ async def issue_credential(request: web.BaseRequest):
     outbound_handler = request.app["outbound_message_router"]
 
     credential_exchange_id = request.query.get("credential_exchange_id")
-    exchange = await retrieve_credential_exchange(context, credential_exchange_id)
+    issuer: BaseIssuer = await context.inject(BaseIssuer)
+    exchange, connection, credential = await issue_credential_prepare(
+        context, issuer, credential_exchange_id
+    )
+
+    LOGGER.info("CREDENTIAL %s", credential)
+    issue = CredentialIssue(credential=credential)
+    issue.assign_thread_id(exchange.thread_id)
+    await outbound_handler(issue, connection_id=connection.connection_id)
+
+    exchange.state = CredentialExchangeRecord.STATE_ISSUED
+    try:
+        await exchange.issuer_credential_pds_set(context, credential)
+    except PDSError as err:
+        raise web.HTTPInternalServerError(reason=err.roll_up)
+
+    await exchange.save(context)
 
+    return web.json_response(
+        {
+            "success": True,
+            "credential_exchange_id": exchange._id,
+        }
+    )
+
+
+async def issue_credential_prepare(context, issuer: BaseIssuer, exchange_id):
+    """Check an exchange can be issued and sign its credential."""
+    exchange = await retrieve_credential_exchange(context, exchange_id)
     if exchange.role != exchange.ROLE_ISSUER:
         raise web.HTTPBadRequest(reason="Invalid exchange role")
     if exchange.state != exchange.STATE_REQUEST_RECEIVED:
@@ -59,9 +108,7 @@ async def issue_credential(request: web.BaseRequest):
 
     connection = await retrieve_connection(context, exchange.connection_id)
     request = exchange.credential_request
-
     try:
-        issuer: BaseIssuer = await context.inject(BaseIssuer)
         credential = await issuer.create_credential_ex(
             request.get("credential_values"),
             request.get("credential_type"),
@@ -71,26 +118,146 @@ async def issue_credential(request: web.BaseRequest):
         raise web.HTTPInternalServerError(
             reason=f"Error occured while creating a credential {err.roll_up}"
         )
+    return exchange, connection, credential
 
-    LOGGER.info("CREDENTIAL %s", credential)
-    issue = CredentialIssue(credential=credential)
-    issue.assign_thread_id(exchange.thread_id)
-    await outbound_handler(issue, connection_id=connection.connection_id)
 
-    exchange.state = CredentialExchangeRecord.STATE_ISSUED
+async def issue_credential_batch(
+    context, outbound_handler, exchange_ids: list, signing_limit: int
+) -> list:
+    """
+    Issue credentials for a batch of exchanges.
+
+    Credentials are signed concurrently, then saved with a single
+    personal data storage call before the exchanges are updated and
+    the credentials are sent.
+
+    Returns: a result dict for each exchange, in the same order
+    """
+    issuer: BaseIssuer = await context.inject(BaseIssuer)
+
+    async def prepare(exchange_id):
+        try:
+            return await issue_credential_prepare(context, issuer, exchange_id)
+        except web.HTTPException as err:
+            return err
+
+    prepared = await gather_limited(
+        signing_limit, [prepare(exchange_id) for exchange_id in exchange_ids]
+    )
+    results = [
+        {"credential_exchange_id": exchange_id, "success": False, "error": item.reason}
+        if isinstance(item, web.HTTPException)
+        else None
+        for exchange_id, item in zip(exchange_ids, prepared)
+    ]
+    issued = [
+        (index, item)
+        for index, item in enumerate(prepared)
+        if not isinstance(item, web.HTTPException)
+    ]
+    if not issued:
+        return results
+
     try:
-        await exchange.issuer_credential_pds_set(context, credential)
+        credential_ids = await pds_save_many(
+            context, [(credential, {}) for _, (_, _, credential) in issued]
+        )
     except PDSError as err:
-        raise web.HTTPInternalServerError(reason=err.roll_up)
+        for index, _ in issued:
+            results[index] = {
+                "credential_exchange_id": exchange_ids[index],
+                "success": False,
+                "error": err.roll_up,
+            }
+        return results
+
+    async def complete(exchange, connection, credential, credential_id):
+        result = {"success": True}
+        try:
+            # send before saving, an exchange which was not sent can be retried
+            issue = CredentialIssue(credential=credential)
+            issue.assign_thread_id(exchange.thread_id)
+            await outbound_handler(issue, connection_id=connection.connection_id)
+            exchange.credential_id = credential_id
+            exchange.state = CredentialExchangeRecord.STATE_ISSUED
+            await exchange.save(context, reason="Issue credential in bulk")
+        except Exception as err:
+            # the results are streamed, report the failure with the exchange
+            LOGGER.exception(
+                "Error completing credential exchange %s",
+                exchange.credential_exchange_id,
+            )
+            result["success"] = False
+            result["error"] = getattr(err, "roll_up", None) or str(err)
+        return result
+
+    completed = await gather_limited(
+        signing_limit,
+        [
+            complete(exchange, connection, credential, credential_id)
+            for (_, (exchange, connection, credential)), credential_id in zip(
+                issued, credential_ids
+            )
+        ],
+    )
+    for (index, _), result in zip(issued, completed):
+        results[index] = {"credential_exchange_id": exchange_ids[index], **result}
+    return results
 
-    await exchange.save(context)
 
-    return web.json_response(
-        {
-            "success": True,
-            "credential_exchange_id": exchange._id,
-        }
-    )
+@docs(
+    tags=["issue-credential"],
+    summary="Issue credentials for many exchanges",
+    description="Results are streamed back as one JSON object per line",
+)
+@request_schema(IssueCredentialBulkSchema())
+async def issue_credential_bulk(request: web.BaseRequest):
+    context = request.app["request_context"]
+    outbound_handler = request.app["outbound_message_router"]
+
+    body = await request.json()
+    exchange_ids = body.get("credential_exchange_ids")
+    if not isinstance(exchange_ids, list) or not exchange_ids:
+        raise web.HTTPBadRequest(reason="credential_exchange_ids must be a list")
+    batch_size = body.get("batch_size", BULK_BATCH_SIZE)
+    signing_limit = body.get("signing_limit", BULK_SIGNING_LIMIT)
+    for name, value in (("batch_size", batch_size), ("signing_limit", signing_limit)):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise web.HTTPBadRequest(reason=f"{name} must be a positive integer")
+
+    # an exchange is issued once, repeated ids are reported as failed
+    seen = set()
+    unique_ids = []
+    repeated = []
+    for exchange_id in exchange_ids:
+        if exchange_id in seen:
+            repeated.append(
+                {
+                    "credential_exchange_id": exchange_id,
+                    "success": False,
+                    "error": "Repeated credential exchange id",
+                }
+            )
+        else:
+            seen.add(exchange_id)
+            unique_ids.append(exchange_id)
+
+    response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+    await response.prepare(request)
+    if repeated:
+        await response.write(
+            "".join(json.dumps(result) + "\n" for result in repeated).encode()
+        )
+    for start in range(0, len(unique_ids), batch_size):
+        end = start + batch_size
+        results = await issue_credential_batch(
+            context, outbound_handler, unique_ids[start:end], signing_limit
+        )
+        await response.write(
+            "".join(json.dumps(result) + "\n" for result in results).encode()
+        )
+    await response.write_eof()
+    return response
 
 
 async def routes_get_public_did(context):
@@ -176,6 +343,7 @@ async def register(app: web.Application):
     app.add_routes(
         [
             web.post("/issue-credential/issue", issue_credential),
+            web.post("/issue-credential/issue-bulk", issue_credential_bulk),
             web.post("/issue-credential/request", request_credential),
             web.get(
                 "/issue-credential/exchange/record",
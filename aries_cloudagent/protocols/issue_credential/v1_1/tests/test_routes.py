@@ -1,14 +1,19 @@
+import json
+
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
 from aiohttp import web as aio_web
 
 from .....config.injection_context import InjectionContext
+from .....aathcf.utils import build_context
 from .....holder.base import BaseHolder
+from .....issuer.base import BaseIssuer
 from .....messaging.request_context import RequestContext
 from .....wallet.base import DIDInfo
 
 from .. import routes as test_module
+from ..models.credential_exchange import CredentialExchangeRecord
 from aries_cloudagent.storage.base import BaseStorage
 from aries_cloudagent.storage.basic import BasicStorage
 from aries_cloudagent.connections.models.connection_record import ConnectionRecord
@@ -43,3 +48,130 @@ class TestCredentialRoutes(AsyncTestCase):
 
             await test_module.request_credential(mock)
             mock_response.assert_called_once()
+
+    async def test_issue_credential_bulk(self):
+        context = await build_context("local")
+        issuer = async_mock.MagicMock(BaseIssuer, autospec=True)
+        issuer.create_credential_ex = async_mock.CoroutineMock(
+            side_effect=lambda values, *args: {"credentialSubject": values}
+        )
+        context.injector.bind_instance(BaseIssuer, issuer)
+
+        connection_id = await ConnectionRecord(
+            state=ConnectionRecord.STATE_ACTIVE
+        ).save(context)
+        exchange_ids = []
+        for i in range(5):
+            exchange = CredentialExchangeRecord(
+                connection_id=connection_id,
+                thread_id=f"thread-{i}",
+                initiator=CredentialExchangeRecord.INITIATOR_EXTERNAL,
+                role=CredentialExchangeRecord.ROLE_ISSUER,
+                state=CredentialExchangeRecord.STATE_REQUEST_RECEIVED
+                if i != 3
+                else CredentialExchangeRecord.STATE_ISSUED,
+                credential_request={"credential_values": {"n": str(i)}},
+            )
+            exchange_ids.append(await exchange.save(context))
+        exchange_ids.append("missing")
+
+        async def send(message, connection_id):
+            if message._thread_id == "thread-4":
+                raise test_module.web.HTTPForbidden(reason="Send failed")
+
+        outbound_handler = async_mock.CoroutineMock(side_effect=send)
+        request = async_mock.MagicMock(
+            app={
+                "request_context": context,
+                "outbound_message_router": outbound_handler,
+            },
+            json=async_mock.CoroutineMock(
+                return_value={
+                    "credential_exchange_ids": exchange_ids + exchange_ids[:1],
+                    "batch_size": 2,
+                }
+            ),
+        )
+        with async_mock.patch.object(
+            test_module.web, "StreamResponse", autospec=True
+        ) as mock_response:
+            await test_module.issue_credential_bulk(request)
+
+        response = mock_response.return_value
+        response.prepare.assert_awaited_once_with(request)
+        response.write_eof.assert_awaited_once()
+        # repeated ids first, then one write per batch
+        assert response.write.await_count == 4
+        lines = b"".join(
+            call[0][0] for call in response.write.await_args_list
+        ).splitlines()
+        results = [json.loads(line) for line in lines]
+        assert [result["credential_exchange_id"] for result in results] == (
+            exchange_ids[:1] + exchange_ids
+        )
+        assert [result["success"] for result in results] == [
+            False,
+            True,
+            True,
+            True,
+            False,
+            False,
+            False,
+        ]
+        assert results[0]["error"] == "Repeated credential exchange id"
+        assert results[4]["error"] == "Invalid exchange state"
+        assert results[5]["error"] == "Send failed"
+
+        assert outbound_handler.await_count == 4
+        for i in (0, 1, 2):
+            exchange = await CredentialExchangeRecord.retrieve_by_id(
+                context, exchange_ids[i]
+            )
+            assert exchange.state == CredentialExchangeRecord.STATE_ISSUED
+            assert await exchange.credential_pds_get(context) == {
+                "credentialSubject": {"n": str(i)}
+            }
+
+        # the exchange which was not sent can be retried
+        exchange = await CredentialExchangeRecord.retrieve_by_id(
+            context, exchange_ids[4]
+        )
+        assert exchange.state == CredentialExchangeRecord.STATE_REQUEST_RECEIVED
+        outbound_handler.side_effect = None
+        request.json.return_value = {"credential_exchange_ids": exchange_ids[4:5]}
+        with async_mock.patch.object(
+            test_module.web, "StreamResponse", autospec=True
+        ) as mock_response:
+            await test_module.issue_credential_bulk(request)
+        (result,) = [
+            json.loads(call[0][0])
+            for call in mock_response.return_value.write.await_args_list
+        ]
+        assert result["success"]
+        exchange = await CredentialExchangeRecord.retrieve_by_id(
+            context, exchange_ids[4]
+        )
+        assert exchange.state == CredentialExchangeRecord.STATE_ISSUED
+        assert await exchange.credential_pds_get(context) == {
+            "credentialSubject": {"n": "4"}
+        }
+
+    async def test_issue_credential_bulk_x(self):
+        request = async_mock.MagicMock(
+            app={
+                "request_context": async_mock.MagicMock(),
+                "outbound_message_router": async_mock.CoroutineMock(),
+            },
+            json=async_mock.CoroutineMock(return_value={"credential_exchange_ids": []}),
+        )
+        with self.assertRaises(aio_web.HTTPBadRequest):
+            await test_module.issue_credential_bulk(request)
+
+        for body in ({"batch_size": 0}, {"signing_limit": "2"}):
+            request.json.return_value = {"credential_exchange_ids": ["id"], **body}
+            with async_mock.patch.object(
+                test_module.web, "StreamResponse", autospec=True
+            ) as mock_response:
+                with self.assertRaises(aio_web.HTTPBadRequest):
+                    await test_module.issue_credential_bulk(request)
+            mock_response.return_value.prepare.assert_not_called()
@@ -20,6 +20,11 @@ from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paging import (
+    PageQueryStringSchema,
+    page_params,
+    stream_results,
+)
 from ....messaging.valid import (
     INDY_CRED_DEF_ID,
     INDY_DID,
@@ -53,7 +58,7 @@ from .models.presentation_exchange import (
 )
 
 
-class V10PresentationExchangeListQueryStringSchema(OpenAPISchema):
+class V10PresentationExchangeListQueryStringSchema(PageQueryStringSchema):
     """Parameters and validators for presentation exchange list query."""
 
     connection_id = fields.UUID(
@@ -435,6 +440,7 @@ async def presentation_exchange_list(request: web.BaseRequest):
 
     """
     context = request.app["request_context"]
+    limit, offset = page_params(request)
     tag_filter = {}
     if "thread_id" in request.query and request.query["thread_id"] != "":
         tag_filter["thread_id"] = request.query["thread_id"]
@@ -445,6 +451,11 @@ async def presentation_exchange_list(request: web.BaseRequest):
     }
 
     try:
+        if limit or offset:
+            records = V10PresentationExchange.query_iter(
+                context, tag_filter, post_filter, limit=limit, offset=offset
+            )
+            return await stream_results(request, records)
         records = await V10PresentationExchange.query(context, tag_filter, post_filter)
         results = [record.serialize() for record in records]
     except (StorageError, BaseModelError) as err:
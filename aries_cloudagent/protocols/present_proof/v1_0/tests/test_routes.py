@@ -111,6 +111,39 @@ class TestProofRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.presentation_exchange_list(mock)
 
+    async def test_presentation_exchange_list_paged(self):
+        mock = async_mock.MagicMock()
+        mock.query = {"state": "dummy", "limit": "10", "offset": "20"}
+        mock.app = {
+            "outbound_message_router": async_mock.CoroutineMock(),
+            "request_context": "context",
+        }
+
+        with async_mock.patch(
+            "aries_cloudagent.protocols.present_proof.v1_0.models.presentation_exchange.V10PresentationExchange",
+            autospec=True,
+        ) as mock_presentation_exchange:
+
+            # Since we are mocking import
+            importlib.reload(test_module)
+
+            with async_mock.patch.object(
+                test_module, "stream_results", async_mock.CoroutineMock()
+            ) as mock_stream:
+                result = await test_module.presentation_exchange_list(mock)
+                assert result is mock_stream.return_value
+                mock_presentation_exchange.query_iter.assert_called_once_with(
+                    "context", {}, {"state": "dummy"}, limit=10, offset=20
+                )
+                mock_stream.assert_awaited_once_with(
+                    mock, mock_presentation_exchange.query_iter.return_value
+                )
+                mock_presentation_exchange.query.assert_not_called()
+
+                mock_stream.side_effect = test_module.StorageError()
+                with self.assertRaises(test_module.web.HTTPBadRequest):
+                    await test_module.presentation_exchange_list(mock)
+
     async def test_presentation_exchange_credentials_list_not_found(self):
         mock = async_mock.MagicMock()
         mock.match_info = {"pres_ex_id": "dummy"}
@@ -18,3 +18,6 @@ MESSAGE_TYPES = {
     PROBLEM_REPORT: f"{PROTOCOL_PACKAGE}.message.ProblemReport",
     NEW_PROBLEM_REPORT: f"{PROTOCOL_PACKAGE}.message.ProblemReport",
 }
+
+# Cheap and latency sensitive, handled ahead of other messages
+MESSAGE_LANES = {message_type: "priority" for message_type in MESSAGE_TYPES}
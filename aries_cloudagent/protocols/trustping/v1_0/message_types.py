@@ -22,3 +22,6 @@ MESSAGE_TYPES = {
     NEW_PING: f"{PROTOCOL_PACKAGE}.messages.ping.Ping",
     NEW_PING_RESPONSE: f"{PROTOCOL_PACKAGE}.messages.ping_response.PingResponse",
 }
+
+# Cheap and latency sensitive, handled ahead of other messages
+MESSAGE_LANES = {message_type: "priority" for message_type in MESSAGE_TYPES}
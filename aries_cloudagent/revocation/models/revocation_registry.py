@@ -6,14 +6,10 @@ import re
 from os.path import join
 from pathlib import Path
 
-from requests import Session
-from requests.exceptions import RequestException
-
 from ...indy.util import indy_client_dir
 
 from ..error import RevocationError
-import hashlib
-import base58
+from ..tails_cache import get_tails_cache
 
 LOGGER = logging.getLogger(__name__)
 
@@ -160,37 +156,18 @@ class RevocationRegistry:
             self.registry_id,
         )
 
-        tails_file_path = Path(self.get_receiving_tails_local_path())
-        tails_file_dir = tails_file_path.parent
-        if not tails_file_dir.exists():
-            tails_file_dir.mkdir(parents=True)
-
-        buffer_size = 65536  # should be multiple of 32 bytes for sha256
-        with open(tails_file_path, "wb", buffer_size) as tails_file:
-            file_hasher = hashlib.sha256()
-
-            with Session() as req_session:
-                try:
-                    resp = req_session.get(self._tails_public_uri, stream=True)
-                    for buf in resp.iter_content(chunk_size=buffer_size):
-                        tails_file.write(buf)
-                        file_hasher.update(buf)
-                except RequestException as rx:
-                    raise RevocationError(f"Error retrieving tails file: {rx}")
-
-            download_tails_hash = base58.b58encode(file_hasher.digest()).decode("utf-8")
-            if download_tails_hash != self.tails_hash:
-                raise RevocationError(
-                    "The hash of the downloaded tails file does not match."
-                )
-
-        self.tails_local_path = tails_file_path
+        self.tails_local_path = await get_tails_cache().fetch(
+            self._tails_public_uri,
+            self.get_receiving_tails_local_path(),
+            self.tails_hash,
+        )
         return self.tails_local_path
 
     async def get_or_fetch_local_tails_path(self):
         """Get the local tails path, retrieving from the remote if necessary."""
         tails_file_path = self.get_receiving_tails_local_path()
         if Path(tails_file_path).is_file():
+            get_tails_cache().touch(tails_file_path)
             return tails_file_path
         return await self.retrieve_tails()
 
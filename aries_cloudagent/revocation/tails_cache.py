@@ -0,0 +1,272 @@
+"""Local cache of the tails files downloaded for revocation registries."""
+
+import asyncio
+import hashlib
+import logging
+import os
+from os.path import dirname, getsize, isfile, join, normpath
+from shutil import rmtree
+from typing import Sequence
+
+import base58
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from ..utils.repeat import RepeatSequence
+
+from .error import RevocationError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TailsDownload:
+    """Progress of a tails file download, kept across resumed attempts."""
+
+    def __init__(self, uri: str, path: str):
+        """Initialize the download state."""
+        self.uri = uri
+        self.path = path
+        self.partial = path + TailsCache.PARTIAL_SUFFIX
+        self.hasher = hashlib.sha256()
+        self.size = 0
+
+    def load_partial(self, chunk_size: int):
+        """Hash the data left by an interrupted download, to resume after it."""
+        try:
+            with open(self.partial, "rb") as partial:
+                for chunk in iter(lambda: partial.read(chunk_size), b""):
+                    self.hasher.update(chunk)
+                    self.size += len(chunk)
+        except FileNotFoundError:
+            pass
+
+    def restart(self):
+        """Discard the data received so far."""
+        open(self.partial, "wb").close()
+        self.hasher = hashlib.sha256()
+        self.size = 0
+
+    @property
+    def tails_hash(self) -> str:
+        """Accessor for the base58 hash of the data received."""
+        return base58.b58encode(self.hasher.digest()).decode("utf-8")
+
+
+class TailsCache:
+    """
+    Download tails files and bound the disk space they use.
+
+    A single download runs per tails file however many callers need it,
+    streaming to a partial file which is hashed as it is written. An
+    interrupted download resumes with an HTTP range request. Once the
+    downloaded files exceed the quota, the registries used least recently
+    are removed. Only registries downloaded here are ever removed, not the
+    tails files of registries this agent issues.
+    """
+
+    CHUNK_SIZE = 65536  # should be multiple of 32 bytes for sha256
+    FETCHED_MARKER = ".fetched"
+    PARTIAL_SUFFIX = ".part"
+
+    def __init__(
+        self,
+        base_dir: str = None,
+        *,
+        max_size: int = None,
+        max_attempts: int = 3,
+        retry_interval: float = 1.0,
+        request_timeout: float = 30.0,
+    ):
+        """
+        Initialize a `TailsCache` instance.
+
+        Args:
+            base_dir: the directory holding a subdirectory per registry,
+                by default the parent directory of the registry downloaded
+            max_size: the quota in bytes for downloaded tails files
+            max_attempts: the number of attempts to download a tails file
+            retry_interval: seconds to wait before resuming a download
+            request_timeout: seconds to wait for data from the tails server
+
+        """
+        self.base_dir = base_dir
+        self.max_size = max_size
+        self.max_attempts = max_attempts
+        self.retry_interval = retry_interval
+        self.request_timeout = request_timeout
+        self._downloads = {}
+        self.downloaded = 0
+        self.resumed = 0
+        self.joined = 0
+        self.evicted = 0
+
+    def touch(self, path: str):
+        """Record the use of a downloaded tails file."""
+        try:
+            os.utime(join(dirname(path), self.FETCHED_MARKER))
+        except OSError:
+            pass
+
+    async def fetch(self, uri: str, path: str, tails_hash: str) -> str:
+        """
+        Download a tails file, or wait for its download already in progress.
+
+        Args:
+            uri: the public URI of the tails file
+            path: the local path to store the tails file
+            tails_hash: the expected base58 sha256 hash of the tails file
+
+        Returns:
+            The local path of the tails file
+
+        Raises:
+            RevocationError: If the download fails or the hash does not match
+
+        """
+        path = str(path)
+        task = self._downloads.get(path)
+        if task:
+            self.joined += 1
+        else:
+            task = asyncio.ensure_future(self._download(uri, path, tails_hash))
+            self._downloads[path] = task
+            task.add_done_callback(lambda done: self._download_done(path, done))
+        # a caller giving up does not abort the download for the others
+        return await asyncio.shield(task)
+
+    def _download_done(self, path: str, task: asyncio.Task):
+        self._downloads.pop(path, None)
+        if not task.cancelled():
+            task.exception()
+
+    async def _download(self, uri: str, path: str, tails_hash: str) -> str:
+        loop = asyncio.get_event_loop()
+        reg_dir = dirname(path)
+        os.makedirs(reg_dir, exist_ok=True)
+        open(join(reg_dir, self.FETCHED_MARKER), "a").close()
+
+        download = TailsDownload(uri, path)
+        await loop.run_in_executor(None, download.load_partial, self.CHUNK_SIZE)
+        timeout = ClientTimeout(total=None, sock_read=self.request_timeout)
+        async with ClientSession(timeout=timeout) as session:
+            async for attempt in RepeatSequence(
+                self.max_attempts, self.retry_interval
+            ):
+                try:
+                    await self._stream(session, download)
+                    break
+                except (ClientError, asyncio.TimeoutError) as err:
+                    if attempt.final:
+                        raise RevocationError(
+                            f"Error retrieving tails file: {err}"
+                        ) from err
+                    LOGGER.warning(
+                        "Download of tails file %s interrupted after %d bytes: %s",
+                        path,
+                        download.size,
+                        err,
+                    )
+
+        if download.tails_hash != tails_hash:
+            os.remove(download.partial)
+            raise RevocationError(
+                "The hash of the downloaded tails file does not match."
+            )
+        os.replace(download.partial, path)
+        self.downloaded += 1
+
+        base_dir = self.base_dir or dirname(normpath(reg_dir))
+        keep = [reg_dir] + [dirname(other) for other in self._downloads]
+        await loop.run_in_executor(None, self.evict, base_dir, keep)
+        return path
+
+    async def _stream(self, session: ClientSession, download: TailsDownload):
+        headers = None
+        if download.size:
+            headers = {"Range": f"bytes={download.size}-"}
+        async with session.get(download.uri, headers=headers) as response:
+            if response.status == 416 and download.size:
+                # the partial file is complete, the hash check decides
+                return
+            if response.status == 206:
+                content_range = response.headers.get("Content-Range", "")
+                if not content_range.startswith(f"bytes {download.size}-"):
+                    raise ClientError(f"Unexpected content range: {content_range}")
+                self.resumed += 1
+            elif response.status == 200:
+                download.restart()
+            else:
+                raise ClientError(f"Bad response from server: {response.status}")
+
+            with open(download.partial, "ab") as partial:
+                async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                    partial.write(chunk)
+                    download.hasher.update(chunk)
+                    download.size += len(chunk)
+
+    def evict(self, base_dir: str, keep: Sequence[str] = ()) -> int:
+        """
+        Remove the least recently used registries until within the quota.
+
+        Args:
+            base_dir: the directory holding a subdirectory per registry
+            keep: registry directories which must not be removed
+
+        Returns:
+            The number of registries removed
+
+        """
+        if not self.max_size:
+            return 0
+        try:
+            names = os.listdir(base_dir)
+        except OSError:
+            return 0
+
+        registries = []
+        total = 0
+        for name in names:
+            reg_dir = join(base_dir, name)
+            try:
+                last_used = os.stat(join(reg_dir, self.FETCHED_MARKER)).st_mtime
+                size = sum(
+                    getsize(join(reg_dir, entry))
+                    for entry in os.listdir(reg_dir)
+                    if isfile(join(reg_dir, entry))
+                )
+            except OSError:
+                continue
+            registries.append((last_used, reg_dir, size))
+            total += size
+
+        keep = {normpath(reg_dir) for reg_dir in keep}
+        removed = 0
+        for _last_used, reg_dir, size in sorted(registries):
+            if total <= self.max_size:
+                break
+            if normpath(reg_dir) in keep:
+                continue
+            LOGGER.info("Removing unused tails files in %s", reg_dir)
+            rmtree(reg_dir, ignore_errors=True)
+            total -= size
+            removed += 1
+        self.evicted += removed
+        return removed
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the tails cache statistics."""
+        return {
+            "downloading": len(self._downloads),
+            "downloaded": self.downloaded,
+            "resumed": self.resumed,
+            "joined": self.joined,
+            "evicted": self.evicted,
+        }
+
+
+TAILS_CACHE = TailsCache()
+
+
+def get_tails_cache() -> TailsCache:
+    """Get the tails cache shared by the revocation registries."""
+    return TAILS_CACHE
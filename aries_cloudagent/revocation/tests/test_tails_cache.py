@@ -0,0 +1,119 @@
+import asyncio
+import hashlib
+import os
+from os.path import isdir, isfile, join
+from shutil import rmtree
+from tempfile import mkdtemp
+
+import base58
+from aiohttp import web
+from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop
+
+from ..error import RevocationError
+from ..tails_cache import TailsCache
+
+TAILS_CONTENT = bytes(range(256)) * 1024
+TAILS_HASH = base58.b58encode(hashlib.sha256(TAILS_CONTENT).digest()).decode()
+REV_REG_ID = "FkjWznKwA4N1JEp2iPiKPG:4:FkjWznKwA4N1JEp2iPiKPG:3:CL:12:tag1:CL_ACCUM:0"
+
+
+class TestTailsCache(AioHTTPTestCase):
+    async def setUpAsync(self):
+        self.base_dir = mkdtemp()
+        self.requests = []
+
+    async def tearDownAsync(self):
+        rmtree(self.base_dir, ignore_errors=True)
+
+    async def get_application(self):
+        app = web.Application()
+        app.add_routes([web.get("/tails", self.tails_route)])
+        return app
+
+    async def tails_route(self, request):
+        self.requests.append(request.headers.get("Range"))
+        await asyncio.sleep(0.01)
+        if request.http_range.start:
+            start = request.http_range.start
+            return web.Response(
+                body=TAILS_CONTENT[start:],
+                status=206,
+                headers={
+                    "Content-Range": f"bytes {start}-{len(TAILS_CONTENT) - 1}"
+                    f"/{len(TAILS_CONTENT)}"
+                },
+            )
+        return web.Response(body=TAILS_CONTENT)
+
+    def tails_path(self, rev_reg_id: str = REV_REG_ID) -> str:
+        return join(self.base_dir, rev_reg_id, TAILS_HASH)
+
+    @unittest_run_loop
+    async def test_fetch_single_flight(self):
+        cache = TailsCache(self.base_dir)
+        uri = f"http://localhost:{self.server.port}/tails"
+        paths = await asyncio.gather(
+            *(cache.fetch(uri, self.tails_path(), TAILS_HASH) for _ in range(3))
+        )
+        assert paths == [self.tails_path()] * 3
+        assert self.requests == [None]
+        with open(self.tails_path(), "rb") as tails_file:
+            assert tails_file.read() == TAILS_CONTENT
+        assert cache.stats["joined"] == 2
+        assert cache.stats["downloaded"] == 1
+        assert cache.stats["downloading"] == 0
+
+    @unittest_run_loop
+    async def test_fetch_resume(self):
+        cache = TailsCache(self.base_dir)
+        uri = f"http://localhost:{self.server.port}/tails"
+        os.makedirs(join(self.base_dir, REV_REG_ID))
+        with open(self.tails_path() + TailsCache.PARTIAL_SUFFIX, "wb") as partial:
+            partial.write(TAILS_CONTENT[:1000])
+
+        assert await cache.fetch(uri, self.tails_path(), TAILS_HASH)
+        assert self.requests == ["bytes=1000-"]
+        with open(self.tails_path(), "rb") as tails_file:
+            assert tails_file.read() == TAILS_CONTENT
+        assert not isfile(self.tails_path() + TailsCache.PARTIAL_SUFFIX)
+        assert cache.stats["resumed"] == 1
+
+    @unittest_run_loop
+    async def test_fetch_bad_hash(self):
+        cache = TailsCache(self.base_dir)
+        uri = f"http://localhost:{self.server.port}/tails"
+        with self.assertRaises(RevocationError):
+            await cache.fetch(uri, self.tails_path(), "not-the-hash")
+        assert not isfile(self.tails_path())
+        assert not isfile(self.tails_path() + TailsCache.PARTIAL_SUFFIX)
+
+    @unittest_run_loop
+    async def test_fetch_error(self):
+        cache = TailsCache(self.base_dir, max_attempts=2, retry_interval=0)
+        uri = f"http://localhost:{self.server.port}/missing"
+        with self.assertRaises(RevocationError):
+            await cache.fetch(uri, self.tails_path(), TAILS_HASH)
+
+    @unittest_run_loop
+    async def test_evict(self):
+        cache = TailsCache(max_size=2 * len(TAILS_CONTENT))
+        uri = f"http://localhost:{self.server.port}/tails"
+        issued_dir = join(self.base_dir, "issued")
+        os.makedirs(issued_dir)
+        with open(join(issued_dir, TAILS_HASH), "wb") as tails_file:
+            tails_file.write(TAILS_CONTENT)
+
+        for index in range(3):
+            await cache.fetch(uri, self.tails_path(f"reg{index}"), TAILS_HASH)
+            os.utime(
+                join(self.base_dir, f"reg{index}", TailsCache.FETCHED_MARKER),
+                (index, index),
+            )
+            if index == 1:
+                cache.touch(self.tails_path("reg0"))
+
+        assert cache.stats["evicted"] == 1
+        assert isdir(join(self.base_dir, "reg0"))
+        assert not isdir(join(self.base_dir, "reg1"))
+        assert isdir(join(self.base_dir, "reg2"))
+        assert isdir(issued_dir)
@@ -236,6 +236,30 @@ class BaseStorageRecordSearch(ABC):
 
         """
 
+    async def skip(self, count: int) -> int:
+        """
+        Skip over the next records of the query.
+
+        Args:
+            count: Number of records to skip
+
+        Returns:
+            The number of records skipped, fewer if the results run out
+
+        """
+        if not self.opened:
+            await self.open()
+        skipped = 0
+        while skipped < count:
+            if not self._buffer:
+                self._buffer = await self.fetch(min(self.page_size, count - skipped))
+                if not self._buffer:
+                    break
+            dropped = min(len(self._buffer), count - skipped)
+            del self._buffer[:dropped]
+            skipped += dropped
+        return skipped
+
     async def fetch_all(self) -> Sequence[StorageRecord]:
         """Fetch all records from the query."""
         results = []
@@ -1,6 +1,8 @@
 """Basic in-memory storage implementation (non-wallet)."""
 
+from bisect import bisect_left, bisect_right
 from collections import OrderedDict
+from itertools import count
 from typing import Mapping, Sequence
 
 from .base import BaseStorage, BaseStorageRecordSearch
@@ -26,6 +28,122 @@ class BasicStorage(BaseStorage):
 
         """
         self._records = OrderedDict()
+        # looks like { record type: { record id: <insertion sequence> } }
+        self._type_index = {}
+        # looks like { (record type, tag name): { tag value: { record id, ... } } }
+        self._tag_index = {}
+        # sorted [(numeric tag value, record id)] per (record type, tag name),
+        # built by range queries and dropped when the tag values change
+        self._range_index = {}
+        self._sequence = count()
+
+    def _index_tags(self, record: StorageRecord):
+        """Add the tags of a record to the tag indexes."""
+        for name, value in (record.tags or {}).items():
+            key = (record.type, name)
+            try:
+                self._tag_index.setdefault(key, {}).setdefault(value, set()).add(
+                    record.id
+                )
+            except TypeError:
+                continue  # unhashable values are only matched by a scan
+            self._range_index.pop(key, None)
+
+    def _unindex_tags(self, record: StorageRecord):
+        """Remove the tags of a record from the tag indexes."""
+        for name, value in (record.tags or {}).items():
+            key = (record.type, name)
+            values = self._tag_index.get(key)
+            try:
+                ids = values.get(value) if values else None
+            except TypeError:
+                continue
+            if ids:
+                ids.discard(record.id)
+                if not ids:
+                    del values[value]
+            self._range_index.pop(key, None)
+
+    def _range_ids(self, key: tuple, op: str, cmp_val: float) -> set:
+        """Find the ids of records with a numeric tag value in range."""
+        if key not in self._range_index:
+            try:
+                entries = sorted(
+                    (float(value), id)
+                    for value, ids in self._tag_index.get(key, {}).items()
+                    for id in ids
+                )
+                entries = (
+                    [value for value, _ in entries],
+                    [id for _, id in entries],
+                )
+            except (TypeError, ValueError):
+                entries = None  # not all numeric, fall back to a scan
+            self._range_index[key] = entries
+        if self._range_index[key] is None:
+            return None
+        values, ids = self._range_index[key]
+        start, end = 0, len(values)
+        if op == "$gt":
+            start = bisect_right(values, cmp_val)
+        elif op == "$gte":
+            start = bisect_left(values, cmp_val)
+        elif op == "$lt":
+            end = bisect_left(values, cmp_val)
+        else:
+            end = bisect_right(values, cmp_val)
+        return set(ids[start:end])
+
+    def _match_ids(self, type_filter: str, tag_query: Mapping) -> set:
+        """
+        Use the tag indexes to narrow down the records matching a tag query.
+
+        Returns:
+            A superset of the ids of matching records, or `None` if the
+            query can't be answered from the indexes
+
+        """
+        candidates = None
+        for k, v in (tag_query or {}).items():
+            ids = None
+            if k == "$or" and isinstance(v, list):
+                options = [self._match_ids(type_filter, opt) for opt in v]
+                if None not in options:
+                    ids = set().union(*options)
+            elif k[0] == "$":
+                pass
+            elif isinstance(v, str):
+                ids = self._tag_index.get((type_filter, k), {}).get(v, set())
+            elif isinstance(v, dict) and len(v) == 1:
+                op, cmp_val = list(v.items())[0]
+                values = self._tag_index.get((type_filter, k), {})
+                if op == "$in" and isinstance(cmp_val, list):
+                    try:
+                        ids = set().union(*(values.get(val, ()) for val in cmp_val))
+                    except TypeError:
+                        ids = None
+                elif op in ("$gt", "$gte", "$lt", "$lte") and isinstance(cmp_val, str):
+                    try:
+                        ids = self._range_ids((type_filter, k), op, float(cmp_val))
+                    except ValueError:
+                        ids = None
+            if ids is not None:
+                candidates = ids if candidates is None else candidates & ids
+                if not candidates:
+                    break
+        return candidates
+
+    def _find_records(self, type_filter: str, tag_query: Mapping) -> list:
+        """Find the records of a type which may match a tag query, in order."""
+        bucket = self._type_index.get(type_filter)
+        if not bucket:
+            return []
+        ids = self._match_ids(type_filter, tag_query)
+        if ids is None:
+            ids = bucket
+        else:
+            ids = sorted(ids, key=bucket.__getitem__)
+        return [self._records[id] for id in ids]
 
     async def add_record(self, record: StorageRecord):
         """
@@ -46,6 +164,8 @@ class BasicStorage(BaseStorage):
         if record.id in self._records:
             raise StorageDuplicateError("Duplicate record")
         self._records[record.id] = record
+        self._type_index.setdefault(record.type, {})[record.id] = next(self._sequence)
+        self._index_tags(record)
 
     async def get_record(
         self, record_type: str, record_id: str, options: Mapping = None
@@ -103,7 +223,9 @@ class BasicStorage(BaseStorage):
         oldrec = self._records.get(record.id)
         if not oldrec:
             raise StorageNotFoundError("Record not found: {}".format(record.id))
+        self._unindex_tags(oldrec)
         self._records[record.id] = oldrec._replace(tags=dict(tags or {}))
+        self._index_tags(self._records[record.id])
 
     async def delete_record_tags(
         self, record: StorageRecord, tags: (Sequence, Mapping)
@@ -127,7 +249,9 @@ class BasicStorage(BaseStorage):
             for tag in tags:
                 if tag in newtags:
                     del newtags[tag]
+        self._unindex_tags(oldrec)
         self._records[record.id] = oldrec._replace(tags=newtags)
+        self._index_tags(self._records[record.id])
 
     async def delete_record(self, record: StorageRecord):
         """
@@ -142,7 +266,12 @@ class BasicStorage(BaseStorage):
         """
         if record.id not in self._records:
             raise StorageNotFoundError("Record not found: {}".format(record.id))
-        del self._records[record.id]
+        oldrec = self._records.pop(record.id)
+        self._unindex_tags(oldrec)
+        bucket = self._type_index[oldrec.type]
+        del bucket[oldrec.id]
+        if not bucket:
+            del self._type_index[oldrec.type]
 
     def search_records(
         self,
@@ -296,10 +425,9 @@ class BasicStorageRecordSearch(BaseStorageRecordSearch):
         i = max_count
         while i > 0:
             try:
-                id = next(self._iter)
+                record = next(self._iter)
             except StopIteration:
                 break
-            record = self._cache[id]
             if record.type == check_type and basic_tag_query_match(
                 record.tags, self.tag_query
             ):
@@ -309,7 +437,7 @@ class BasicStorageRecordSearch(BaseStorageRecordSearch):
 
     async def open(self):
         """Start the search query."""
-        self._cache = self._store._records.copy()
+        self._cache = self._store._find_records(self.type_filter, self.tag_query)
         self._iter = iter(self._cache)
 
     async def close(self):
@@ -198,6 +198,20 @@ class TestBasicStorage:
             count += 1
         assert count == 1
 
+    @pytest.mark.asyncio
+    async def test_skip_search(self, store):
+        records = [test_record() for _ in range(5)]
+        for record in records:
+            await store.add_record(record)
+        search = store.search_records("TYPE", {}, 2)
+        assert await search.skip(3) == 3
+        found = [found.id async for found in search]
+        assert found == [record.id for record in records[3:]]
+
+        search = store.search_records("TYPE", {}, 2)
+        assert await search.skip(10) == 5
+        assert not await search.fetch(2)
+
     @pytest.mark.asyncio
     async def test_closed_search(self, store):
         search = store.search_records("TYPE", {}, None)
@@ -263,3 +277,58 @@ class TestBasicStorage:
         with pytest.raises(StorageSearchError) as excinfo:
             basic_tag_query_match(TAGS, {"a": -1})
         assert "Expected string or dict for filter value" in str(excinfo.value)
+
+    @pytest.mark.asyncio
+    async def test_indexed_search(self, store):
+        records = [
+            StorageRecord(
+                type="TYPE",
+                value=str(i),
+                tags={"parity": ("even", "odd")[i % 2], "num": str(i)},
+            )
+            for i in range(10)
+        ]
+        for record in records:
+            await store.add_record(record)
+        await store.add_record(
+            StorageRecord(type="OTHER", value="other", tags={"parity": "even"})
+        )
+
+        async def search_values(tag_query):
+            search = store.search_records("TYPE", tag_query, None)
+            return [row.value for row in await search.fetch_all()]
+
+        assert await search_values({}) == [str(i) for i in range(10)]
+        assert await search_values({"parity": "even"}) == ["0", "2", "4", "6", "8"]
+        assert await search_values({"num": {"$in": ["3", "1", "99"]}}) == ["1", "3"]
+        assert await search_values({"num": {"$gt": "7"}}) == ["8", "9"]
+        assert await search_values({"num": {"$gte": "7"}}) == ["7", "8", "9"]
+        assert await search_values({"num": {"$lt": "2"}}) == ["0", "1"]
+        assert await search_values({"num": {"$lte": "2"}}) == ["0", "1", "2"]
+        assert await search_values({"parity": "odd", "num": {"$lt": "4"}}) == [
+            "1",
+            "3",
+        ]
+        assert await search_values(
+            {"$or": [{"num": "1"}, {"num": {"$gt": "8"}}]}
+        ) == ["1", "9"]
+        assert await search_values(
+            {"parity": "odd", "$not": {"num": "1"}, "num": {"$neq": "9"}}
+        ) == ["3", "5", "7"]
+        assert await search_values({"parity": "none"}) == []
+
+        # indexes follow tag updates and deletes
+        await store.update_record_tags(records[0], {"parity": "odd", "num": "0"})
+        await store.delete_record_tags(records[2], ["parity"])
+        await store.delete_record(records[4])
+        assert await search_values({"parity": "even"}) == ["6", "8"]
+        assert await search_values({"parity": "odd", "num": {"$lt": "2"}}) == [
+            "0",
+            "1",
+        ]
+        assert await search_values({"num": {"$lte": "4"}}) == ["0", "1", "2", "3"]
+
+        # non numeric values fall back to evaluating every record
+        await store.update_record_tags(records[1], {"num": "one"})
+        with pytest.raises(ValueError):
+            await search_values({"num": {"$gt": "7"}})
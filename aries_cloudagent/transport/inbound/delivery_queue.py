@@ -5,10 +5,19 @@ The delivery queue holds and manages messages that have not yet
 been delivered to their intended destination.
 
 """
+import heapq
+import itertools
+import logging
 import time
 
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Iterable, Sequence, Set, Tuple
+
 from ..outbound.message import OutboundMessage
 
+LOGGER = logging.getLogger(__name__)
+
 
 class QueuedMessage:
     """
@@ -17,14 +26,15 @@ class QueuedMessage:
     Allows tracking Metadata.
     """
 
-    def __init__(self, msg: OutboundMessage):
+    def __init__(self, msg: OutboundMessage, timestamp: float = None):
         """
         Create Wrapper for queued message.
 
         Automatically sets timestamp on create.
         """
         self.msg = msg
-        self.timestamp = time.time()
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.removed = False
 
     def older_than(self, compare_timestamp: float) -> bool:
         """
@@ -38,23 +48,51 @@ class QueuedMessage:
         return self.timestamp < compare_timestamp
 
 
-class DeliveryQueue:
+class BaseDeliveryQueue(ABC):
     """
-    DeliveryQueue class.
+    Base class for delivery queue backends.
 
-    Manages undelivered messages.
+    Messages are held once per recipient key and returned in the order they
+    were added. Messages are identified within the queue of a key by an
+    opaque handle, so that a batch of delivered messages can be removed
+    together.
     """
 
-    def __init__(self) -> None:
-        """
-        Initialize an instance of DeliveryQueue.
+    DEFAULT_TTL = 604800  # one week
 
-        This uses an in memory structure to queue messages.
+    def __init__(self, *, ttl_seconds: int = None, max_messages_per_key: int = None):
         """
+        Initialize the delivery queue.
 
-        self.queue_by_key = {}
-        self.ttl_seconds = 604800  # one week
+        Args:
+            ttl_seconds: seconds after which undelivered messages are dropped
+            max_messages_per_key: the quota of messages held for one key
+
+        """
+        self.ttl_seconds = ttl_seconds or self.DEFAULT_TTL
+        self.max_messages_per_key = max_messages_per_key
 
+    @staticmethod
+    def message_keys(msg: OutboundMessage) -> Set[str]:
+        """Get the recipient keys a message is to be held for."""
+        keys = set()
+        if msg.target:
+            keys.update(msg.target.recipient_keys)
+        if msg.reply_to_verkey:
+            keys.add(msg.reply_to_verkey)
+        return keys
+
+    def has_quota(self, key: str) -> bool:
+        """Check whether another message may be held for a key."""
+        if (
+            self.max_messages_per_key
+            and self.message_count_for_key(key) >= self.max_messages_per_key
+        ):
+            LOGGER.warning("Undelivered message quota reached for key: %s", key)
+            return False
+        return True
+
+    @abstractmethod
     def expire_messages(self, ttl=None):
         """
         Expire messages that are past the time limit.
@@ -63,65 +101,77 @@ class DeliveryQueue:
             ttl: Optional. Allows override of configured ttl
         """
 
-        ttl_seconds = ttl or self.ttl_seconds
-        horizon = time.time() - ttl_seconds
-        for key in self.queue_by_key.keys():
-            self.queue_by_key[key] = [
-                wm for wm in self.queue_by_key[key] if not wm.older_than(horizon)
-            ]
-
-    def add_message(self, msg: OutboundMessage):
+    @abstractmethod
+    def add_message(self, msg: OutboundMessage) -> bool:
         """
         Add an OutboundMessage to delivery queue.
 
-        The message is added once per recipient key
+        The message is added once per recipient key with remaining quota
 
         Args:
             msg: The OutboundMessage to add
+
+        Returns:
+            True if the message was queued for at least one key
+
         """
-        keys = set()
-        if msg.target:
-            keys.update(msg.target.recipient_keys)
-        if msg.reply_to_verkey:
-            keys.add(msg.reply_to_verkey)
-        wrapped_msg = QueuedMessage(msg)
-        for recipient_key in keys:
-            if recipient_key not in self.queue_by_key:
-                self.queue_by_key[recipient_key] = []
-            self.queue_by_key[recipient_key].append(wrapped_msg)
 
-    def has_message_for_key(self, key: str):
+    def has_message_for_key(self, key: str) -> bool:
         """
         Check for queued messages by key.
 
         Args:
             key: The key to use for lookup
         """
-        if key in self.queue_by_key and len(self.queue_by_key[key]):
-            return True
-        return False
+        return self.message_count_for_key(key) > 0
 
-    def message_count_for_key(self, key: str):
+    @abstractmethod
+    def message_count_for_key(self, key: str) -> int:
         """
         Count of queued messages by key.
 
         Args:
             key: The key to use for lookup
         """
-        if key in self.queue_by_key:
-            return len(self.queue_by_key[key])
-        else:
-            return 0
 
-    def get_one_message_for_key(self, key: str):
+    @abstractmethod
+    def get_one_message_for_key(self, key: str) -> OutboundMessage:
         """
         Remove and return a matching message.
 
         Args:
             key: The key to use for lookup
         """
-        if key in self.queue_by_key:
-            return self.queue_by_key[key].pop(0).msg
+
+    @abstractmethod
+    def peek_messages_for_key(
+        self, key: str, limit: int = None
+    ) -> Sequence[Tuple[Any, OutboundMessage]]:
+        """
+        Return the oldest messages for key without removing them.
+
+        Args:
+            key: The key to use for lookup
+            limit: The maximum number of messages to return
+
+        Returns:
+            A list of (handle, message) pairs, oldest first
+
+        """
+
+    @abstractmethod
+    def remove_messages_for_key(self, key: str, handles: Iterable) -> int:
+        """
+        Remove a batch of messages from queue for key.
+
+        Args:
+            key: The key to use for lookup
+            handles: The handles returned by `peek_messages_for_key`
+
+        Returns:
+            The number of messages removed
+
+        """
 
     def inspect_all_messages_for_key(self, key: str):
         """
@@ -130,9 +180,8 @@ class DeliveryQueue:
         Args:
             key: The key to use for lookup
         """
-        if key in self.queue_by_key:
-            for wrapped_msg in self.queue_by_key[key]:
-                yield wrapped_msg.msg
+        for _handle, msg in self.peek_messages_for_key(key):
+            yield msg
 
     def remove_message_for_key(self, key: str, msg: OutboundMessage):
         """
@@ -142,10 +191,183 @@ class DeliveryQueue:
             key: The key to use for lookup
             msg: The message to remove from the queue
         """
+        for handle, queued in self.peek_messages_for_key(key):
+            if queued == msg:
+                self.remove_messages_for_key(key, (handle,))
+                break  # exit processing loop
+
+    def close(self):
+        """Release any resources held by the queue."""
+
+
+class DeliveryQueue(BaseDeliveryQueue):
+    """
+    DeliveryQueue class.
+
+    Manages undelivered messages.
+    """
+
+    def __init__(self, *, ttl_seconds: int = None, max_messages_per_key: int = None):
+        """
+        Initialize an instance of DeliveryQueue.
+
+        This uses an in memory structure to queue messages: a deque per
+        recipient key, and a heap ordering every message by age so that
+        expired messages are found without scanning the queues.
+        """
+        super().__init__(
+            ttl_seconds=ttl_seconds, max_messages_per_key=max_messages_per_key
+        )
+        self.queue_by_key = {}
+        self.count_by_key = {}
+        self.expiry_heap = []
+        self.total_count = 0
+        self._sequence = itertools.count()
+
+    def expire_messages(self, ttl=None):
+        """
+        Expire messages that are past the time limit.
+
+        Args:
+            ttl: Optional. Allows override of configured ttl
+        """
+
+        ttl_seconds = ttl or self.ttl_seconds
+        horizon = time.time() - ttl_seconds
+        while self.expiry_heap and self.expiry_heap[0][0] < horizon:
+            _timestamp, _seq, key = heapq.heappop(self.expiry_heap)
+            queue = self.queue_by_key.get(key)
+            while queue and queue[0].older_than(horizon):
+                wrapped_msg = queue.popleft()
+                if not wrapped_msg.removed:
+                    wrapped_msg.removed = True
+                    self._discount(key)
+            self._trim(key)
+
+    def add_message(self, msg: OutboundMessage) -> bool:
+        """
+        Add an OutboundMessage to delivery queue.
+
+        The message is added once per recipient key with remaining quota
+
+        Args:
+            msg: The OutboundMessage to add
+
+        Returns:
+            True if the message was queued for at least one key
+
+        """
+        self.expire_messages()
+        timestamp = time.time()
+        added = False
+        for recipient_key in self.message_keys(msg):
+            if not self.has_quota(recipient_key):
+                continue
+            if recipient_key not in self.queue_by_key:
+                self.queue_by_key[recipient_key] = deque()
+            self.queue_by_key[recipient_key].append(QueuedMessage(msg, timestamp))
+            self.count_by_key[recipient_key] = (
+                self.count_by_key.get(recipient_key, 0) + 1
+            )
+            heapq.heappush(
+                self.expiry_heap, (timestamp, next(self._sequence), recipient_key)
+            )
+            self.total_count += 1
+            added = True
+        if len(self.expiry_heap) > 2 * self.total_count + 64:
+            self._compact()
+        return added
+
+    def message_count_for_key(self, key: str) -> int:
+        """
+        Count of queued messages by key.
+
+        Args:
+            key: The key to use for lookup
+        """
+        return self.count_by_key.get(key, 0)
+
+    def get_one_message_for_key(self, key: str) -> OutboundMessage:
+        """
+        Remove and return a matching message.
+
+        Args:
+            key: The key to use for lookup
+        """
+        self._trim(key)
         if key in self.queue_by_key:
-            for wrapped_msg in self.queue_by_key[key]:
-                if wrapped_msg.msg == msg:
-                    self.queue_by_key[key].remove(wrapped_msg)
-                    if not self.queue_by_key[key]:
-                        del self.queue_by_key[key]
-                    break  # exit processing loop
+            wrapped_msg = self.queue_by_key[key].popleft()
+            wrapped_msg.removed = True
+            self._discount(key)
+            self._trim(key)
+            return wrapped_msg.msg
+
+    def peek_messages_for_key(
+        self, key: str, limit: int = None
+    ) -> Sequence[Tuple[QueuedMessage, OutboundMessage]]:
+        """
+        Return the oldest messages for key without removing them.
+
+        Args:
+            key: The key to use for lookup
+            limit: The maximum number of messages to return
+
+        Returns:
+            A list of (handle, message) pairs, oldest first
+
+        """
+        live = (
+            (wrapped_msg, wrapped_msg.msg)
+            for wrapped_msg in self.queue_by_key.get(key, ())
+            if not wrapped_msg.removed
+        )
+        return list(itertools.islice(live, limit))
+
+    def remove_messages_for_key(self, key: str, handles: Iterable) -> int:
+        """
+        Remove a batch of messages from queue for key.
+
+        Messages are only marked as removed, and leave the deque once they
+        reach its front, so removing delivered messages is O(1) each.
+
+        Args:
+            key: The key to use for lookup
+            handles: The handles returned by `peek_messages_for_key`
+
+        Returns:
+            The number of messages removed
+
+        """
+        removed = 0
+        for wrapped_msg in handles:
+            if not wrapped_msg.removed:
+                wrapped_msg.removed = True
+                self._discount(key)
+                removed += 1
+        self._trim(key)
+        return removed
+
+    def _compact(self):
+        # drop the heap entries of messages delivered before their expiry
+        self.expiry_heap = [
+            (wrapped_msg.timestamp, next(self._sequence), key)
+            for key, queue in self.queue_by_key.items()
+            for wrapped_msg in queue
+            if not wrapped_msg.removed
+        ]
+        heapq.heapify(self.expiry_heap)
+
+    def _discount(self, key: str):
+        self.total_count -= 1
+        self.count_by_key[key] -= 1
+        if not self.count_by_key[key]:
+            del self.count_by_key[key]
+
+    def _trim(self, key: str):
+        queue = self.queue_by_key.get(key)
+        if queue is None:
+            return
+        while queue and queue[0].removed:
+            queue.popleft()
+        if not queue:
+            del self.queue_by_key[key]
@@ -5,6 +5,7 @@ import logging
 from aiohttp import web
 
 from ...messaging.error import MessageParseError
+from ...utils.task_queue import TaskQueueFullError
 
 from .base import BaseInboundTransport, InboundTransportSetupError
 
@@ -93,6 +94,10 @@ class HttpTransport(BaseInboundTransport):
                 inbound = await session.receive(body)
             except MessageParseError:
                 raise web.HTTPBadRequest()
+            except TaskQueueFullError:
+                # ask the sender to retry later rather than queue without bound
+                LOGGER.warning("Inbound message rejected, dispatcher queue is full")
+                raise web.HTTPServiceUnavailable(headers={"Retry-After": "1"})
 
             if inbound.receipt.direct_response_requested:
                 response = await session.wait_response()
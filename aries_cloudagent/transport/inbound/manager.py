@@ -18,9 +18,10 @@ from .base import (
     InboundTransportConfiguration,
     InboundTransportRegistrationError,
 )
-from .delivery_queue import DeliveryQueue
+from .delivery_queue import BaseDeliveryQueue, DeliveryQueue
 from .message import InboundMessage
 from .session import InboundSession
+from .sqlite_queue import SqliteDeliveryQueue
 
 LOGGER = logging.getLogger(__name__)
 MODULE_BASE_PATH = "aries_cloudagent.transport.inbound"
@@ -29,6 +30,8 @@ MODULE_BASE_PATH = "aries_cloudagent.transport.inbound"
 class InboundTransportManager:
     """Inbound transport manager class."""
 
+    UNDELIVERED_BATCH_SIZE = 100
+
     def __init__(
         self,
         context: InjectionContext,
@@ -45,7 +48,7 @@ class InboundTransportManager:
         self.sessions = OrderedDict()
         self.session_limit: asyncio.Semaphore = None
         self.task_queue = TaskQueue()
-        self.undelivered_queue: DeliveryQueue = None
+        self.undelivered_queue: BaseDeliveryQueue = None
 
     async def setup(self):
         """Perform setup operations."""
@@ -63,8 +66,19 @@ class InboundTransportManager:
             )
 
         # Setup queue for undelivered messages
-        if self.context.settings.get("transport.enable_undelivered_queue"):
-            self.undelivered_queue = DeliveryQueue()
+        settings = self.context.settings
+        queue_options = {
+            "ttl_seconds": settings.get("transport.undelivered_queue_ttl"),
+            "max_messages_per_key": settings.get(
+                "transport.undelivered_queue_key_limit"
+            ),
+        }
+        if settings.get("transport.undelivered_queue_path"):
+            self.undelivered_queue = SqliteDeliveryQueue(
+                settings["transport.undelivered_queue_path"], **queue_options
+            )
+        elif settings.get("transport.enable_undelivered_queue"):
+            self.undelivered_queue = DeliveryQueue(**queue_options)
 
         # self.session_limit = asyncio.Semaphore(50)
 
@@ -140,6 +154,8 @@ class InboundTransportManager:
         await self.task_queue.complete(None if wait else 0)
         for transport in self.running_transports.values():
             await transport.stop()
+        if self.undelivered_queue:
+            self.undelivered_queue.close()
 
     async def create_session(
         self,
@@ -228,26 +244,35 @@ class InboundTransportManager:
         session and could not be delivered via an outbound transport.
         """
         if self.undelivered_queue:
-            self.undelivered_queue.add_message(outbound)
-            return True
+            return self.undelivered_queue.add_message(outbound)
         return False
 
     def process_undelivered(self, session: InboundSession):
         """
         Interact with undelivered queue to find applicable messages.
 
+        Messages are read from the queue in batches, and the messages accepted
+        by the session are removed together.
+
         Args:
             session: The inbound session
         """
         if session and session.can_respond and self.undelivered_queue:
             for key in session.reply_verkeys:
-                for (
-                    undelivered_message
-                ) in self.undelivered_queue.inspect_all_messages_for_key(key):
-                    if session.accept_response(undelivered_message):
+                delivered = []
+                for handle, undelivered_message in (
+                    self.undelivered_queue.peek_messages_for_key(
+                        key, self.UNDELIVERED_BATCH_SIZE
+                    )
+                ):
+                    accepted = session.accept_response(undelivered_message)
+                    if accepted:
                         LOGGER.debug(
                             "Sending previously undelivered message via inbound session"
                         )
-                        self.undelivered_queue.remove_message_for_key(
-                            key, undelivered_message
-                        )
+                        delivered.append(handle)
+                    elif accepted.retry:
+                        # the session is busy with another response
+                        break
+                if delivered:
+                    self.undelivered_queue.remove_messages_for_key(key, delivered)
@@ -0,0 +1,284 @@
+"""A delivery queue persisted to a local SQLite database."""
+
+import json
+import logging
+import sqlite3
+import time
+
+from base64 import b64decode, b64encode
+from typing import Iterable, Sequence, Tuple, Union
+
+from ...connections.models.connection_target import ConnectionTarget
+
+from ..outbound.message import OutboundMessage
+
+from .delivery_queue import BaseDeliveryQueue
+
+LOGGER = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recipient_key TEXT NOT NULL,
+    created REAL NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_messages_key ON messages (recipient_key, id);
+CREATE INDEX IF NOT EXISTS ix_messages_created ON messages (created);
+"""
+
+
+def _encode_payload(payload: Union[str, bytes]):
+    if isinstance(payload, bytes):
+        return {"base64": b64encode(payload).decode("ascii")}
+    return payload
+
+
+def _decode_payload(payload) -> Union[str, bytes]:
+    if isinstance(payload, dict):
+        return b64decode(payload["base64"])
+    return payload
+
+
+def _encode_target(target: ConnectionTarget) -> dict:
+    return {
+        "did": target.did,
+        "endpoint": target.endpoint,
+        "label": target.label,
+        "recipient_keys": target.recipient_keys,
+        "routing_keys": target.routing_keys,
+        "sender_key": target.sender_key,
+    }
+
+
+def encode_message(msg: OutboundMessage) -> str:
+    """Encode an outbound message for storage."""
+    return json.dumps(
+        {
+            "connection_id": msg.connection_id,
+            "enc_payload": _encode_payload(msg.enc_payload),
+            "endpoint": msg._endpoint,
+            "payload": _encode_payload(msg.payload),
+            "reply_session_id": msg.reply_session_id,
+            "reply_thread_id": msg.reply_thread_id,
+            "reply_to_verkey": msg.reply_to_verkey,
+            "reply_from_verkey": msg.reply_from_verkey,
+            "target": _encode_target(msg.target) if msg.target else None,
+            "target_list": [_encode_target(target) for target in msg.target_list],
+            "to_session_only": msg.to_session_only,
+        },
+        sort_keys=True,
+    )
+
+
+def decode_message(encoded: str) -> OutboundMessage:
+    """Decode an outbound message read from storage."""
+    values = json.loads(encoded)
+    values["enc_payload"] = _decode_payload(values["enc_payload"])
+    values["payload"] = _decode_payload(values["payload"])
+    if values["target"]:
+        values["target"] = ConnectionTarget(**values["target"])
+    values["target_list"] = [
+        ConnectionTarget(**target) for target in values["target_list"]
+    ]
+    return OutboundMessage(**values)
+
+
+class SqliteDeliveryQueue(BaseDeliveryQueue):
+    """
+    Delivery queue persisted to a SQLite database.
+
+    Messages held for agents without an endpoint survive a restart of the
+    agent. Rows are indexed by recipient key and insertion order, so that
+    the oldest messages for a key are read and removed without a scan, and
+    by creation time for expiry. Message counts per key are kept in memory
+    to enforce the quota without querying.
+    """
+
+    EXPIRE_INTERVAL = 60.0
+
+    def __init__(
+        self, path: str, *, ttl_seconds: int = None, max_messages_per_key: int = None
+    ):
+        """
+        Open the queue database, creating it if necessary.
+
+        Args:
+            path: the path of the database file
+            ttl_seconds: seconds after which undelivered messages are dropped
+            max_messages_per_key: the quota of messages held for one key
+
+        """
+        super().__init__(
+            ttl_seconds=ttl_seconds, max_messages_per_key=max_messages_per_key
+        )
+        self.path = path
+        self.conn = sqlite3.connect(path, isolation_level=None)
+        # the write-ahead log keeps commits durable across a crash of the
+        # agent without a sync of the database file per message
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.count_by_key = dict(
+            self.conn.execute(
+                "SELECT recipient_key, COUNT(*) FROM messages GROUP BY recipient_key"
+            )
+        )
+        self._last_expired = 0.0
+        self.expire_messages()
+
+    def expire_messages(self, ttl=None):
+        """
+        Expire messages that are past the time limit.
+
+        Args:
+            ttl: Optional. Allows override of configured ttl
+        """
+        ttl_seconds = ttl or self.ttl_seconds
+        horizon = time.time() - ttl_seconds
+        self._last_expired = time.time()
+        with self.conn:
+            self.conn.execute("BEGIN")
+            expired = self.conn.execute(
+                "SELECT recipient_key, COUNT(*) FROM messages WHERE created < ? "
+                "GROUP BY recipient_key",
+                (horizon,),
+            ).fetchall()
+            if expired:
+                self.conn.execute("DELETE FROM messages WHERE created < ?", (horizon,))
+        for key, count in expired:
+            self._discount(key, count)
+        if expired:
+            LOGGER.info(
+                "Expired %d undelivered messages", sum(count for _, count in expired)
+            )
+
+    def add_message(self, msg: OutboundMessage) -> bool:
+        """
+        Add an OutboundMessage to delivery queue.
+
+        The message is added once per recipient key with remaining quota
+
+        Args:
+            msg: The OutboundMessage to add
+
+        Returns:
+            True if the message was queued for at least one key
+
+        """
+        now = time.time()
+        if now - self._last_expired > self.EXPIRE_INTERVAL:
+            self.expire_messages()
+        keys = [key for key in self.message_keys(msg) if self.has_quota(key)]
+        if not keys:
+            return False
+        encoded = encode_message(msg)
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.executemany(
+                "INSERT INTO messages (recipient_key, created, message) "
+                "VALUES (?, ?, ?)",
+                ((key, now, encoded) for key in keys),
+            )
+        for key in keys:
+            self.count_by_key[key] = self.count_by_key.get(key, 0) + 1
+        return True
+
+    def message_count_for_key(self, key: str) -> int:
+        """
+        Count of queued messages by key.
+
+        Args:
+            key: The key to use for lookup
+        """
+        return self.count_by_key.get(key, 0)
+
+    def get_one_message_for_key(self, key: str) -> OutboundMessage:
+        """
+        Remove and return a matching message.
+
+        Args:
+            key: The key to use for lookup
+        """
+        for handle, msg in self.peek_messages_for_key(key, 1):
+            self.remove_messages_for_key(key, (handle,))
+            return msg
+
+    def peek_messages_for_key(
+        self, key: str, limit: int = None
+    ) -> Sequence[Tuple[int, OutboundMessage]]:
+        """
+        Return the oldest messages for key without removing them.
+
+        Args:
+            key: The key to use for lookup
+            limit: The maximum number of messages to return
+
+        Returns:
+            A list of (handle, message) pairs, oldest first
+
+        """
+        if not self.message_count_for_key(key):
+            return []
+        rows = self.conn.execute(
+            "SELECT id, message FROM messages WHERE recipient_key = ? "
+            "ORDER BY id LIMIT ?",
+            (key, -1 if limit is None else limit),
+        )
+        return [(row_id, decode_message(message)) for row_id, message in rows]
+
+    def remove_messages_for_key(self, key: str, handles: Iterable) -> int:
+        """
+        Remove a batch of messages from queue for key.
+
+        Args:
+            key: The key to use for lookup
+            handles: The handles returned by `peek_messages_for_key`
+
+        Returns:
+            The number of messages removed
+
+        """
+        handles = list(handles)
+        if not handles:
+            return 0
+        with self.conn:
+            self.conn.execute("BEGIN")
+            removed = self.conn.executemany(
+                "DELETE FROM messages WHERE id = ? AND recipient_key = ?",
+                ((handle, key) for handle in handles),
+            ).rowcount
+        self._discount(key, removed)
+        return removed
+
+    def remove_message_for_key(self, key: str, msg: OutboundMessage):
+        """
+        Remove specified message from queue for key.
+
+        Messages read from the database are new instances, so the message
+        is matched by its stored encoding.
+
+        Args:
+            key: The key to use for lookup
+            msg: The message to remove from the queue
+        """
+        if not self.message_count_for_key(key):
+            return
+        row = self.conn.execute(
+            "SELECT id FROM messages WHERE recipient_key = ? AND message = ? "
+            "ORDER BY id LIMIT 1",
+            (key, encode_message(msg)),
+        ).fetchone()
+        if row:
+            self.remove_messages_for_key(key, row)
+
+    def close(self):
+        """Close the queue database."""
+        self.conn.close()
+
+    def _discount(self, key: str, count: int):
+        remaining = self.count_by_key.get(key, 0) - count
+        if remaining > 0:
+            self.count_by_key[key] = remaining
+        else:
+            self.count_by_key.pop(key, None)
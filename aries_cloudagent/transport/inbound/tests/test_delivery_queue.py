@@ -64,3 +64,45 @@ class TestDeliveryQueue(AsyncTestCase):
     async def test_count_zero_with_no_items(self):
         queue = DeliveryQueue()
         assert queue.message_count_for_key("aaa") == 0
+
+    async def test_message_key_limit(self):
+        queue = DeliveryQueue(max_messages_per_key=2)
+
+        t = ConnectionTarget(recipient_keys=["aaa"])
+        for _ in range(2):
+            assert queue.add_message(OutboundMessage(payload="x", target=t))
+        assert not queue.add_message(OutboundMessage(payload="x", target=t))
+        assert queue.message_count_for_key("aaa") == 2
+
+    async def test_peek_and_remove_batch(self):
+        queue = DeliveryQueue()
+
+        t = ConnectionTarget(recipient_keys=["aaa"])
+        msgs = [OutboundMessage(payload=str(i), target=t) for i in range(5)]
+        for msg in msgs:
+            queue.add_message(msg)
+
+        batch = queue.peek_messages_for_key("aaa", 3)
+        assert [msg for _, msg in batch] == msgs[:3]
+        assert queue.remove_messages_for_key("aaa", [batch[0][0], batch[2][0]]) == 2
+        assert queue.remove_messages_for_key("aaa", [batch[0][0]]) == 0
+        assert queue.message_count_for_key("aaa") == 3
+        assert list(queue.inspect_all_messages_for_key("aaa")) == [
+            msgs[1],
+            msgs[3],
+            msgs[4],
+        ]
+        assert queue.get_one_message_for_key("aaa") == msgs[1]
+        queue.expire_messages(ttl=-10)
+        assert queue.message_count_for_key("aaa") == 0
+        assert not queue.queue_by_key and not queue.expiry_heap
+
+    async def test_expiry_heap_compacted(self):
+        queue = DeliveryQueue()
+
+        t = ConnectionTarget(recipient_keys=["aaa"])
+        for i in range(200):
+            queue.add_message(OutboundMessage(payload=str(i), target=t))
+            queue.get_one_message_for_key("aaa")
+        assert queue.total_count == 0
+        assert len(queue.expiry_heap) <= 64 + 1
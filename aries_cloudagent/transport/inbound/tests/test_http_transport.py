@@ -136,6 +136,15 @@ class TestHttpTransport(AioHTTPTestCase):
             assert status == 400
             assert str(status) in result
 
+            mock_session.return_value = async_mock.MagicMock(
+                receive=async_mock.CoroutineMock(
+                    side_effect=test_module.TaskQueueFullError()
+                ),
+            )
+            async with self.client.post("/", data=test_message) as resp:
+                assert resp.status == 503
+                assert resp.headers["Retry-After"] == "1"
+
         await self.transport.stop()
 
     @unittest_run_loop
@@ -1,5 +1,8 @@
 import asyncio
 
+from os.path import join
+from tempfile import TemporaryDirectory
+
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
 
 from ....config.injection_context import InjectionContext
@@ -9,6 +12,8 @@ from ...outbound.message import OutboundMessage
 from ...wire_format import BaseWireFormat
 from ..base import InboundTransportConfiguration, InboundTransportRegistrationError
 from ..manager import InboundTransportManager
+from ..session import AcceptResult
+from ..sqlite_queue import SqliteDeliveryQueue
 
 
 class TestInboundTransportManager(AsyncTestCase):
@@ -193,6 +198,53 @@ class TestInboundTransportManager(AsyncTestCase):
             mock_accept.assert_called_once_with(test_outbound)
         assert not mgr.undelivered_queue.has_message_for_key(test_verkey)
 
+    async def test_process_undelivered_retry(self):
+        context = InjectionContext()
+        context.update_settings({"transport.enable_undelivered_queue": True})
+        test_verkey = "test-verkey"
+        mgr = InboundTransportManager(context, None)
+        await mgr.setup()
+
+        outbound = [OutboundMessage(payload=str(i)) for i in range(3)]
+        for msg in outbound:
+            msg.reply_to_verkey = test_verkey
+            mgr.return_undelivered(msg)
+
+        session = await mgr.create_session(
+            "http", can_respond=True, wire_format=async_mock.MagicMock()
+        )
+        session.add_reply_verkeys(test_verkey)
+
+        with async_mock.patch.object(
+            session,
+            "accept_response",
+            side_effect=[
+                AcceptResult(True),
+                AcceptResult(False),
+                AcceptResult(False, True),
+            ],
+        ) as mock_accept:
+            mgr.process_undelivered(session)
+            assert mock_accept.call_count == 3
+        assert list(mgr.undelivered_queue.inspect_all_messages_for_key(test_verkey)) == (
+            outbound[1:]
+        )
+
+    async def test_setup_persistent_undelivered(self):
+        with TemporaryDirectory() as queue_dir:
+            context = InjectionContext()
+            context.update_settings(
+                {
+                    "transport.undelivered_queue_path": join(queue_dir, "queue.db"),
+                    "transport.undelivered_queue_key_limit": 10,
+                }
+            )
+            mgr = InboundTransportManager(context, None)
+            await mgr.setup()
+            assert isinstance(mgr.undelivered_queue, SqliteDeliveryQueue)
+            assert mgr.undelivered_queue.max_messages_per_key == 10
+            await mgr.stop()
+
     async def test_return_undelivered_false(self):
         context = InjectionContext()
         context.update_settings({"transport.enable_undelivered_queue": False})
@@ -0,0 +1,70 @@
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from ....connections.models.connection_target import ConnectionTarget
+from ....transport.outbound.message import OutboundMessage
+
+from ..sqlite_queue import SqliteDeliveryQueue, decode_message, encode_message
+
+
+class TestSqliteDeliveryQueue(TestCase):
+    def setUp(self):
+        self.queue_dir = TemporaryDirectory()
+        self.path = join(self.queue_dir.name, "queue.db")
+
+    def tearDown(self):
+        self.queue_dir.cleanup()
+
+    def test_encode_decode(self):
+        msg = OutboundMessage(
+            connection_id="conn-id",
+            enc_payload=b"\x00packed",
+            endpoint="http://localhost",
+            payload="x",
+            reply_to_verkey="bbb",
+            target=ConnectionTarget(recipient_keys=["aaa"], routing_keys=["ccc"]),
+            target_list=[ConnectionTarget(endpoint="http://localhost")],
+        )
+        decoded = decode_message(encode_message(msg))
+        assert decoded.enc_payload == b"\x00packed"
+        assert decoded.payload == "x"
+        assert decoded._endpoint == "http://localhost"
+        assert decoded.target.recipient_keys == ["aaa"]
+        assert decoded.target.routing_keys == ["ccc"]
+        assert decoded.target_list[0].endpoint == "http://localhost"
+        assert encode_message(decoded) == encode_message(msg)
+
+    def test_persist_and_drain(self):
+        queue = SqliteDeliveryQueue(self.path, max_messages_per_key=3)
+        t = ConnectionTarget(recipient_keys=["aaa"])
+        for i in range(4):
+            queue.add_message(OutboundMessage(payload=str(i), target=t))
+        queue.add_message(OutboundMessage(payload="y", reply_to_verkey="bbb"))
+        queue.close()
+
+        queue = SqliteDeliveryQueue(self.path)
+        assert queue.message_count_for_key("aaa") == 3
+        assert queue.has_message_for_key("bbb")
+        batch = queue.peek_messages_for_key("aaa", 2)
+        assert [msg.payload for _, msg in batch] == ["0", "1"]
+        assert queue.remove_messages_for_key("aaa", [handle for handle, _ in batch]) == 2
+        assert queue.get_one_message_for_key("aaa").payload == "2"
+        assert queue.get_one_message_for_key("aaa") is None
+        assert not queue.has_message_for_key("aaa")
+
+        msg = next(queue.inspect_all_messages_for_key("bbb"))
+        queue.remove_message_for_key("bbb", msg)
+        assert not queue.has_message_for_key("bbb")
+        queue.close()
+
+    def test_message_ttl(self):
+        queue = SqliteDeliveryQueue(self.path)
+        t = ConnectionTarget(recipient_keys=["aaa", "bbb"])
+        assert queue.add_message(OutboundMessage(payload="x", target=t))
+        assert queue.message_count_for_key("aaa") == 1
+        queue.expire_messages(ttl=-10)
+        assert not queue.has_message_for_key("aaa")
+        assert not queue.has_message_for_key("bbb")
+        assert queue.peek_messages_for_key("aaa") == []
+        queue.close()
@@ -95,3 +95,26 @@ class TestWsTransport(AioHTTPTestCase):
             assert result == {"response": "ok"}
 
         await self.transport.stop()
+
+    @unittest_run_loop
+    async def test_message_dropped_queue_full(self):
+        await self.transport.start()
+
+        async with self.client.ws_connect("/") as ws:
+            self.result_event = asyncio.Event()
+            with async_mock.patch.object(
+                InboundSession, "receive", async_mock.CoroutineMock()
+            ) as mock_receive:
+                mock_receive.side_effect = test_module.TaskQueueFullError()
+                await ws.send_json({"test": "dropped"})
+                await asyncio.sleep(0.05)
+                mock_receive.assert_awaited_once()
+
+            # the connection stays open for later messages
+            await ws.send_json({"test": "message"})
+            await asyncio.wait((self.result_event.wait(),), timeout=0.1)
+            assert [received for received, _, _ in self.message_results] == [
+                {"test": "message"}
+            ]
+
+        await self.transport.stop()
@@ -6,6 +6,7 @@ import logging
 from aiohttp import web, WSMessage, WSMsgType
 
 from ...messaging.error import MessageParseError
+from ...utils.task_queue import TaskQueueFullError
 
 from .base import BaseInboundTransport, InboundTransportSetupError
 
@@ -108,6 +109,10 @@ class WsTransport(BaseInboundTransport):
                             await session.receive(msg.data)
                         except MessageParseError:
                             await ws.close(1003)  # unsupported data error
+                        except TaskQueueFullError:
+                            LOGGER.warning(
+                                "Websocket message dropped, dispatcher queue is full"
+                            )
                     elif msg.type == WSMsgType.ERROR:
                         LOGGER.error(
                             "Websocket connection closed with exception: %s",
@@ -0,0 +1,136 @@
+"""Per-endpoint retry backoff and circuit breaking for outbound delivery."""
+
+import logging
+import random
+
+LOGGER = logging.getLogger(__name__)
+
+
+class EndpointState:
+    """Delivery health of a single endpoint."""
+
+    def __init__(self):
+        """Initialize the endpoint state."""
+        self.failures = 0
+        self.open_until: float = None
+        self.probing = False
+
+    @property
+    def open(self) -> bool:
+        """Accessor for the open state of the circuit."""
+        return self.open_until is not None
+
+
+class EndpointBackoff:
+    """
+    Track consecutive delivery failures per endpoint.
+
+    Retries are spread out with exponential backoff and jitter. Once an
+    endpoint fails too often its circuit opens: messages for it are parked
+    until a single probe delivery succeeds and closes the circuit again.
+    """
+
+    BASE_DELAY = 1.0
+    MAX_DELAY = 300.0
+    FAILURE_THRESHOLD = 5
+
+    def __init__(
+        self,
+        base_delay: float = None,
+        max_delay: float = None,
+        failure_threshold: int = None,
+    ):
+        """
+        Initialize an `EndpointBackoff` instance.
+
+        Args:
+            base_delay: seconds to wait before retrying after a first failure
+            max_delay: upper bound on the seconds to wait between retries
+            failure_threshold: consecutive failures after which the circuit opens
+
+        """
+        self.base_delay = base_delay or self.BASE_DELAY
+        self.max_delay = max_delay or self.MAX_DELAY
+        self.failure_threshold = failure_threshold or self.FAILURE_THRESHOLD
+        self._endpoints = {}
+
+    def delay(self, failures: int) -> float:
+        """Get a randomized delay after a number of consecutive failures."""
+        delay = min(self.max_delay, self.base_delay * 2 ** min(failures - 1, 32))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def failure(self, endpoint: str, now: float) -> float:
+        """
+        Record a failed delivery.
+
+        Returns:
+            The time at which the failed message should be retried
+
+        """
+        state = self._endpoints.get(endpoint)
+        if not state:
+            state = self._endpoints[endpoint] = EndpointState()
+        state.failures += 1
+        state.probing = False
+        retry_at = now + self.delay(state.failures)
+        if state.failures >= self.failure_threshold:
+            if not state.open:
+                LOGGER.warning(
+                    "Endpoint %s failed %d times, parking its messages",
+                    endpoint,
+                    state.failures,
+                )
+            state.open_until = retry_at
+        return retry_at
+
+    def success(self, endpoint: str) -> bool:
+        """
+        Record a successful delivery, closing the circuit.
+
+        Returns:
+            True if the endpoint had recorded failures
+
+        """
+        state = self._endpoints.pop(endpoint, None)
+        if state and state.open:
+            LOGGER.info("Endpoint %s recovered, resuming delivery", endpoint)
+        return state is not None
+
+    def allow(self, endpoint: str, now: float) -> bool:
+        """
+        Check whether a message may be delivered to an endpoint now.
+
+        When the circuit is open and due to be retried, the first message
+        checked is let through as the probe and the rest remain parked.
+        """
+        state = self._endpoints.get(endpoint)
+        if not state or not state.open:
+            return True
+        if state.probing or now < state.open_until:
+            return False
+        state.probing = True
+        return True
+
+    def is_open(self, endpoint: str) -> bool:
+        """Check whether the circuit for an endpoint is open."""
+        state = self._endpoints.get(endpoint)
+        return bool(state and state.open)
+
+    def is_probing(self, endpoint: str) -> bool:
+        """Check whether a probe delivery to an endpoint is in progress."""
+        state = self._endpoints.get(endpoint)
+        return bool(state and state.probing)
+
+    def parked_until(self, endpoint: str) -> float:
+        """Get the time parked messages are due, or `None` while probing."""
+        state = self._endpoints.get(endpoint)
+        if state and state.open and not state.probing:
+            return state.open_until
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the endpoint statistics."""
+        return {
+            "failing": len(self._endpoints),
+            "open": sum(1 for state in self._endpoints.values() if state.open),
+        }
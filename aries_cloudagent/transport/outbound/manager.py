@@ -3,7 +3,6 @@
 import asyncio
 import json
 import logging
-import time
 
 from typing import Callable, Type, Union
 from urllib.parse import urlparse
@@ -18,6 +17,7 @@ from ...utils.tracing import trace_event, get_timer
 
 from ..wire_format import BaseWireFormat
 
+from .backoff import EndpointBackoff
 from .base import (
     BaseOutboundTransport,
     OutboundDeliveryError,
@@ -86,6 +86,7 @@ class OutboundTransportManager:
         self.registered_transports = {}
         self.running_transports = {}
         self.task_queue = TaskQueue(max_active=200)
+        self.backoff = EndpointBackoff()
         self._process_task: asyncio.Task = None
         if self.context.settings.get("transport.max_outbound_retry"):
             self.MAX_RETRY_COUNT = self.context.settings["transport.max_outbound_retry"]
@@ -315,7 +316,7 @@ class OutboundTransportManager:
             self.outbound_event.clear()
             loop_time = get_timer()
             upd_buffer = []
-            retry_count = 0
+            next_wake: float = None
 
             for queued in self.outbound_buffer:
                 if queued.state == QueuedOutboundMessage.STATE_DONE:
@@ -335,12 +336,19 @@ class OutboundTransportManager:
                     deliver = True
                 elif queued.state == QueuedOutboundMessage.STATE_RETRY:
                     if queued.retry_at < loop_time:
-                        queued.retry_at = None
                         deliver = True
-                    else:
-                        retry_count += 1
+                    elif next_wake is None or queued.retry_at < next_wake:
+                        next_wake = queued.retry_at
+
+                if deliver and not self.backoff.allow(queued.endpoint, loop_time):
+                    # endpoint is down, park the message until it is probed
+                    deliver = False
+                    parked_until = self.backoff.parked_until(queued.endpoint)
+                    if parked_until and (next_wake is None or parked_until < next_wake):
+                        next_wake = parked_until
 
                 if deliver:
+                    queued.retry_at = None
                     queued.state = QueuedOutboundMessage.STATE_DELIVER
                     p_time = trace_event(
                         self.context.settings,
@@ -390,11 +398,19 @@ class OutboundTransportManager:
 
             self.outbound_buffer = upd_buffer
             if self.outbound_buffer:
-                if (not new_pending) and (not retry_count):
+                if new_pending:
+                    continue
+                if next_wake is None:
                     await self.outbound_event.wait()
-                elif retry_count:
-                    # only retries - yield here so we don't hog resources
-                    await asyncio.sleep(0.05)
+                else:
+                    # sleep until the next retry is due unless woken up earlier
+                    try:
+                        await asyncio.wait_for(
+                            self.outbound_event.wait(),
+                            max(next_wake - get_timer(), 0),
+                        )
+                    except asyncio.TimeoutError:
+                        pass
             else:
                 break
 
@@ -443,6 +459,10 @@ class OutboundTransportManager:
         """Handle completion of queued message delivery."""
         if completed.exc_info:
             queued.error = completed.exc_info
+            probe = self.backoff.is_probing(queued.endpoint)
+            retry_at = self.backoff.failure(queued.endpoint, get_timer())
+            if probe:
+                self.fail_parked(queued)
 
             if queued.retries:
                 if LOGGER.isEnabledFor(logging.DEBUG):
@@ -467,7 +487,7 @@ class OutboundTransportManager:
                     )
                 queued.retries -= 1
                 queued.state = QueuedOutboundMessage.STATE_RETRY
-                queued.retry_at = time.perf_counter() + 10
+                queued.retry_at = retry_at
             else:
                 LOGGER.exception(
                     ">>> Outbound message failed to deliver, NOT Re-queued.",
@@ -477,9 +497,41 @@ class OutboundTransportManager:
         else:
             queued.error = None
             queued.state = QueuedOutboundMessage.STATE_DONE
+            if self.backoff.success(queued.endpoint):
+                self.resume_parked(queued.endpoint)
         queued.task = None
         self.process_queued()
 
+    def fail_parked(self, probe: QueuedOutboundMessage):
+        """
+        Count a failed probe as a failed attempt for every parked message.
+
+        Parked messages are not retried individually, so they give up
+        after the same number of failed attempts on their endpoint.
+        """
+        for queued in self.outbound_buffer:
+            if queued is probe or queued.endpoint != probe.endpoint:
+                continue
+            if queued.state in (
+                QueuedOutboundMessage.STATE_PENDING,
+                QueuedOutboundMessage.STATE_RETRY,
+            ):
+                if queued.retries:
+                    queued.retries -= 1
+                else:
+                    queued.error = probe.error
+                    queued.state = QueuedOutboundMessage.STATE_DONE
+
+    def resume_parked(self, endpoint: str):
+        """Make messages waiting on a recovered endpoint due immediately."""
+        now = get_timer()
+        for queued in self.outbound_buffer:
+            if (
+                queued.state == QueuedOutboundMessage.STATE_RETRY
+                and queued.endpoint == endpoint
+            ):
+                queued.retry_at = now
+
     async def flush(self):
         """Wait for any queued messages to be delivered."""
         proc_task = self.process_queued()
@@ -0,0 +1,42 @@
+from asynctest import TestCase as AsyncTestCase
+
+from ..backoff import EndpointBackoff
+
+
+class TestEndpointBackoff(AsyncTestCase):
+    def test_delay(self):
+        backoff = EndpointBackoff(base_delay=1, max_delay=10)
+        for failures, upper in ((1, 1), (2, 2), (3, 4), (4, 8), (5, 10), (100, 10)):
+            delays = [backoff.delay(failures) for _ in range(20)]
+            assert all(upper / 2 <= delay <= upper for delay in delays)
+        assert len(set(backoff.delay(3) for _ in range(20))) > 1  # jittered
+
+    def test_circuit(self):
+        backoff = EndpointBackoff(base_delay=1, failure_threshold=3)
+        assert backoff.allow("http://a", 0)
+        assert not backoff.success("http://a")
+
+        for now in range(3):
+            assert backoff.allow("http://a", now)
+            backoff.failure("http://a", now)
+        assert backoff.is_open("http://a")
+        assert not backoff.is_open("http://b")
+        assert backoff.stats == {"failing": 1, "open": 1}
+
+        due = backoff.parked_until("http://a")
+        assert 2 + 2 <= due <= 2 + 4
+        assert not backoff.allow("http://a", due - 0.1)
+        assert backoff.allow("http://a", due)  # probe
+        assert backoff.is_probing("http://a")
+        assert backoff.parked_until("http://a") is None
+        assert not backoff.allow("http://a", due)
+
+        retry_at = backoff.failure("http://a", due)
+        assert backoff.parked_until("http://a") == retry_at
+        assert retry_at - due >= 4
+
+        assert backoff.allow("http://a", retry_at)
+        assert backoff.success("http://a")
+        assert not backoff.is_open("http://a")
+        assert backoff.allow("http://a", retry_at)
+        assert backoff.stats == {"failing": 0, "open": 0}
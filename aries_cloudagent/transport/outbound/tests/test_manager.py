@@ -7,6 +7,7 @@ from ....config.injection_context import InjectionContext
 from ....connections.models.connection_target import ConnectionTarget
 
 from .. import manager as test_module
+from ..backoff import EndpointBackoff
 from ..manager import (
     OutboundDeliveryError,
     OutboundTransportManager,
@@ -220,9 +221,9 @@ class TestOutboundTransportManager(AsyncTestCase):
         mgr.outbound_buffer.append(mock_queued)
 
         with async_mock.patch.object(
-            test_module.asyncio, "sleep", async_mock.CoroutineMock()
-        ) as mock_sleep_x:
-            mock_sleep_x.side_effect = KeyError()
+            mgr.outbound_event, "wait", async_mock.CoroutineMock()
+        ) as mock_wait_x:
+            mock_wait_x.side_effect = KeyError()
             with self.assertRaises(KeyError):  # cover retry logic and bail
                 await mgr._process_loop()
             assert mock_queued.retry_at is not None
@@ -309,3 +310,104 @@ class TestOutboundTransportManager(AsyncTestCase):
         ) as mock_process:
             mock_logger_enabled.return_value = True  # cover debug logging
             mgr.finished_deliver(mock_queued, mock_completed_x)
+
+    async def test_finished_deliver_backoff(self):
+        context = InjectionContext()
+        mgr = OutboundTransportManager(context)
+        mgr.backoff = EndpointBackoff(base_delay=1, failure_threshold=2)
+        queued = [
+            QueuedOutboundMessage(context, None, None, "transport_cls")
+            for _ in range(3)
+        ]
+        for q in queued:
+            q.endpoint = "http://localhost"
+            q.retries = 2
+            q.state = QueuedOutboundMessage.STATE_DELIVER
+        mgr.outbound_buffer.extend(queued)
+        mock_completed_x = async_mock.MagicMock(exc_info=KeyError("down"))
+
+        with async_mock.patch.object(
+            test_module.LOGGER, "error", async_mock.MagicMock()
+        ), async_mock.patch.object(mgr, "process_queued", async_mock.MagicMock()):
+            now = test_module.get_timer()
+            mgr.finished_deliver(queued[0], mock_completed_x)
+            assert queued[0].state == QueuedOutboundMessage.STATE_RETRY
+            assert now + 0.5 <= queued[0].retry_at <= now + 1.5
+            assert not mgr.backoff.is_open("http://localhost")
+
+            mgr.finished_deliver(queued[1], mock_completed_x)
+            assert mgr.backoff.is_open("http://localhost")
+            assert queued[1].retry_at > queued[0].retry_at - 0.5
+
+            # the circuit is open, nothing is sent until it is due
+            assert not mgr.backoff.allow("http://localhost", now)
+            due = mgr.backoff.parked_until("http://localhost")
+            assert mgr.backoff.allow("http://localhost", due)
+            assert not mgr.backoff.allow("http://localhost", due)
+
+            # a failed probe counts as an attempt for each parked message
+            queued[2].state = QueuedOutboundMessage.STATE_DELIVER
+            mgr.finished_deliver(queued[2], mock_completed_x)
+            assert [q.retries for q in queued] == [0, 0, 1]
+
+            # a successful probe resumes the parked messages
+            assert mgr.backoff.allow("http://localhost", due + 3600)
+            queued[2].state = QueuedOutboundMessage.STATE_DELIVER
+            mgr.finished_deliver(queued[2], async_mock.MagicMock(exc_info=None))
+            assert queued[2].state == QueuedOutboundMessage.STATE_DONE
+            assert not mgr.backoff.is_open("http://localhost")
+            assert queued[0].retry_at <= test_module.get_timer()
+            assert queued[1].retry_at <= test_module.get_timer()
+
+    async def test_deliver_parked_endpoint(self):
+        context = InjectionContext()
+        mgr = OutboundTransportManager(context)
+        mgr.backoff = EndpointBackoff(base_delay=0.02, failure_threshold=1)
+        attempts = []
+        down = [True]
+
+        async def handle_message(context, payload, endpoint):
+            attempts.append(payload)
+            if down[0]:
+                raise KeyError("down")
+
+        transport = async_mock.MagicMock(schemes=["http"])
+        transport.handle_message = handle_message
+        transport.start = async_mock.CoroutineMock()
+        transport_cls = async_mock.MagicMock(schemes=["http"], return_value=transport)
+        mgr.register_class(transport_cls, "transport_cls")
+        await mgr.start()
+        await mgr.task_queue
+
+        with async_mock.patch.object(test_module.LOGGER, "error"):
+            mgr.enqueue_message(
+                context,
+                OutboundMessage(
+                    payload="{}",
+                    enc_payload="first",
+                    target=ConnectionTarget(endpoint="http://localhost"),
+                ),
+            )
+            await asyncio.sleep(0.005)
+            assert attempts == ["first"]
+            assert mgr.backoff.is_open("http://localhost")
+
+            for i in range(5):
+                mgr.enqueue_message(
+                    context,
+                    OutboundMessage(
+                        payload="{}",
+                        enc_payload=f"parked{i}",
+                        target=ConnectionTarget(endpoint="http://localhost"),
+                    ),
+                )
+            await asyncio.sleep(0.005)
+            assert attempts == ["first"]  # parked, not sent
+
+            down[0] = False
+            await asyncio.wait_for(mgr.flush(), 1)
+
+        # the failed message is retried as the probe, then the parked messages
+        assert attempts[:2] == ["first", "first"]
+        assert sorted(attempts[2:]) == [f"parked{i}" for i in range(5)]
+        assert not mgr.outbound_buffer
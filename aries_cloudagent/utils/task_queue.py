@@ -1,9 +1,10 @@
 """Classes for managing a set of asyncio tasks."""
 
 import asyncio
+import heapq
 import logging
 import time
-from typing import Callable, Coroutine, Tuple
+from typing import Callable, Coroutine, Hashable, Sequence, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
@@ -81,6 +82,7 @@ class PendingTask:
         self._cancelled = False
         self.complete_hook = complete_hook
         self.coro = coro
+        self.lane: str = None
         self.queued_time: float = queued_time
         self.unqueued_time: float = None
         self.ident = ident or coro_ident(coro)
@@ -121,11 +123,119 @@ class PendingTask:
         return f"<{self.__class__.__name__} ident={self.ident}>"
 
 
+class TaskQueueFullError(RuntimeError):
+    """Raised when a task is added to a lane with no room left."""
+
+
+class TaskLane:
+    """
+    A class of pending tasks sharing a priority and a depth limit.
+
+    Within a lane, tasks are started in weighted fair order across flows
+    (such as connections): every task gets a virtual finish time which
+    advances by 1 / weight for each task already waiting in its flow, so
+    one busy flow cannot hold back the tasks of the others.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        priority: int = 0,
+        max_pending: int = None,
+        max_burst: int = None,
+    ):
+        """
+        Initialize the task lane.
+
+        Args:
+            name: The lane name
+            priority: Lanes with a higher priority are served first
+            max_pending: The maximum number of tasks waiting in the lane
+            max_burst: The number of tasks started in a row while lower
+                priority lanes are waiting, before one of theirs is started
+        """
+        self.name = name
+        self.priority = priority
+        self.max_pending = max_pending
+        self.max_burst = max_burst
+        self.burst = 0
+        self.total_queued = 0
+        self.total_rejected = 0
+        self._flow_finish = {}
+        self._heap = []
+        self._seq = 0
+        self._virtual_time = 0.0
+
+    @property
+    def full(self) -> bool:
+        """Accessor for the full state of the lane."""
+        return bool(self.max_pending and len(self._heap) >= self.max_pending)
+
+    @property
+    def pending_tasks(self) -> Sequence[PendingTask]:
+        """Accessor for the waiting tasks, in the order they will be started."""
+        return [entry[-1] for entry in sorted(self._heap)]
+
+    def push(self, pending: PendingTask, flow: Hashable = None, weight: float = 1):
+        """Add a task to the lane."""
+        start = max(self._virtual_time, self._flow_finish.get(flow, 0.0))
+        finish = start + 1.0 / (weight or 1)
+        self._flow_finish[flow] = finish
+        self._seq += 1
+        heapq.heappush(self._heap, (finish, self._seq, flow, pending))
+        self.total_queued += 1
+
+    def pop(self) -> PendingTask:
+        """Remove the next task to start from the lane."""
+        finish, _seq, flow, pending = heapq.heappop(self._heap)
+        self._virtual_time = finish
+        if self._flow_finish.get(flow, 0.0) <= finish:
+            # no more tasks waiting for this flow
+            del self._flow_finish[flow]
+        return pending
+
+    def clear(self) -> Sequence[PendingTask]:
+        """Remove all waiting tasks from the lane."""
+        tasks = [entry[-1] for entry in self._heap]
+        self._heap = []
+        self._flow_finish = {}
+        return tasks
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the lane statistics."""
+        return {
+            "pending": len(self._heap),
+            "flows": len(self._flow_finish),
+            "queued": self.total_queued,
+            "rejected": self.total_rejected,
+        }
+
+    def __bool__(self) -> bool:
+        """
+        Support for the bool() builtin.
+
+        Return:
+            True - the lane exists even if there are no tasks
+        """
+        return True
+
+    def __len__(self) -> int:
+        """Support for the len() builtin."""
+        return len(self._heap)
+
+
 class TaskQueue:
     """A class for managing a set of asyncio tasks."""
 
+    DEFAULT_LANE = "default"
+
     def __init__(
-        self, max_active: int = 0, timed: bool = False, trace_fn: Callable = None
+        self,
+        max_active: int = 0,
+        timed: bool = False,
+        trace_fn: Callable = None,
+        lanes: Sequence[TaskLane] = None,
     ):
         """
         Initialize the task queue.
@@ -134,10 +244,13 @@ class TaskQueue:
             max_active: The maximum number of tasks to automatically run
             timed: A flag indicating that timing should be collected for tasks
             trace_fn: A callback for all completed tasks
+            lanes: The lanes for pending tasks, a single default lane if not given
         """
         self.loop = asyncio.get_event_loop()
         self.active_tasks = []
-        self.pending_tasks = []
+        self.lanes = {}
+        for lane in lanes or (TaskLane(self.DEFAULT_LANE),):
+            self.add_lane(lane)
         self.timed = timed
         self.total_done = 0
         self.total_failed = 0
@@ -172,15 +285,43 @@ class TaskQueue:
         """Accessor for the current number of active tasks in the queue."""
         return len(self.active_tasks)
 
+    @property
+    def pending_tasks(self) -> Sequence[PendingTask]:
+        """Accessor for the pending tasks, in lane priority order."""
+        return [pending for lane in self._lane_order for pending in lane.pending_tasks]
+
     @property
     def current_pending(self) -> int:
         """Accessor for the current number of pending tasks in the queue."""
-        return len(self.pending_tasks)
+        return sum(len(lane) for lane in self._lane_order)
 
     @property
     def current_size(self) -> int:
         """Accessor for the total number of tasks in the queue."""
-        return len(self.active_tasks) + len(self.pending_tasks)
+        return len(self.active_tasks) + self.current_pending
+
+    def add_lane(self, lane: TaskLane):
+        """Add or replace a lane for pending tasks."""
+        if lane.name in self.lanes:
+            for pending in self.lanes[lane.name].clear():
+                lane.push(pending)
+        self.lanes[lane.name] = lane
+        self._lane_order = sorted(
+            self.lanes.values(), key=lambda lane: lane.priority, reverse=True
+        )
+
+    def get_lane(self, name: str = None) -> TaskLane:
+        """Get a lane by name, falling back to the default or lowest priority lane."""
+        return (
+            self.lanes.get(name)
+            or self.lanes.get(self.DEFAULT_LANE)
+            or self._lane_order[-1]
+        )
+
+    @property
+    def lane_stats(self) -> dict:
+        """Accessor for the statistics of each lane."""
+        return {lane.name: lane.stats for lane in self._lane_order}
 
     def __bool__(self) -> bool:
         """
@@ -218,15 +359,16 @@ class TaskQueue:
         # waiting for the drain event, to avoid yielding to other queue methods
         while True:
             self._drain_evt.clear()
-            while self.pending_tasks and (
+            while self.current_pending and (
                 not self._max_active or len(self.active_tasks) < self._max_active
             ):
-                pending: PendingTask = self.pending_tasks.pop(0)
+                pending: PendingTask = self._next_lane().pop()
                 if pending.queued_time:
                     pending.unqueued_time = time.perf_counter()
                     timing = {
                         "queued": pending.queued_time,
                         "unqueued": pending.unqueued_time,
+                        "lane": pending.lane,
                     }
                 else:
                     timing = None
@@ -237,21 +379,53 @@ class TaskQueue:
                     pending.task = task
                 except ValueError:
                     LOGGER.warning("Pending task future already fulfilled")
-            if self.pending_tasks:
+            if self.current_pending:
                 await self._drain_evt.wait()
             else:
                 break
 
-    def add_pending(self, pending: PendingTask):
+    def _next_lane(self) -> TaskLane:
+        """Select the lane to start the next pending task from."""
+        waiting = [lane for lane in self._lane_order if len(lane)]
+        lane = waiting[0]
+        if len(waiting) > 1 and lane.max_burst:
+            if lane.burst >= lane.max_burst:
+                # give the next lane a turn so it cannot be starved
+                lane.burst = 0
+                return waiting[1]
+            lane.burst += 1
+        else:
+            lane.burst = 0
+        return lane
+
+    def add_pending(
+        self,
+        pending: PendingTask,
+        lane: str = None,
+        flow: Hashable = None,
+        weight: float = 1,
+    ):
         """
         Add a task to the pending queue.
 
         Args:
             pending: The `PendingTask` to add to the task queue
+            lane: The name of the lane to add the task to
+            flow: The flow the task belongs to, for fair ordering within the lane
+            weight: The relative share of the lane given to the flow
+
+        Raises:
+            TaskQueueFullError: If the lane has no room left
+
         """
+        task_lane = self.get_lane(lane)
+        if task_lane.full:
+            task_lane.total_rejected += 1
+            raise TaskQueueFullError(f"Task queue lane is full: {task_lane.name}")
         if self.timed and not pending.queued_time:
             pending.queued_time = time.perf_counter()
-        self.pending_tasks.append(pending)
+        pending.lane = task_lane.name
+        task_lane.push(pending, flow, weight)
         self.drain()
 
     def add_active(
@@ -310,7 +484,14 @@ class TaskQueue:
         return self.add_active(task, task_complete, ident, timing)
 
     def put(
-        self, coro: Coroutine, task_complete: Callable = None, ident: str = None
+        self,
+        coro: Coroutine,
+        task_complete: Callable = None,
+        ident: str = None,
+        *,
+        lane: str = None,
+        flow: Hashable = None,
+        weight: float = 1,
     ) -> PendingTask:
         """
         Add a new task to the queue, delaying execution if busy.
@@ -319,9 +500,15 @@ class TaskQueue:
             coro: The coroutine to run
             task_complete: A callback to run on completion
             ident: A string identifier for the task
+            lane: The name of the lane to wait in, if busy
+            flow: The flow the task belongs to, such as a connection
+            weight: The relative share of the lane given to the flow
 
         Returns: a future resolving to the asyncio task instance once queued
 
+        Raises:
+            TaskQueueFullError: If the task must wait and its lane has no room left
+
         """
         pending = PendingTask(coro, task_complete, ident)
         if self._cancelled:
@@ -329,7 +516,11 @@ class TaskQueue:
         elif self.ready:
             pending.task = self.run(coro, task_complete, pending.ident)
         else:
-            self.add_pending(pending)
+            try:
+                self.add_pending(pending, lane, flow, weight)
+            except TaskQueueFullError:
+                pending.cancel()
+                raise
         return pending
 
     def completed_task(
@@ -369,9 +560,9 @@ class TaskQueue:
         if self._drain_task:
             self._drain_task.cancel()
             self._drain_task = None
-        for pending in self.pending_tasks:
-            pending.cancel()
-        self.pending_tasks = []
+        for lane in self._lane_order:
+            for pending in lane.clear():
+                pending.cancel()
 
     def cancel(self):
         """Cancel any pending or active tasks in the queue."""
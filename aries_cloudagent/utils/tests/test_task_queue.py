@@ -1,7 +1,14 @@
 import asyncio
 from asynctest import mock as async_mock, TestCase as AsyncTestCase
 
-from ..task_queue import CompletedTask, PendingTask, TaskQueue, task_exc_info
+from ..task_queue import (
+    CompletedTask,
+    PendingTask,
+    TaskLane,
+    TaskQueue,
+    TaskQueueFullError,
+    task_exc_info,
+)
 
 
 async def retval(val, *, delay=0):
@@ -225,3 +232,92 @@ class TestTaskQueue(AsyncTestCase):
         assert len(completed) == 2
         assert "queued" not in completed[0][1]
         assert "queued" in completed[1][1]
+
+    async def test_lanes_priority_fairness(self):
+        completed = []
+
+        def done(complete: CompletedTask):
+            completed.append(complete.task.result())
+
+        queue = TaskQueue(
+            max_active=1,
+            timed=True,
+            lanes=[TaskLane("default"), TaskLane("priority", priority=1)],
+        )
+        queue.run(retval("blocker", delay=0.01))
+        for i in range(3):
+            queue.put(retval(f"busy{i}"), done, flow="busy")
+        queue.put(retval("quiet0"), done, flow="quiet")
+        queue.put(retval("ping"), done, lane="priority", flow="busy")
+        queue.put(retval("other0"), done, lane="unknown", flow="other")
+        assert queue.current_pending == 6
+        assert queue.pending_tasks[0].lane == "priority"
+
+        await queue.flush()
+        assert completed == ["ping", "busy0", "quiet0", "other0", "busy1", "busy2"]
+        assert queue.lane_stats == {
+            "priority": {"pending": 0, "flows": 0, "queued": 1, "rejected": 0},
+            "default": {"pending": 0, "flows": 0, "queued": 5, "rejected": 0},
+        }
+
+    async def test_lane_weight(self):
+        completed = []
+
+        def done(complete: CompletedTask):
+            completed.append(complete.task.result())
+
+        queue = TaskQueue(max_active=1)
+        queue.run(retval(None, delay=0.01))
+        for i in range(2):
+            queue.put(retval(f"light{i}"), done, flow="light")
+        for i in range(4):
+            queue.put(retval(f"heavy{i}"), done, flow="heavy", weight=2)
+        await queue.flush()
+        assert completed == ["heavy0", "light0", "heavy1", "heavy2", "light1", "heavy3"]
+
+    async def test_lane_burst(self):
+        completed = []
+
+        def done(complete: CompletedTask):
+            completed.append(complete.task.result())
+
+        queue = TaskQueue(
+            max_active=1,
+            lanes=[TaskLane("default"), TaskLane("priority", priority=1, max_burst=2)],
+        )
+        queue.run(retval(None, delay=0.01))
+        for i in range(2):
+            queue.put(retval(f"default{i}"), done)
+        for i in range(5):
+            queue.put(retval(f"ping{i}"), done, lane="priority")
+        await queue.flush()
+        assert completed == [
+            "ping0",
+            "ping1",
+            "default0",
+            "ping2",
+            "ping3",
+            "default1",
+            "ping4",
+        ]
+
+    async def test_lane_full(self):
+        queue = TaskQueue(max_active=1, lanes=[TaskLane("default", max_pending=1)])
+        queue.run(retval(None, delay=0.01))
+        queue.put(retval(1))
+        with self.assertRaises(TaskQueueFullError):
+            queue.put(retval(2))
+        assert queue.lane_stats["default"]["rejected"] == 1
+        await queue.flush()
+        assert not queue.current_pending
+
+    async def test_add_lane(self):
+        queue = TaskQueue(max_active=1)
+        queue.run(retval(None, delay=0.01))
+        pend = queue.put(retval(1))
+        queue.add_lane(TaskLane("default", max_pending=5))
+        assert queue.get_lane().max_pending == 5
+        assert queue.pending_tasks == [pend]
+        assert queue.get_lane("missing") is queue.get_lane()
+        await queue.flush()
+        assert pend.task.result() == 1
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import requests
 
@@ -20,6 +21,9 @@ from .. import tracing as test_module
 class TestTracing(AsyncTestCase):
     test_did = "55GkHamhTU1ZbTbV2ab9DE"
 
+    def setUp(self):
+        test_module.TRACE_EXPORTERS.clear()
+
     def test_get_timer(self):
         assert test_module.get_timer() > 0.0
 
@@ -142,13 +146,26 @@ class TestTracing(AsyncTestCase):
             "trace.target": "http://fluentd:8080/",
             "trace.tag": "acapy.trace",
         }
-        test_module.trace_event(
-            context,
-            message,
-            handler="message_handler",
-            perf_counter=None,
-            outcome="processed OK",
-        )
+        with async_mock.patch.object(
+            test_module.TraceExporter, "_post", async_mock.CoroutineMock()
+        ) as mock_post:
+            test_module.trace_event(
+                context,
+                message,
+                handler="message_handler",
+                perf_counter=None,
+                outcome="processed OK",
+            )
+            exporter = test_module.TRACE_EXPORTERS["http://fluentd:8080/acapy.trace"]
+            assert exporter.stats["buffered"] == 1
+            mock_post.assert_not_called()  # never posts from the caller
+
+            await test_module.close_trace_exporters()
+            (batch,), _ = mock_post.call_args
+            assert len(batch) == 1
+            assert batch[0]["thread_id"] == "dummy_thread_id_12345"
+            assert batch[0]["outcome"] == "processed OK"
+            assert not test_module.TRACE_EXPORTERS
 
     async def test_post_event_with_error(self):
         message = Ping()
@@ -158,7 +175,7 @@ class TestTracing(AsyncTestCase):
             "trace.target": "http://fluentd-dummy:8080/",
             "trace.tag": "acapy.trace",
         }
-        try:
+        with self.assertRaises(requests.exceptions.ConnectionError):
             test_module.trace_event(
                 context,
                 message,
@@ -167,9 +184,54 @@ class TestTracing(AsyncTestCase):
                 outcome="processed OK",
                 raise_errors=True,
             )
-            assert False
-        except requests.exceptions.ConnectionError as e:
-            pass
+        exporter = test_module.get_trace_exporter(
+            "http://fluentd-dummy:8080/acapy.trace"
+        )
+        assert exporter.stats["buffered"] == 0
+        assert exporter.stats["sent"] == 0
+
+        with async_mock.patch.object(
+            test_module.requests, "post", async_mock.MagicMock()
+        ) as mock_post:
+            test_module.trace_event(
+                context,
+                message,
+                handler="message_handler",
+                perf_counter=None,
+                outcome="processed OK",
+                raise_errors=True,
+            )
+            (url,), kwargs = mock_post.call_args
+            assert url == "http://fluentd-dummy:8080/acapy.trace"
+            assert json.loads(kwargs["data"])[0]["outcome"] == "processed OK"
+            mock_post.return_value.raise_for_status.assert_called_once_with()
+        assert exporter.stats["sent"] == 1
+        await test_module.close_trace_exporters()
+
+    async def test_exporter_batches(self):
+        exporter = test_module.TraceExporter(
+            "http://localhost/trace", max_buffer=5, max_batch=2, batch_interval=10
+        )
+        with async_mock.patch.object(
+            exporter, "_post", async_mock.CoroutineMock()
+        ) as mock_post:
+            results = [exporter.enqueue({"n": n}) for n in range(7)]
+            assert results == [True] * 5 + [False] * 2
+            assert exporter.stats["dropped"] == 2
+
+            # a full batch is posted without waiting for the interval
+            await asyncio.wait_for(exporter.flush(), 1)
+            assert [call[0][0] for call in mock_post.call_args_list] == [
+                [{"n": 0}, {"n": 1}],
+                [{"n": 2}, {"n": 3}],
+                [{"n": 4}],
+            ]
+            assert exporter.batch_interval == 10
+            assert exporter.stats["buffered"] == 0
+
+            assert exporter.enqueue({"n": 5})
+            await exporter.close()
+            assert mock_post.call_count == 4
 
     def test_post_msg_decorator_event(self):
         message = Ping()
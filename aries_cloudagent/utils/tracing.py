@@ -1,11 +1,15 @@
 """Event tracing."""
 
+import asyncio
 import json
 import logging
 import time
 import datetime
+from collections import deque
+
 import requests
 
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from marshmallow import fields
 
 from ..transport.inbound.message import InboundMessage
@@ -39,6 +43,179 @@ class AdminAPIMessageTracingSchema(OpenAPISchema):
     )
 
 
+class TraceExporter:
+    """
+    Ship trace events to an http endpoint in batches.
+
+    Events are buffered and posted as a JSON array from a background task,
+    so tracing never waits on the trace collector. When the buffer is full
+    new events are dropped and counted.
+    """
+
+    MAX_BUFFER = 10000
+    MAX_BATCH = 100
+    BATCH_INTERVAL = 0.5
+    CONNECTION_LIMIT = 4
+
+    def __init__(
+        self,
+        url: str,
+        max_buffer: int = None,
+        max_batch: int = None,
+        batch_interval: float = None,
+    ):
+        """
+        Initialize a `TraceExporter` instance.
+
+        Args:
+            url: the endpoint to post trace events to
+            max_buffer: the maximum number of events waiting to be sent
+            max_batch: the maximum number of events posted at once
+            batch_interval: seconds to wait for a batch to fill up
+
+        """
+        self.url = url
+        self.max_buffer = max_buffer or self.MAX_BUFFER
+        self.max_batch = max_batch or self.MAX_BATCH
+        self.batch_interval = (
+            self.BATCH_INTERVAL if batch_interval is None else batch_interval
+        )
+        self.buffer = deque()
+        self.dropped = 0
+        self.failed = 0
+        self.sent = 0
+        self._flushing = False
+        self._loop: asyncio.AbstractEventLoop = None
+        self._session: ClientSession = None
+        self._task: asyncio.Task = None
+        self._wake: asyncio.Event = None
+
+    def enqueue(self, event: dict) -> bool:
+        """
+        Add an event to the buffer, starting the export task if needed.
+
+        Returns:
+            False if the event was dropped because the buffer is full
+
+        """
+        if len(self.buffer) >= self.max_buffer:
+            self.dropped += 1
+            return False
+        self.buffer.append(event)
+        loop = asyncio.get_event_loop()
+        if loop is not self._loop:
+            # the client and task cannot be shared across event loops
+            self._loop = loop
+            self._session = None
+            self._task = None
+        if not self._task or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = loop.create_task(self._export())
+        elif len(self.buffer) >= self.max_batch:
+            self._wake.set()
+        return True
+
+    async def _export(self):
+        """Post batches of events until the buffer is empty."""
+        while self.buffer:
+            if (
+                len(self.buffer) < self.max_batch
+                and self.batch_interval
+                and not self._flushing
+            ):
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.batch_interval)
+                except asyncio.TimeoutError:
+                    pass
+            self._wake.clear()
+            batch = [
+                self.buffer.popleft()
+                for _ in range(min(len(self.buffer), self.max_batch))
+            ]
+            await self._post(batch)
+
+    async def _post(self, batch: list):
+        """Post a batch of events, counting it as failed on error."""
+        if not self._session:
+            self._session = ClientSession(
+                connector=TCPConnector(limit=self.CONNECTION_LIMIT),
+                timeout=ClientTimeout(total=10),
+            )
+        try:
+            async with self._session.post(
+                self.url,
+                data=json.dumps(batch),
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                response.raise_for_status()
+            self.sent += len(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            LOGGER.error(
+                "Error posting %d trace events to %s: %s", len(batch), self.url, e
+            )
+
+    def post_now(self, event: dict):
+        """
+        Post an event right away, blocking until it is accepted.
+
+        Used to check that the endpoint can be reached, errors are raised.
+        """
+        response = requests.post(
+            self.url,
+            data=json.dumps([event]),
+            headers={"Content-Type": "application/json"},
+            timeout=10,
+        )
+        response.raise_for_status()
+        self.sent += 1
+
+    async def flush(self):
+        """Send all buffered events."""
+        if self._task and not self._task.done():
+            self._flushing = True
+            self._wake.set()
+            try:
+                await self._task
+            finally:
+                self._flushing = False
+
+    async def close(self):
+        """Send all buffered events and close the http client."""
+        await self.flush()
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the exporter statistics."""
+        return {
+            "buffered": len(self.buffer),
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "sent": self.sent,
+        }
+
+
+TRACE_EXPORTERS = {}
+
+
+def get_trace_exporter(url: str) -> TraceExporter:
+    """Get the shared exporter for a trace endpoint."""
+    exporter = TRACE_EXPORTERS.get(url)
+    if not exporter:
+        exporter = TRACE_EXPORTERS[url] = TraceExporter(url)
+    return exporter
+
+
+async def close_trace_exporters():
+    """Flush and close all trace exporters."""
+    while TRACE_EXPORTERS:
+        _url, exporter = TRACE_EXPORTERS.popitem()
+        await exporter.close()
+
+
 def get_timer() -> float:
     """Return a timer."""
     return time.perf_counter()
@@ -224,13 +401,16 @@ def trace_event(
                 LOGGER.setLevel(logging.INFO)
                 LOGGER.info(" %s %s", context["trace.tag"], event_str)
             else:
-                # should be an http endpoint
-                _ = requests.post(
+                # should be an http endpoint, events are posted in batches
+                # unless the caller needs to know the event was delivered
+                exporter = get_trace_exporter(
                     context["trace.target"]
-                    + (context["trace.tag"] if context["trace.tag"] else ""),
-                    data=event_str,
-                    headers={"Content-Type": "application/json"},
+                    + (context["trace.tag"] if context["trace.tag"] else "")
                 )
+                if raise_errors:
+                    exporter.post_now(event)
+                else:
+                    exporter.enqueue(event)
         except Exception as e:
             if raise_errors:
                 raise
@@ -7,7 +7,7 @@ from aries_cloudagent.aathcf.credentials import (
     assert_type,
     validate_schema,
 )
-from ..aathcf.credentials import verify_proof
+from ..aathcf.credentials import verify_proofs
 import logging
 from collections import OrderedDict
 
@@ -62,15 +62,15 @@ class PDSVerifier(BaseVerifier):
             presentation, OrderedDict
         ), "to preserve order presentation should be OrderedDict"
 
-        proofVerified = await verify_proof(self.wallet, presentation)
+        subcreds = presentation.get("verifiableCredential")
+        proofVerified, *subproofs_verified = await verify_proofs(
+            self.wallet, [presentation] + [subcreds[subcred] for subcred in subcreds]
+        )
         if proofVerified is False:
             self.logger.warning("verify_proof presentation proof: %s", proofVerified)
             return False
 
-        for subcred in presentation.get("verifiableCredential"):
-            subproof_verified = await verify_proof(
-                self.wallet, presentation.get("verifiableCredential")[subcred]
-            )
+        for subproof_verified in subproofs_verified:
             if subproof_verified is False:
                 self.logger.warning("verify_proof subproof: %s", subproof_verified)
                 return False
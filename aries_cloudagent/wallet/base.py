@@ -1,13 +1,17 @@
 """Wallet base class."""
 
+import asyncio
+
 from abc import ABC, abstractmethod
 from collections import namedtuple
-from typing import Sequence
+from functools import partial
+from typing import Callable, Sequence, Tuple
 
 from ..ledger.base import BaseLedger
 from ..ledger.endpoint_type import EndpointType
 
 from .did_posture import DIDPosture
+from .executor import CryptoExecutor
 
 KeyInfo = namedtuple("KeyInfo", "verkey metadata")
 DIDInfo = namedtuple("DIDInfo", "did verkey metadata")
@@ -25,6 +29,7 @@ class BaseWallet(ABC):
             config: {name, key, seed, did, auto-create, auto-remove}
 
         """
+        self.crypto_executor: CryptoExecutor = None
 
     @property
     @abstractmethod
@@ -343,6 +348,24 @@ class BaseWallet(ABC):
 
         """
 
+    async def verify_messages(
+        self, messages: Sequence[Tuple[bytes, bytes, str]]
+    ) -> Sequence[bool]:
+        """
+        Verify many signatures at once.
+
+        Args:
+            messages: (message, signature, verkey) tuples to verify
+
+        Returns:
+            True or False for each message, in the same order
+
+        """
+        return [
+            await self.verify_message(message, signature, from_verkey)
+            for message, signature, from_verkey in messages
+        ]
+
     @abstractmethod
     async def pack_message(
         self, message: str, to_verkeys: Sequence[str], from_verkey: str = None
@@ -373,6 +396,12 @@ class BaseWallet(ABC):
 
         """
 
+    async def run_crypto(self, fn: Callable, *args):
+        """Run CPU-bound crypto work in the configured executor."""
+        if self.crypto_executor:
+            return await self.crypto_executor.run(fn, *args)
+        return await asyncio.get_event_loop().run_in_executor(None, partial(fn, *args))
+
     def __repr__(self) -> str:
         """Get a human readable string."""
         return "<{}(opened={})>".format(self.__class__.__name__, self.opened)
@@ -2,7 +2,8 @@
 
 import json
 
-from collections import OrderedDict
+from collections import namedtuple, OrderedDict
+from functools import lru_cache
 from typing import Callable, Optional, Sequence, Tuple
 
 import nacl.bindings
@@ -14,6 +15,11 @@ from marshmallow import fields, Schema, ValidationError
 from .error import WalletError
 from .util import bytes_to_b58, bytes_to_b64, b64_to_bytes, b58_to_bytes
 
+# Number of converted public keys kept in memory
+KEY_CACHE_SIZE = 4096
+
+PackSender = namedtuple("PackSender", "verkey_b58 curve_sk")
+
 
 class PackMessageSchema(Schema):
     """Packed message schema."""
@@ -160,6 +166,39 @@ def verify_signed_message(signed: bytes, verkey: bytes) -> bool:
     return True
 
 
+def verify_signed_messages(signed: Sequence[Tuple[bytes, bytes]]) -> Sequence[bool]:
+    """
+    Verify many signed messages.
+
+    Args:
+        signed: (signed message, verkey) tuples
+
+    Returns:
+        True or False for each message, in the same order
+
+    """
+    return [verify_signed_message(message, verkey) for message, verkey in signed]
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def ed25519_pk_to_curve25519(verkey: bytes) -> bytes:
+    """
+    Convert an Ed25519 verkey to a Curve25519 public key.
+
+    The conversion is memoized, agents mostly pack for and unpack from
+    the same peers over and over.
+    """
+    return nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(verkey)
+
+
+def pack_sender(from_secret: bytes) -> PackSender:
+    """Derive the sender details needed to authcrypt for any recipient."""
+    return PackSender(
+        bytes_to_b58(sign_pk_from_sk(from_secret)).encode("ascii"),
+        nacl.bindings.crypto_sign_ed25519_sk_to_curve25519(from_secret),
+    )
+
+
 def prepare_pack_recipient_keys(
     to_verkeys: Sequence[bytes], from_secret: bytes = None
 ) -> Tuple[str, bytes]:
@@ -176,17 +215,14 @@ def prepare_pack_recipient_keys(
     """
     cek = nacl.bindings.crypto_secretstream_xchacha20poly1305_keygen()
     recips = []
+    sender = pack_sender(from_secret) if from_secret else None
 
     for target_vk in to_verkeys:
-        target_pk = nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(target_vk)
-        if from_secret:
-            sender_pk = sign_pk_from_sk(from_secret)
-            sender_vk = bytes_to_b58(sender_pk).encode("ascii")
-            enc_sender = nacl.bindings.crypto_box_seal(sender_vk, target_pk)
-            sk = nacl.bindings.crypto_sign_ed25519_sk_to_curve25519(from_secret)
-
+        target_pk = ed25519_pk_to_curve25519(target_vk)
+        if sender:
+            enc_sender = nacl.bindings.crypto_box_seal(sender.verkey_b58, target_pk)
             nonce = nacl.utils.random(nacl.bindings.crypto_box_NONCEBYTES)
-            enc_cek = nacl.bindings.crypto_box(cek, nonce, target_pk, sk)
+            enc_cek = nacl.bindings.crypto_box(cek, nonce, target_pk, sender.curve_sk)
         else:
             enc_sender = None
             nonce = None
@@ -505,8 +541,7 @@ def extract_payload_key(sender_cek: dict, recip_secret: bytes) -> Tuple[bytes, s
 
     Returns: A tuple of the CEK and sender verkey
     """
-    recip_vk = sign_pk_from_sk(recip_secret)
-    recip_pk = nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(recip_vk)
+    recip_pk = ed25519_pk_to_curve25519(sign_pk_from_sk(recip_secret))
     recip_sk = nacl.bindings.crypto_sign_ed25519_sk_to_curve25519(recip_secret)
 
     if sender_cek["nonce"] and sender_cek["sender"]:
@@ -514,9 +549,7 @@ def extract_payload_key(sender_cek: dict, recip_secret: bytes) -> Tuple[bytes, s
             sender_cek["sender"], recip_pk, recip_sk
         )
         sender_vk = sender_vk_bin.decode("ascii")
-        sender_pk = nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(
-            b58_to_bytes(sender_vk_bin)
-        )
+        sender_pk = ed25519_pk_to_curve25519(b58_to_bytes(sender_vk_bin))
         cek = nacl.bindings.crypto_box_open(
             sender_cek["key"], sender_cek["nonce"], sender_pk, recip_sk
         )
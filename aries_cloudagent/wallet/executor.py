@@ -0,0 +1,88 @@
+"""Executor for the CPU-bound crypto work of wallets."""
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable
+
+
+class CryptoExecutor:
+    """
+    Dedicated thread or process pool for packing and unpacking messages.
+
+    Keeps crypto work off the loop's default executor, which also serves
+    DNS lookups and file I/O. A process pool sidesteps the GIL held by the
+    JSON and base64 work, at the cost of pickling arguments and results.
+    """
+
+    KINDS = ("thread", "process")
+
+    def __init__(self, kind: str = None, max_workers: int = None):
+        """
+        Initialize a `CryptoExecutor` instance.
+
+        Args:
+            kind: the type of pool, "thread" or "process"
+            max_workers: the number of workers in the pool
+
+        """
+        kind = (kind or "thread").lower()
+        if kind not in self.KINDS:
+            raise ValueError(f"Unsupported crypto executor type: {kind}")
+        self.kind = kind
+        cpu_count = os.cpu_count() or 1
+        self.max_workers = max_workers or (
+            cpu_count if kind == "process" else min(32, cpu_count + 4)
+        )
+        self.pending = 0
+        self.max_pending = 0
+        self.submitted = 0
+        self._executor: Executor = None
+
+    @property
+    def shares_memory(self) -> bool:
+        """Check whether workers can use objects from the calling process."""
+        return self.kind == "thread"
+
+    @property
+    def executor(self) -> Executor:
+        """Accessor for the pool, created on first use."""
+        if not self._executor:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="crypto"
+                )
+        return self._executor
+
+    async def run(self, fn: Callable, *args):
+        """Run a function in the pool."""
+        self.pending += 1
+        self.submitted += 1
+        if self.pending > self.max_pending:
+            self.max_pending = self.pending
+        try:
+            return await asyncio.get_event_loop().run_in_executor(
+                self.executor, partial(fn, *args)
+            )
+        finally:
+            self.pending -= 1
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the pool."""
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the executor statistics."""
+        return {
+            "kind": self.kind,
+            "workers": self.max_workers,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "submitted": self.submitted,
+        }
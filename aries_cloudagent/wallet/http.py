@@ -1,7 +1,6 @@
 """In-memory implementation of BaseWallet interface."""
 
-import asyncio
-from typing import Sequence
+from typing import Callable, Sequence, Tuple
 
 from .base import BaseWallet, KeyInfo, DIDInfo
 from .crypto import (
@@ -10,8 +9,10 @@ from .crypto import (
     validate_seed,
     sign_message,
     verify_signed_message,
+    verify_signed_messages,
     encode_pack_message,
     decode_pack_message,
+    decode_pack_message_outer,
 )
 from .error import WalletError, WalletDuplicateError, WalletNotFoundError
 from .util import b58_to_bytes, bytes_to_b58
@@ -36,6 +37,7 @@ class HttpWallet(BaseWallet):
         self._name = config.get("name")
         self._keys = {}
         self._local_dids = {}
+        self._did_by_verkey = {}
         self._pair_dids = {}
 
     @property
@@ -179,6 +181,7 @@ class HttpWallet(BaseWallet):
             raise WalletError("Key rotation not in progress for DID: {}".format(did))
         verkey_enc = temp_keys[0]
 
+        self._unindex_did(did)
         self._local_dids[did].update(
             {
                 "seed": self._keys[verkey_enc]["seed"],
@@ -186,6 +189,7 @@ class HttpWallet(BaseWallet):
                 "verkey": verkey_enc,
             }
         )
+        self._did_by_verkey.setdefault(verkey_enc, did)
         self._keys.pop(verkey_enc)
         return DIDInfo(did, verkey_enc, self._local_dids[did]["metadata"].copy())
 
@@ -220,8 +224,20 @@ class HttpWallet(BaseWallet):
             "verkey": verkey_enc,
             "metadata": metadata.copy() if metadata else {},
         }
+        self._did_by_verkey.setdefault(verkey_enc, did)
         return DIDInfo(did, verkey_enc, self._local_dids[did]["metadata"].copy())
 
+    def _unindex_did(self, did: str):
+        """Remove the current verkey of a DID from the verkey index."""
+        verkey = self._local_dids[did]["verkey"]
+        if self._did_by_verkey.get(verkey) == did:
+            del self._did_by_verkey[verkey]
+            # another DID may have been created with the same key
+            for other, info in self._local_dids.items():
+                if other != did and info["verkey"] == verkey:
+                    self._did_by_verkey[verkey] = other
+                    break
+
     def _get_did_info(self, did: str) -> DIDInfo:
         """
         Convert internal DID record to DIDInfo.
@@ -279,10 +295,10 @@ class HttpWallet(BaseWallet):
             WalletNotFoundError: If the verkey is not found
 
         """
-        for did, info in self._local_dids.items():
-            if info["verkey"] == verkey:
-                return self._get_did_info(did)
-        raise WalletNotFoundError("Verkey not found: {}".format(verkey))
+        did = self._did_by_verkey.get(verkey)
+        if not did:
+            raise WalletNotFoundError("Verkey not found: {}".format(verkey))
+        return self._get_did_info(did)
 
     async def replace_local_did_metadata(self, did: str, metadata: dict):
         """
@@ -314,12 +330,11 @@ class HttpWallet(BaseWallet):
             WalletError: If the private key is not found
 
         """
-
-        keys_and_dids = list(self._local_dids.values()) + list(self._keys.values())
-        for info in keys_and_dids:
-            if info["verkey"] == verkey:
-                return info["secret"]
-
+        did = self._did_by_verkey.get(verkey)
+        if did:
+            return self._local_dids[did]["secret"]
+        if verkey in self._keys:
+            return self._keys[verkey]["secret"]
         raise WalletError("Private key not found for verkey: {}".format(verkey))
 
     async def sign_message(self, message: bytes, from_verkey: str) -> bytes:
@@ -376,6 +391,35 @@ class HttpWallet(BaseWallet):
         verified = verify_signed_message(signature + message, verkey_bytes)
         return verified
 
+    async def verify_messages(
+        self, messages: Sequence[Tuple[bytes, bytes, str]]
+    ) -> Sequence[bool]:
+        """
+        Verify many signatures in a single worker call.
+
+        Args:
+            messages: (message, signature, verkey) tuples to verify
+
+        Returns:
+            True or False for each message, in the same order
+
+        Raises:
+            WalletError: If a verkey, signature or message is not provided
+
+        """
+        signed = []
+        for message, signature, from_verkey in messages:
+            if not from_verkey:
+                raise WalletError("Verkey not provided")
+            if not signature:
+                raise WalletError("Signature not provided")
+            if not message:
+                raise WalletError("Message not provided")
+            signed.append((signature + message, b58_to_bytes(from_verkey)))
+        if len(signed) < 2:
+            return verify_signed_messages(signed)
+        return await self.run_crypto(verify_signed_messages, signed)
+
     async def pack_message(
         self, message: str, to_verkeys: Sequence[str], from_verkey: str = None
     ) -> bytes:
@@ -394,15 +438,19 @@ class HttpWallet(BaseWallet):
             WalletError: If the message is not provided
 
         """
+        return await self.run_crypto(
+            encode_pack_message, *self._pack_args(message, to_verkeys, from_verkey)
+        )
+
+    def _pack_args(
+        self, message: str, to_verkeys: Sequence[str], from_verkey: str = None
+    ) -> tuple:
+        """Resolve the arguments for `encode_pack_message`."""
         if message is None:
             raise WalletError("Message not provided")
-
         keys_bin = [b58_to_bytes(key) for key in to_verkeys]
         secret = self._get_private_key(from_verkey) if from_verkey else None
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, lambda: encode_pack_message(message, keys_bin, secret)
-        )
-        return result
+        return message, keys_bin, secret
 
     async def unpack_message(self, enc_message: bytes) -> (str, str, str):
         """
@@ -419,16 +467,34 @@ class HttpWallet(BaseWallet):
             WalletError: If there is a problem unpacking the message
 
         """
-        if not enc_message:
-            raise WalletError("Message not provided")
         try:
-            (
-                message,
-                from_verkey,
-                to_verkey,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: decode_pack_message(enc_message, self._get_private_key)
+            (message, from_verkey, to_verkey) = await self.run_crypto(
+                decode_pack_message, *self._unpack_args(enc_message)
             )
         except ValueError as e:
             raise WalletError("Message could not be unpacked: {}".format(str(e)))
         return message, from_verkey, to_verkey
+
+    def _unpack_args(self, enc_message: bytes) -> Tuple[bytes, Callable]:
+        """
+        Resolve the arguments for `decode_pack_message`.
+
+        Worker processes cannot call back into the wallet, so they are given
+        a lookup of the private keys for the recipients of the message only.
+        Either lookup returns None for keys not in the wallet, so a message
+        for other recipients fails the same way on every executor.
+        """
+        if not enc_message:
+            raise WalletError("Message not provided")
+        if not self.crypto_executor or self.crypto_executor.shares_memory:
+            return enc_message, self._find_private_key
+        _wrapper, recips, _is_authcrypt = decode_pack_message_outer(enc_message)
+        secrets = {verkey: self._find_private_key(verkey) for verkey in recips}
+        return enc_message, secrets.get
+
+    def _find_private_key(self, verkey: str) -> bytes:
+        """Resolve the private key for a verkey, None if it is not in the wallet."""
+        try:
+            return self._get_private_key(verkey)
+        except WalletError:
+            return None
@@ -5,6 +5,8 @@ import logging
 from ..config.base import BaseProvider, BaseInjector, BaseSettings
 from ..utils.classloader import ClassLoader
 
+from .executor import CryptoExecutor
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -53,6 +55,10 @@ class WalletProvider(BaseProvider):
         if "wallet.storage_creds" in settings:
             wallet_cfg["storage_creds"] = settings["wallet.storage_creds"]
         wallet = ClassLoader.load_class(wallet_class)(wallet_cfg)
+        wallet.crypto_executor = CryptoExecutor(
+            settings.get_value("wallet.crypto_executor"),
+            settings.get_value("wallet.crypto_workers"),
+        )
         await wallet.open()
 
         if "wallet.rekey" in settings:
@@ -2,6 +2,7 @@ import pytest
 import time
 
 from aries_cloudagent.wallet.basic import BasicWallet
+from aries_cloudagent.wallet.executor import CryptoExecutor
 from aries_cloudagent.wallet.error import (
     WalletError,
     WalletDuplicateError,
@@ -123,6 +124,25 @@ class TestBasicWallet:
         assert new_info.did == self.test_did
         assert new_info.verkey != info.verkey
 
+        assert (await wallet.get_local_did_for_verkey(new_verkey)).did == self.test_did
+        with pytest.raises(WalletNotFoundError):
+            await wallet.get_local_did_for_verkey(info.verkey)
+        signature = await wallet.sign_message(b"message", new_verkey)
+        assert await wallet.verify_message(b"message", signature, new_verkey)
+        with pytest.raises(WalletError):
+            await wallet.sign_message(b"message", info.verkey)
+
+    @pytest.mark.asyncio
+    async def test_rotate_did_keypair_shared_verkey(self, wallet):
+        info = await wallet.create_local_did(self.test_seed, self.test_did)
+        other = await wallet.create_local_did(self.test_seed, self.test_target_did)
+        assert other.verkey == info.verkey
+
+        await wallet.rotate_did_keypair_start(self.test_did)
+        await wallet.rotate_did_keypair_apply(self.test_did)
+        found = await wallet.get_local_did_for_verkey(info.verkey)
+        assert found.did == self.test_target_did
+
     @pytest.mark.asyncio
     async def test_create_local_with_did(self, wallet):
         info = await wallet.create_local_did(None, self.test_did)
@@ -271,6 +291,31 @@ class TestBasicWallet:
             await wallet.verify_message(None, message_bin, info.verkey)
         assert "Message not provided" in str(excinfo.value)
 
+    @pytest.mark.asyncio
+    async def test_verify_messages(self, wallet):
+        info = await wallet.create_signing_key(self.test_seed)
+        message_bin = self.test_message.encode("ascii")
+        signature = await wallet.sign_message(message_bin, info.verkey)
+        bad_sig = b"x" + signature[1:]
+
+        assert await wallet.verify_messages([]) == []
+        assert await wallet.verify_messages([(message_bin, signature, info.verkey)]) == [
+            True
+        ]
+        assert await wallet.verify_messages(
+            [
+                (message_bin, signature, info.verkey),
+                (message_bin, bad_sig, info.verkey),
+                (message_bin, signature, self.test_target_verkey),
+            ]
+        ) == [True, False, False]
+
+        with pytest.raises(WalletError) as excinfo:
+            await wallet.verify_messages(
+                [(message_bin, signature, info.verkey), (message_bin, None, info.verkey)]
+            )
+        assert "Signature not provided" in str(excinfo.value)
+
     @pytest.mark.asyncio
     async def test_pack_unpack(self, wallet):
         await wallet.create_local_did(self.test_seed, self.test_did)
@@ -301,6 +346,45 @@ class TestBasicWallet:
         with pytest.raises(WalletError):
             await wallet.unpack_message(None)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("kind", ["thread", "process"])
+    async def test_pack_unpack_executor(self, wallet, kind):
+        wallet.crypto_executor = CryptoExecutor(kind, 2)
+        try:
+            await wallet.create_local_did(self.test_seed, self.test_did)
+            await wallet.create_local_did(self.test_target_seed, self.test_target_did)
+
+            packed = await wallet.pack_message(
+                self.test_message, [self.test_target_verkey], self.test_verkey
+            )
+            assert await wallet.unpack_message(packed) == (
+                self.test_message,
+                self.test_verkey,
+                self.test_target_verkey,
+            )
+
+            # the first recipient is not in the wallet, the second one is
+            packed = await wallet.pack_message(
+                self.test_message, [self.missing_verkey, self.test_target_verkey]
+            )
+            assert await wallet.unpack_message(packed) == (
+                self.test_message,
+                None,
+                self.test_target_verkey,
+            )
+            assert wallet.crypto_executor.stats["pending"] == 0
+
+            packed = await wallet.pack_message(
+                self.test_message, [self.missing_verkey]
+            )
+            with pytest.raises(WalletError) as excinfo:
+                await wallet.unpack_message(packed)
+            assert "No corresponding recipient key found" in str(excinfo.value)
+            with pytest.raises(WalletError):
+                await wallet.unpack_message(b"bad")
+        finally:
+            wallet.crypto_executor.shutdown()
+
     @pytest.mark.asyncio
     async def test_signature_round_trip(self, wallet):
         key_info = await wallet.create_signing_key()
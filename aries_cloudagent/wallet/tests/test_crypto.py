@@ -35,6 +35,30 @@ class TestUtil(TestCase):
 
         assert test_module.sign_pk_from_sk(secret_key) in secret_key
 
+    def test_pack_key_conversion_cached(self):
+        test_module.ed25519_pk_to_curve25519.cache_clear()
+        sender_pk, sender_sk = test_module.create_keypair()
+        recips = [test_module.create_keypair() for _ in range(3)]
+
+        packed = [
+            test_module.encode_pack_message(
+                "message", [pk for pk, _ in recips], sender_sk
+            )
+            for _ in range(2)
+        ]
+        info = test_module.ed25519_pk_to_curve25519.cache_info()
+        assert (info.misses, info.hits) == (3, 3)
+
+        for message in packed:
+            for pk, sk in recips:
+                assert test_module.decode_pack_message(
+                    message, {test_module.bytes_to_b58(pk): sk}.get
+                ) == ("message", test_module.bytes_to_b58(sender_pk), mock.ANY)
+
+        sender = test_module.pack_sender(sender_sk)
+        assert sender.verkey_b58 == test_module.bytes_to_b58(sender_pk).encode()
+        assert len(sender.curve_sk) == 32
+
     def test_decode_pack_message_x(self):
         with mock.patch.object(
             test_module, "decode_pack_message_outer", mock.MagicMock()
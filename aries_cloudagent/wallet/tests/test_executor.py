@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from ..executor import CryptoExecutor
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+class TestCryptoExecutor:
+    def test_init(self):
+        executor = CryptoExecutor()
+        assert executor.kind == "thread"
+        assert executor.shares_memory
+        assert executor.max_workers >= 1
+        executor = CryptoExecutor("PROCESS", 3)
+        assert executor.kind == "process"
+        assert not executor.shares_memory
+        assert executor.max_workers == 3
+        with pytest.raises(ValueError):
+            CryptoExecutor("fiber")
+
+    @pytest.mark.asyncio
+    async def test_run(self):
+        executor = CryptoExecutor("thread", 2)
+        results = await asyncio.gather(*(executor.run(square, i) for i in range(4)))
+        assert results == [0, 1, 4, 9]
+        assert executor.stats["submitted"] == 4
+        assert executor.stats["max_pending"] == 4
+        assert executor.stats["pending"] == 0
+        executor.shutdown()
+        assert await executor.run(square, 3) == 9
+        executor.shutdown()
+
@@ -23,6 +23,22 @@ class TestProvider(AsyncTestCase):
 
         assert wallet.opened
         assert wallet.name == "name"
+        assert wallet.crypto_executor.kind == "thread"
+        await wallet.close()
+
+    async def test_provide_crypto_executor(self):
+        provider = test_module.WalletProvider()
+        settings = Settings(
+            values={
+                "wallet.type": "basic",
+                "wallet.crypto_executor": "process",
+                "wallet.crypto_workers": 2,
+            }
+        )
+        wallet = await provider.provide(settings, None)
+
+        assert wallet.crypto_executor.kind == "process"
+        assert wallet.crypto_executor.max_workers == 2
         await wallet.close()
 
     @pytest.mark.indy
@@ -0,0 +1,63 @@
+"""
+Microbenchmark for packing and unpacking messages.
+
+Reports the per-message cost of authcrypt packing and unpacking for 1, 10
+and 100 recipients, with a cold key conversion cache (every recipient key
+converted again, as before memoization) and a warm one.
+
+Usage: python scripts/bench_pack_message.py [iterations]
+"""
+
+import sys
+import timeit
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from aries_cloudagent.wallet import crypto  # noqa: E402
+
+MESSAGE = '{"@type": "https://didcomm.org/trust_ping/1.0/ping", "@id": "1"}'
+
+
+def bench(recipient_count: int, iterations: int):
+    sender_pk, sender_sk = crypto.create_keypair()
+    recips = [crypto.create_keypair() for _ in range(recipient_count)]
+    to_verkeys = [pk for pk, _ in recips]
+    last_pk, last_sk = recips[-1]
+    find_key = {crypto.bytes_to_b58(last_pk): last_sk}.get
+    packed = crypto.encode_pack_message(MESSAGE, to_verkeys, sender_sk)
+    clear = crypto.ed25519_pk_to_curve25519.cache_clear
+
+    def pack_cold():
+        clear()
+        crypto.encode_pack_message(MESSAGE, to_verkeys, sender_sk)
+
+    def pack_warm():
+        crypto.encode_pack_message(MESSAGE, to_verkeys, sender_sk)
+
+    def unpack_cold():
+        clear()
+        crypto.decode_pack_message(packed, find_key)
+
+    def unpack_warm():
+        crypto.decode_pack_message(packed, find_key)
+
+    for name, fn in (
+        ("pack cold", pack_cold),
+        ("pack warm", pack_warm),
+        ("unpack cold", unpack_cold),
+        ("unpack warm", unpack_warm),
+    ):
+        fn()
+        best = min(timeit.repeat(fn, number=iterations, repeat=3)) / iterations
+        print(
+            "{:>4} recipients  {:<12} {:>9.1f} us/message".format(
+                recipient_count, name, best * 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for count in (1, 10, 100):
+        bench(count, max(iterations // count, 10))
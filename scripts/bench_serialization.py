@@ -0,0 +1,91 @@
+"""
+Microbenchmark for serializing and deserializing models.
+
+Reports operations per second for a connection record, a credential
+exchange record and a trust ping message, building a schema for every
+call through marshmallow (as before schema reuse) and with the reused
+schemas and the flat fast path.
+
+Usage: python scripts/bench_serialization.py [iterations]
+"""
+
+import sys
+import timeit
+from os.path import abspath, dirname
+
+from marshmallow import EXCLUDE, Schema
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from aries_cloudagent.connections.models.connection_record import (  # noqa: E402
+    ConnectionRecord,
+)
+from aries_cloudagent.protocols.issue_credential.v1_0.models.credential_exchange import (  # noqa: E402,E501
+    V10CredentialExchange,
+)
+from aries_cloudagent.protocols.trustping.v1_0.messages.ping import Ping  # noqa: E402
+
+MODELS = (
+    ConnectionRecord(
+        connection_id="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+        my_did="55GkHamhTU1ZbTbV2ab9DE",
+        their_did="WgWxqztrNooG92RXvxSTWv",
+        their_label="Bob",
+        their_role="Inviter",
+        initiator="self",
+        invitation_key="H3C2AVvLMv6gmMNam3uVAjZpfkcJCwDwnZn6z3wXmqPV",
+        state="active",
+        routing_state="none",
+        accept="auto",
+        invitation_mode="once",
+    ),
+    V10CredentialExchange(
+        credential_exchange_id="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+        connection_id="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+        thread_id="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+        initiator="self",
+        role="issuer",
+        state="offer_sent",
+        credential_definition_id="WgWxqztrNooG92RXvxSTWv:3:CL:20:tag",
+        schema_id="WgWxqztrNooG92RXvxSTWv:2:schema_name:1.0",
+        credential_offer={"nonce": "1234567890", "key_correctness_proof": {}},
+        auto_offer=False,
+        auto_issue=True,
+    ),
+    Ping(comment="ping", response_requested=True),
+)
+
+
+def bench(model, iterations: int):
+    model_cls = type(model)
+    serialized = model.serialize()
+
+    def dump_before():
+        Schema.dump(model_cls._get_schema_class()(unknown=EXCLUDE), model)
+
+    def dump_after():
+        model.serialize()
+
+    def load_before():
+        Schema.load(model_cls._get_schema_class()(unknown=EXCLUDE), dict(serialized))
+
+    def load_after():
+        model_cls.deserialize(dict(serialized))
+
+    for name, fn in (
+        ("dump before", dump_before),
+        ("dump after", dump_after),
+        ("load before", load_before),
+        ("load after", load_after),
+    ):
+        fn()
+        best = min(timeit.repeat(fn, number=iterations, repeat=3)) / iterations
+        print(
+            "{:<22} {:<12} {:>10.0f} ops/sec".format(model_cls.__name__, name, 1 / best)
+        )
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for model in MODELS:
+        bench(model, iterations)